@@ -0,0 +1,187 @@
+"""
+ATS platform adapters for the Job Application Auto-Fill Bot.
+Recognizes common applicant tracking systems from the URL or a few DOM markers and
+maps profile fields straight to their stable form controls, so known platforms can
+be filled without probing generic selector lists.
+"""
+
+import re
+import logging
+
+from fill_planner import field_kind
+
+logger = logging.getLogger(__name__)
+
+# Returns which of the given marker selectors exist on the page, in one round trip
+FINGERPRINT_SCRIPT = """
+var markers = arguments[0];
+var found = [];
+for (var i = 0; i < markers.length; i++) {
+    try {
+        if (document.querySelector(markers[i])) {
+            found.push(markers[i]);
+        }
+    } catch (e) {
+        // Ignore selectors the browser cannot parse
+    }
+}
+return found;
+"""
+
+
+class ATSAdapter:
+    """Fingerprint and field map of one applicant tracking system."""
+
+    def __init__(self, name, url_patterns, dom_markers, field_map):
+        """
+        Args:
+            name (str): Platform name, reported in the run report
+            url_patterns (list): Regular expressions matched against the page URL
+            dom_markers (list): CSS selectors only present on this platform's forms,
+                for career pages hosted on the employer's own domain
+            field_map (dict): Profile field name -> CSS selector of its control
+        """
+        self.name = name
+        self.url_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in url_patterns]
+        self.dom_markers = dom_markers
+        self.field_map = field_map
+
+    def matches_url(self, url):
+        return any(pattern.search(url) for pattern in self.url_patterns)
+
+    def field_values(self, profile):
+        """
+        Collect the profile values this platform's form asks for.
+
+        Returns:
+            dict: Field name -> value, including full_name for single-name forms
+        """
+        values = {}
+        for section in ("education", "work_experience", "personal_info"):
+            values.update(profile.get(section) or {})
+
+        personal = profile.get("personal_info") or {}
+        full_name = f"{personal.get('first_name', '')} {personal.get('last_name', '')}".strip()
+        if full_name:
+            values["full_name"] = full_name
+        return values
+
+    def plan(self, profile, plan):
+        """
+        Plan every mapped field the profile has a value for.
+
+        Args:
+            profile (dict): Profile from resolve_profile()
+            plan (FillPlan): Plan to add the fields to
+
+        Returns:
+            int: Number of fields planned
+        """
+        values = self.field_values(profile)
+        planned = 0
+        for field_name, selector in self.field_map.items():
+            value = values.get(field_name)
+            if value and plan.add_selector(selector, value, field_name, field_kind(field_name)):
+                planned += 1
+        return planned
+
+
+ADAPTERS = [
+    ATSAdapter(
+        "greenhouse",
+        [r"//(boards|job-boards)(\.eu)?\.greenhouse\.io/", r"[?&]gh_jid="],
+        ["form#application_form", "#grnhse_app", "form[action*='greenhouse.io']"],
+        {
+            "first_name": "input#first_name",
+            "last_name": "input#last_name",
+            "email": "input#email",
+            "phone": "input#phone"
+        }
+    ),
+    ATSAdapter(
+        "lever",
+        [r"//jobs\.(eu\.)?lever\.co/"],
+        ["form[action*='lever.co']", "input[name='urls[LinkedIn]']"],
+        {
+            "full_name": "input[name='name']",
+            "email": "input[name='email']",
+            "phone": "input[name='phone']",
+            "company": "input[name='org']"
+        }
+    ),
+    ATSAdapter(
+        "workday",
+        [r"\.myworkdayjobs\.com/", r"\.myworkdaysite\.com/"],
+        ["[data-automation-id='legalNameSection_firstName']", "[data-automation-id='applyFlowPage']"],
+        {
+            "first_name": "input[data-automation-id='legalNameSection_firstName']",
+            "last_name": "input[data-automation-id='legalNameSection_lastName']",
+            "email": "input[data-automation-id='email']",
+            "phone": "input[data-automation-id='phone-number']",
+            "address": "input[data-automation-id='addressSection_addressLine1']",
+            "city": "input[data-automation-id='addressSection_city']",
+            "zip_code": "input[data-automation-id='addressSection_postalCode']"
+        }
+    ),
+    ATSAdapter(
+        "ashby",
+        [r"//jobs\.ashbyhq\.com/"],
+        ["input[name='_systemfield_name']", "input[name='_systemfield_email']"],
+        {
+            "full_name": "input[name='_systemfield_name']",
+            "email": "input[name='_systemfield_email']",
+            "phone": "input[name='_systemfield_phone']"
+        }
+    ),
+    ATSAdapter(
+        "smartrecruiters",
+        [r"//(jobs|careers)\.smartrecruiters\.com/"],
+        ["oc-oneclick-form", "input#first-name-input"],
+        {
+            "first_name": "input#first-name-input",
+            "last_name": "input#last-name-input",
+            "email": "input#email-input",
+            "phone": "input#phone-number-input"
+        }
+    )
+]
+
+
+def register_adapter(adapter):
+    """Add an adapter, taking precedence over the built-in ones."""
+    ADAPTERS.insert(0, adapter)
+
+
+def adapter_for_url(url):
+    """
+    Find the adapter whose URL patterns match.
+
+    Returns:
+        ATSAdapter or None: The matching adapter
+    """
+    for adapter in ADAPTERS:
+        if adapter.matches_url(url):
+            return adapter
+    return None
+
+
+def marker_selectors():
+    """Return the DOM markers of every adapter, for FINGERPRINT_SCRIPT."""
+    return [marker for adapter in ADAPTERS for marker in adapter.dom_markers]
+
+
+def adapter_for_markers(found):
+    """
+    Find the adapter whose DOM markers were found on the page.
+
+    Args:
+        found (list): Markers reported by FINGERPRINT_SCRIPT
+
+    Returns:
+        ATSAdapter or None: The matching adapter
+    """
+    found = set(found or [])
+    for adapter in ADAPTERS:
+        if found.intersection(adapter.dom_markers):
+            return adapter
+    return None
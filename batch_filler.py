@@ -0,0 +1,473 @@
+"""
+Batched value injection for the Job Application Auto-Fill Bot.
+Writes every planned field value in one script call instead of typing into each element.
+"""
+
+import re
+import time
+import logging
+
+from field_discovery import FrameNavigator
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_VERIFY_SETTINGS = {
+    "enabled": True,  # Read back filled values and refill any that reverted
+    "settle_ms": 200  # Give frameworks time to re-render before reading back
+}
+
+# Finds the control of a plan entry, shared by the fill and verify scripts
+LOOKUP_SCRIPT = """
+var registry = (window.__autofill || {registry: []}).registry;
+
+// querySelector that also searches open shadow roots
+function deepQuery(root, selector) {
+    var found = root.querySelector(selector);
+    if (found) {
+        return found;
+    }
+    var nodes = root.querySelectorAll('*');
+    for (var i = 0; i < nodes.length && !found; i++) {
+        if (nodes[i].shadowRoot) {
+            found = deepQuery(nodes[i].shadowRoot, selector);
+        }
+    }
+    return found;
+}
+
+function lookup(entry) {
+    if (entry.selector) {
+        try {
+            return deepQuery(document, entry.selector);
+        } catch (e) {
+            return null;
+        }
+    }
+    return registry[entry.handle];
+}
+"""
+
+# Assigns values through the native prototype setters followed by input/change/blur
+# events so that framework-controlled inputs (React, Angular, Vue) register the change.
+VALUE_SCRIPT = """
+function nativeSetter(el) {
+    var proto = HTMLInputElement.prototype;
+    if (el instanceof HTMLTextAreaElement) {
+        proto = HTMLTextAreaElement.prototype;
+    } else if (el instanceof HTMLSelectElement) {
+        proto = HTMLSelectElement.prototype;
+    }
+    var descriptor = Object.getOwnPropertyDescriptor(proto, 'value');
+    return descriptor && descriptor.set;
+}
+
+function fire(el, type) {
+    el.dispatchEvent(new Event(type, {bubbles: true}));
+}
+
+function setValue(el, value) {
+    el.focus();
+    var setter = nativeSetter(el);
+    if (setter) {
+        setter.call(el, value);
+    } else {
+        el.value = value;
+    }
+    fire(el, 'input');
+    fire(el, 'change');
+    el.blur();
+    fire(el, 'blur');
+}
+"""
+
+# Writes all planned values in one round trip. Entries address their control by
+# snapshot handle or, for fields known in advance, by CSS selector (searched in
+# open shadow roots too).
+BATCH_FILL_SCRIPT = LOOKUP_SCRIPT + VALUE_SCRIPT + """
+var entries = arguments[0];
+var applied = [];
+var rejected = [];
+var UNSUPPORTED_TYPES = ['checkbox', 'radio', 'file', 'submit', 'button', 'image', 'reset', 'hidden'];
+
+function findOption(el, value) {
+    var wanted = String(value).trim();
+    for (var i = 0; i < el.options.length; i++) {
+        var option = el.options[i];
+        if (option.text.replace(/\\s+/g, ' ').trim() === wanted || option.value === wanted) {
+            return option;
+        }
+    }
+    return null;
+}
+
+for (var i = 0; i < entries.length; i++) {
+    var entry = entries[i];
+    var el = lookup(entry);
+    if (!el || !el.isConnected) {
+        rejected.push({index: i, reason: entry.selector ? 'element not found' : 'element no longer attached'});
+        continue;
+    }
+    if (el.disabled || el.readOnly) {
+        rejected.push({index: i, reason: 'element is disabled'});
+        continue;
+    }
+    var tag = el.tagName.toLowerCase();
+    if (tag === 'input' && UNSUPPORTED_TYPES.indexOf((el.type || '').toLowerCase()) >= 0) {
+        rejected.push({index: i, reason: 'unsupported input type ' + el.type});
+        continue;
+    }
+
+    var target = String(entry.value);
+    if (tag === 'select') {
+        var option = findOption(el, target);
+        if (!option) {
+            rejected.push({index: i, reason: 'no matching option'});
+            continue;
+        }
+        target = option.value;
+    }
+    if (el.value === target) {
+        // Already holds the value, so no events that could reformat or re-validate it
+        applied.push(i);
+        continue;
+    }
+
+    try {
+        setValue(el, target);
+    } catch (e) {
+        rejected.push({index: i, reason: String(e)});
+        continue;
+    }
+
+    if (el.value === target) {
+        applied.push(i);
+    } else {
+        rejected.push({index: i, reason: 'value not accepted'});
+    }
+}
+return {applied: applied, rejected: rejected};
+"""
+
+# Lists the options of a plan entry's select, or returns null for other controls
+ENTRY_OPTIONS_SCRIPT = LOOKUP_SCRIPT + """
+var el = lookup(arguments[0]);
+if (!el || !el.isConnected || el.tagName !== 'SELECT') {
+    return null;
+}
+return Array.prototype.map.call(el.options, function (option) {
+    return {text: (option.text || '').replace(/\\s+/g, ' ').trim(), value: option.value};
+});
+"""
+
+# Focuses a control and selects its content, so inserted text replaces it. Takes
+# the element itself (WebDriver) or a plan entry's script argument (CDP).
+FOCUS_SCRIPT = LOOKUP_SCRIPT + """
+var target = arguments[0];
+var el = target && target.nodeType === Node.ELEMENT_NODE ? target : lookup(target || {});
+if (!el || !el.isConnected) {
+    return false;
+}
+el.focus();
+if (el.select) {
+    el.select();
+}
+return document.activeElement === el || el.getRootNode().activeElement === el;
+"""
+
+# Finishes a one-step text insertion: blurs the element if it holds the value
+# (firing change) and returns 'inserted', otherwise assigns it through the native
+# setter instead and returns 'set'. Returns '' if the page rejects the value.
+ENSURE_VALUE_SCRIPT = VALUE_SCRIPT + """
+var el = arguments[0];
+var value = arguments[1];
+if (el.value === value) {
+    el.blur();
+    return 'inserted';
+}
+setValue(el, value);
+return el.value === value ? 'set' : '';
+"""
+
+# Reads back the current value of every entry's control (and the selected
+# option's text for selects) in one round trip. Missing controls read as null.
+VERIFY_SCRIPT = LOOKUP_SCRIPT + """
+return arguments[0].map(function (entry) {
+    var el = lookup(entry);
+    if (!el || !el.isConnected) {
+        return null;
+    }
+    if (el.tagName === 'SELECT') {
+        var option = el.options[el.selectedIndex];
+        return {value: el.value, text: option ? option.text.replace(/\\s+/g, ' ').trim() : ''};
+    }
+    return {value: el.value};
+});
+"""
+
+
+def entry_argument(entry):
+    """
+    Turn a plan entry into the form the page scripts look controls up by.
+
+    Returns:
+        dict: The entry's selector or snapshot handle, with its value
+    """
+    if entry["field"] is None:
+        return {"selector": entry["selector"], "value": entry["value"]}
+    return {"handle": entry["field"]["handle"], "value": entry["value"]}
+
+
+def value_matches(expected, actual):
+    """
+    Check a value read back by VERIFY_SCRIPT against the planned value.
+
+    Values that differ only in formatting (case, spaces, punctuation added by
+    input masks) count as matching.
+    """
+    if actual is None:
+        return False
+    if expected in (actual.get("value"), actual.get("text")):
+        return True
+    loose = re.sub(r"\W", "", expected).lower()
+    return bool(loose) and any(
+        re.sub(r"\W", "", actual.get(key) or "").lower() == loose for key in ("value", "text")
+    )
+
+
+def find_mismatches(entries, actual_values):
+    """
+    Diff VERIFY_SCRIPT results against the planned entries.
+
+    Returns:
+        list: (entry, actual value or None) for every entry whose value did not stick
+    """
+    actual_values = actual_values or []
+    mismatches = []
+    for index, entry in enumerate(entries):
+        actual = actual_values[index] if index < len(actual_values) else None
+        if not value_matches(entry["value"], actual):
+            mismatches.append((entry, actual))
+    return mismatches
+
+
+class FillPlan:
+    """The set of values to write into snapshot fields on the current page."""
+
+    def __init__(self):
+        self.entries = []
+        self.planned_handles = set()
+        self.planned_selectors = set()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def is_planned(self, field):
+        """Check whether a snapshot field already has a planned value."""
+        return (tuple(field.get("frame") or ()), field["handle"]) in self.planned_handles
+
+    def add(self, field, value, field_name="", kind="text"):
+        """
+        Plan a value for a snapshot field.
+
+        Args:
+            field (dict): Snapshot record of the target control
+            value (str): Value to write
+            field_name (str): Name of the field for logging
+            kind (str): Type of field (text, textarea, select)
+
+        Returns:
+            bool: True if planned, False if the control already has a planned value
+        """
+        if self.is_planned(field):
+            return False
+
+        frame = tuple(field.get("frame") or ())
+        self.planned_handles.add((frame, field["handle"]))
+        self.entries.append({
+            "field": field,
+            "frame": frame,
+            "value": str(value),
+            "field_name": field_name,
+            "kind": kind
+        })
+        return True
+
+    def add_selector(self, selector, value, field_name="", kind="text", frame=()):
+        """
+        Plan a value for a control addressed by CSS selector, without a snapshot.
+
+        Args:
+            selector (str): CSS selector of the target control
+            value (str): Value to write
+            field_name (str): Name of the field for logging
+            kind (str): Type of field (text, textarea, select)
+            frame (tuple): Frame path of the control, the top document by default
+
+        Returns:
+            bool: True if planned, False if the selector already has a planned value
+        """
+        frame = tuple(frame or ())
+        if (frame, selector) in self.planned_selectors:
+            return False
+
+        self.planned_selectors.add((frame, selector))
+        self.entries.append({
+            "field": None,
+            "frame": frame,
+            "selector": selector,
+            "value": str(value),
+            "field_name": field_name,
+            "kind": kind
+        })
+        return True
+
+    def frame_groups(self):
+        """
+        Group the planned entries by the frame their control lives in.
+
+        Returns:
+            dict: Frame path -> list of entries, top document first
+        """
+        groups = {}
+        for entry in sorted(self.entries, key=lambda entry: len(entry["frame"])):
+            groups.setdefault(entry["frame"], []).append(entry)
+        return groups
+
+    def script_arguments(self, entries=None):
+        """
+        Return planned entries in the form expected by BATCH_FILL_SCRIPT.
+
+        Args:
+            entries (list): Entries of one frame, defaults to the whole plan
+        """
+        return [entry_argument(entry) for entry in (self.entries if entries is None else entries)]
+
+    def split_result(self, result, entries=None):
+        """
+        Match a BATCH_FILL_SCRIPT result back to the planned entries.
+
+        Args:
+            result (dict): Value returned by BATCH_FILL_SCRIPT
+            entries (list): Entries the script was run with, defaults to the whole plan
+
+        Returns:
+            tuple: (list of applied entries, list of (entry, reason) rejections)
+        """
+        result = result or {}
+        applied_indexes = set(result.get("applied", []))
+        reasons = {item["index"]: item["reason"] for item in result.get("rejected", [])}
+
+        applied = []
+        rejected = []
+        for index, entry in enumerate(self.entries if entries is None else entries):
+            if index in applied_indexes:
+                applied.append(entry)
+            else:
+                rejected.append((entry, reasons.get(index, "not processed")))
+        return applied, rejected
+
+
+class BatchFiller:
+    """Applies a FillPlan to the page with one script call per frame."""
+
+    def __init__(self, driver, frames=None):
+        """
+        Args:
+            driver (WebDriver): Driver of the page to fill
+            frames (FrameNavigator): Shared frame navigator, so the driver only
+                switches frames when the target frame changes
+        """
+        self.driver = driver
+        self.frames = frames or FrameNavigator(driver)
+
+    def apply(self, plan):
+        """
+        Write every planned value at once.
+
+        Args:
+            plan (FillPlan): Values to write
+
+        Returns:
+            tuple: (list of applied entries, list of (entry, reason) rejections)
+        """
+        if not plan.entries:
+            return [], []
+
+        start = time.perf_counter()
+        applied, rejected = [], []
+        groups = plan.frame_groups()
+        for frame, entries in groups.items():
+            try:
+                self.frames.switch(frame)
+                result = self.driver.execute_script(BATCH_FILL_SCRIPT, plan.script_arguments(entries))
+            except Exception as e:
+                logger.warning(f"Batch fill failed in frame {list(frame)}: {e}")
+                rejected.extend((entry, str(e)) for entry in entries)
+                continue
+            frame_applied, frame_rejected = plan.split_result(result, entries)
+            applied.extend(frame_applied)
+            rejected.extend(frame_rejected)
+        elapsed = time.perf_counter() - start
+
+        logger.info(
+            f"Batch filled {len(applied)} of {len(plan.entries)} fields "
+            f"in {len(groups)} frame(s) in {elapsed:.3f}s"
+        )
+        return applied, rejected
+
+    def verify(self, plan, entries, unreadable_missing=False):
+        """
+        Read back the values of filled entries, one script call per frame.
+
+        Args:
+            plan (FillPlan): Plan the entries belong to
+            entries (list): Entries that were filled
+            unreadable_missing (bool): Report every entry of a frame that cannot be
+                read as missing instead of skipping the frame
+
+        Returns:
+            list: (entry, actual value or None) for every entry whose value did not stick
+        """
+        groups = {}
+        for entry in entries:
+            groups.setdefault(entry["frame"], []).append(entry)
+
+        mismatches = []
+        for frame, frame_entries in groups.items():
+            try:
+                self.frames.switch(frame)
+                actual = self.driver.execute_script(VERIFY_SCRIPT, plan.script_arguments(frame_entries))
+            except Exception as e:
+                logger.warning(f"Could not verify fields in frame {list(frame)}: {e}")
+                if unreadable_missing:
+                    mismatches.extend((entry, None) for entry in frame_entries)
+                continue
+            mismatches.extend(find_mismatches(frame_entries, actual))
+        return mismatches
+
+    def read_values(self, plan):
+        """
+        Read the current values of every entry's control, one script call per frame.
+
+        Args:
+            plan (FillPlan): Plan whose controls to read
+
+        Returns:
+            list: Value per plan entry, in the shape VERIFY_SCRIPT returns it, or
+            None for a missing control or an unreadable frame
+        """
+        groups = {}
+        for entry in plan.entries:
+            groups.setdefault(entry["frame"], []).append(entry)
+
+        values = {}
+        for frame, frame_entries in groups.items():
+            try:
+                self.frames.switch(frame)
+                actual = self.driver.execute_script(VERIFY_SCRIPT, plan.script_arguments(frame_entries)) or []
+            except Exception as e:
+                logger.debug(f"Could not read fields in frame {list(frame)}: {e}")
+                continue
+            for entry, value in zip(frame_entries, actual):
+                values[id(entry)] = value
+        return [values.get(id(entry)) for entry in plan.entries]
@@ -0,0 +1,108 @@
+"""
+Batch mode for the Job Application Auto-Fill Bot.
+Fills a list of application URLs across a pool of worker processes, each with its
+own headless browser, and streams one JSON result per URL as they finish.
+"""
+
+import os
+import json
+import time
+import logging
+
+import config
+from fill_backends import create_backend
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SETTINGS = {
+    "workers": min(4, os.cpu_count() or 1),  # Worker processes, one browser each
+    "headless": True  # Run worker browsers without a window
+}
+
+
+def load_urls(path):
+    """
+    Read application URLs from a text file (one per line) or a JSONL file.
+
+    JSONL lines may be plain strings or objects with a "url" key. Blank lines
+    and lines starting with '#' are ignored.
+
+    Args:
+        path (str): Path to the URL list
+
+    Returns:
+        list: URLs in file order
+    """
+    urls = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if path.endswith(".jsonl") or line.startswith(("{", '"')):
+                item = json.loads(line)
+                line = item.get("url", "") if isinstance(item, dict) else str(item)
+            if line.startswith(("http://", "https://")):
+                urls.append(line)
+            else:
+                logger.warning(f"Skipping invalid URL: {line}")
+    return urls
+
+
+def run_batch(urls, output_path, workers=None, headless=None, backend=None, keep_pages_open=False):
+    """
+    Fill every URL across a pool of worker processes.
+
+    With the "cdp" backend the URLs are filled as concurrent pages of a single
+    browser driven from one event loop instead.
+
+    Args:
+        urls (list): Application URLs to fill
+        output_path (str): JSONL file that receives one result per URL as it finishes
+        workers (int): Number of worker processes (or concurrent CDP pages),
+            defaults to the configured value
+        headless (bool): Run worker browsers headless, defaults to the configured value
+        backend (str): "selenium" or "cdp", defaults to BROWSER_SETTINGS["backend"]
+        keep_pages_open (bool): Leave the browsers open with every filled page for review
+
+    Returns:
+        dict: Summary with total, succeeded, failed and seconds
+    """
+    settings = dict(DEFAULT_BATCH_SETTINGS)
+    settings.update(config.BROWSER_SETTINGS.get("batch", {}))
+    workers = max(1, min(workers or settings["workers"], len(urls) or 1))
+    headless = settings["headless"] if headless is None else headless
+
+    backend = backend or config.BROWSER_SETTINGS.get("backend", "selenium")
+
+    logger.info(f"Filling {len(urls)} URLs with {workers} {backend} workers")
+    start = time.perf_counter()
+    succeeded = 0
+
+    with open(output_path, 'a', encoding='utf-8') as out:
+        def record(result):
+            nonlocal succeeded
+            out.write(json.dumps(result, default=str) + "\n")
+            out.flush()
+            if result["status"] == "ok":
+                succeeded += 1
+                logger.info(f"[{result['seconds']:.1f}s] {result['url']}: {result['fields_filled']} fields")
+            else:
+                logger.warning(f"[{result['seconds']:.1f}s] {result['url']}: {result['error']}")
+
+        fill_backend = create_backend(
+            backend, concurrency=workers, headless=headless, keep_pages_open=keep_pages_open
+        )
+        try:
+            fill_backend.fill_urls(urls, record)
+        finally:
+            fill_backend.close()
+
+    summary = {
+        "total": len(urls),
+        "succeeded": succeeded,
+        "failed": len(urls) - succeeded,
+        "seconds": round(time.perf_counter() - start, 3)
+    }
+    logger.info(f"Batch complete: {summary['succeeded']}/{summary['total']} succeeded in {summary['seconds']:.1f}s")
+    return summary
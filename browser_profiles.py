@@ -0,0 +1,273 @@
+"""
+Persistent Chrome profiles for the Job Application Auto-Fill Bot.
+Hands each browser its own reusable user-data directory so HTTP caches, cookies
+and portal logins survive between runs, with a lock per directory so parallel
+workers never share one, a size cap and age-based cleanup.
+"""
+
+import os
+import time
+import uuid
+import shutil
+import logging
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROFILE_SETTINGS = {
+    "enabled": False,  # Use persistent profiles instead of a throwaway one per browser
+    "root": None,  # Directory holding the profiles, defaults to .chrome_profiles
+    "tmpfs": False,  # Keep profiles in /dev/shm (fast, but lost on reboot)
+    "max_size_mb": 500,  # Trim a profile's caches when it grows past this
+    "max_age_days": 14  # Delete profiles that have not been used for this long
+}
+
+TMPFS_ROOT = "/dev/shm"
+LOCK_FILE = ".autofill.lock"
+
+# Win32 values used to look up a process without signalling it
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+ERROR_ACCESS_DENIED = 5
+STILL_ACTIVE = 259
+
+# Cache directories that can be deleted without losing cookies or logins
+CACHE_DIRS = [
+    "Default/Cache",
+    "Default/Code Cache",
+    "Default/GPUCache",
+    "Default/Service Worker/CacheStorage",
+    "GrShaderCache",
+    "GraphiteDawnCache",
+    "ShaderCache"
+]
+
+
+def directory_size(path):
+    """Total size of the files below a directory, in bytes."""
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for filename in filenames:
+            try:
+                total += os.lstat(os.path.join(dirpath, filename)).st_size
+            except OSError:
+                continue
+    return total
+
+
+def process_alive(pid):
+    """Check whether a process with the given id is still running."""
+    if os.name == 'nt':
+        return windows_process_alive(pid)
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
+
+
+def windows_process_alive(pid):
+    """Windows version of process_alive(), where os.kill(pid, 0) would terminate the process."""
+    import ctypes
+
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.OpenProcess.argtypes = [ctypes.c_ulong, ctypes.c_int, ctypes.c_ulong]
+    kernel32.OpenProcess.restype = ctypes.c_void_p
+    kernel32.GetExitCodeProcess.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_ulong)]
+    kernel32.CloseHandle.argtypes = [ctypes.c_void_p]
+
+    handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        # The process exists but belongs to another user
+        return ctypes.get_last_error() == ERROR_ACCESS_DENIED
+    try:
+        exit_code = ctypes.c_ulong()
+        if not kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code)):
+            return False
+        return exit_code.value == STILL_ACTIVE
+    finally:
+        kernel32.CloseHandle(handle)
+
+
+def create_lock(lock):
+    """
+    Create a lock file holding this process's id, failing if it exists.
+
+    The id is written to a private file first and hard-linked into place, so
+    other processes never read a lock that exists but is still empty.
+
+    Returns:
+        bool: True if the lock was created
+    """
+    tmp = lock.with_name(f"{LOCK_FILE}.{os.getpid()}.{uuid.uuid4().hex}")
+    tmp.write_text(str(os.getpid()))
+    try:
+        os.link(tmp, lock)
+        return True
+    except FileExistsError:
+        return False
+    except OSError:
+        # No hard links on this filesystem, fall back to an exclusive create
+        try:
+            fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+        with os.fdopen(fd, 'w') as f:
+            f.write(str(os.getpid()))
+        return True
+    finally:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+def lock_owner(lock):
+    """
+    Read the process id stored in a lock file.
+
+    Returns:
+        int or None: The owner's id, 0 if unreadable, or None if the lock is gone
+    """
+    try:
+        return int(lock.read_text().strip() or 0)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        return 0
+
+
+def reclaim_lock(lock, owner):
+    """
+    Remove the stale lock of an exited process so it can be created again.
+
+    The lock is first renamed to a name only this process uses, so when several
+    processes reclaim at once only one removes it, and a fresh lock taken by
+    another process in the meantime is put back instead of deleted.
+
+    Args:
+        lock (Path): Lock file
+        owner (int): Exited owner read from the lock
+
+    Returns:
+        bool: True if the lock may be created again
+    """
+    stale = lock.with_name(f"{LOCK_FILE}.stale.{os.getpid()}.{uuid.uuid4().hex}")
+    try:
+        os.rename(lock, stale)
+    except FileNotFoundError:
+        return True  # Another process reclaimed it first
+    except OSError:
+        return False
+
+    try:
+        if lock_owner(stale) == owner:
+            return True
+        # Another process took the lock after we read it, hand it back
+        try:
+            os.link(stale, lock)
+        except OSError as e:
+            logger.warning(f"Could not restore profile lock {lock}: {e}")
+        return False
+    finally:
+        try:
+            stale.unlink()
+        except OSError:
+            pass
+
+
+class ProfileManager:
+    """Allocates locked, persistent Chrome user-data directories to browsers."""
+
+    def __init__(self, settings=None):
+        """
+        Args:
+            settings (dict): Overrides for DEFAULT_PROFILE_SETTINGS
+        """
+        self.settings = dict(DEFAULT_PROFILE_SETTINGS)
+        self.settings.update(settings or {})
+
+        if self.settings["tmpfs"] and os.path.isdir(TMPFS_ROOT):
+            self.root = Path(TMPFS_ROOT) / "job-autofill-profiles"
+        elif self.settings["root"]:
+            self.root = Path(self.settings["root"]).expanduser()
+        else:
+            self.root = Path(__file__).parent / ".chrome_profiles"
+
+    @property
+    def enabled(self):
+        return bool(self.settings["enabled"])
+
+    @property
+    def cache_size_bytes(self):
+        """HTTP cache limit passed to Chrome, leaving room for the rest of the profile."""
+        return int(self.settings["max_size_mb"] * 1024 * 1024 * 0.8)
+
+    def acquire(self):
+        """
+        Lock a profile directory for a new browser, reusing an unlocked one when
+        possible so its caches are warm.
+
+        Returns:
+            str: Path of the profile directory
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.cleanup()
+
+        index = 0
+        while True:
+            path = self.root / f"worker-{index}"
+            path.mkdir(exist_ok=True)
+            if self._lock(path):
+                self.enforce_size_cap(path)
+                logger.info(f"Using Chrome profile {path}")
+                return str(path)
+            index += 1
+
+    def release(self, path):
+        """Unlock a profile directory after its browser has quit."""
+        try:
+            os.remove(Path(path) / LOCK_FILE)
+        except OSError as e:
+            logger.debug(f"Could not unlock profile {path}: {e}")
+
+    def _lock(self, path):
+        """Take the profile's lock, reclaiming it if its owner has died."""
+        lock = path / LOCK_FILE
+        for _ in range(2):
+            if create_lock(lock):
+                return True
+            owner = lock_owner(lock)
+            if owner is None:
+                continue  # Released in the meantime
+            if owner and process_alive(owner):
+                return False
+            logger.info(f"Reclaiming profile {path} from exited process {owner}")
+            if not reclaim_lock(lock, owner):
+                return False
+        return False
+
+    def enforce_size_cap(self, path):
+        """Delete the profile's caches when it has grown past max_size_mb."""
+        limit = self.settings["max_size_mb"] * 1024 * 1024
+        size = directory_size(path)
+        if size <= limit:
+            return
+        for cache_dir in CACHE_DIRS:
+            shutil.rmtree(Path(path) / cache_dir, ignore_errors=True)
+        logger.info(f"Trimmed caches of profile {path} ({size / 1048576:.0f} MB > {self.settings['max_size_mb']} MB)")
+
+    def cleanup(self):
+        """Delete unlocked profiles that have not been used for max_age_days."""
+        cutoff = time.time() - self.settings["max_age_days"] * 86400
+        for path in self.root.glob("worker-*"):
+            try:
+                if (path / LOCK_FILE).exists() or path.stat().st_mtime >= cutoff:
+                    continue
+            except OSError:
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            logger.info(f"Removed unused Chrome profile {path}")
@@ -0,0 +1,510 @@
+"""
+Asyncio Chrome DevTools Protocol backend for the Job Application Auto-Fill Bot.
+Drives Chrome directly over its DevTools websocket so one event loop can fill many
+pages concurrently. Uses the same discovery, planning and batch fill scripts as the
+Selenium backend, so both produce the same fills for the same page.
+"""
+
+import os
+import json
+import time
+import shutil
+import asyncio
+import logging
+import tempfile
+import subprocess
+
+import config
+from driver_resolver import find_chrome_executable
+from browser_profiles import ProfileManager
+from field_discovery import FRAME_SNAPSHOT_SCRIPT, FieldSnapshot
+from label_proximity import infer_labels
+from option_matcher import match_option
+from batch_filler import (
+    BATCH_FILL_SCRIPT, VERIFY_SCRIPT, FOCUS_SCRIPT, ENTRY_OPTIONS_SCRIPT, DEFAULT_VERIFY_SETTINGS, FillPlan,
+    entry_argument, find_mismatches
+)
+from page_readiness import TRACKER_SCRIPT, PROBE_SCRIPT, DEFAULT_READINESS_SETTINGS, is_page_ready
+from fill_planner import FillPlanner, delta_settings, filter_delta, kept_fields, report_delta, resolve_profile
+from pacing import PacingPolicy
+from selector_cache import SelectorCache, host_key
+from ats_adapters import FINGERPRINT_SCRIPT, adapter_for_markers, adapter_for_url, marker_selectors
+
+logger = logging.getLogger(__name__)
+
+
+class CDPError(Exception):
+    """Raised when Chrome reports an error for a DevTools command."""
+
+
+class CDPConnection:
+    """A DevTools websocket connection that multiplexes commands for many pages."""
+
+    def __init__(self, websocket_url):
+        self.websocket_url = websocket_url
+        self.websocket = None
+        self.reader = None
+        self.next_id = 0
+        self.pending = {}
+
+    async def open(self):
+        """Connect to the browser's DevTools websocket."""
+        try:
+            import websockets
+        except ImportError:
+            raise RuntimeError("The CDP backend requires the 'websockets' package: pip install websockets")
+
+        self.websocket = await websockets.connect(self.websocket_url, max_size=None)
+        self.reader = asyncio.ensure_future(self._read_messages())
+
+    async def _read_messages(self):
+        """Route command responses to their waiting callers. Events are ignored."""
+        try:
+            async for message in self.websocket:
+                data = json.loads(message)
+                future = self.pending.pop(data.get("id"), None)
+                if future is None or future.done():
+                    continue
+                if "error" in data:
+                    future.set_exception(CDPError(data["error"].get("message", "unknown error")))
+                else:
+                    future.set_result(data.get("result", {}))
+        except Exception as e:
+            logger.debug(f"DevTools connection closed: {e}")
+        finally:
+            for future in self.pending.values():
+                if not future.done():
+                    future.set_exception(CDPError("DevTools connection closed"))
+            self.pending.clear()
+
+    async def send(self, method, params=None, session_id=None):
+        """
+        Send a DevTools command and wait for its result.
+
+        Args:
+            method (str): DevTools method, e.g. "Runtime.evaluate"
+            params (dict): Method parameters
+            session_id (str): Target session the command is for
+
+        Returns:
+            dict: The command result
+        """
+        self.next_id += 1
+        message = {"id": self.next_id, "method": method, "params": params or {}}
+        if session_id:
+            message["sessionId"] = session_id
+
+        future = asyncio.get_running_loop().create_future()
+        self.pending[self.next_id] = future
+        await self.websocket.send(json.dumps(message))
+        return await future
+
+    async def close(self):
+        if self.websocket is not None:
+            await self.websocket.close()
+        if self.reader is not None:
+            await self.reader
+
+
+class CDPPage:
+    """One browser tab attached through a flattened DevTools session."""
+
+    def __init__(self, connection, target_id, session_id):
+        self.connection = connection
+        self.target_id = target_id
+        self.session_id = session_id
+
+    async def send(self, method, params=None):
+        return await self.connection.send(method, params, self.session_id)
+
+    async def navigate(self, url):
+        await self.send("Page.navigate", {"url": url})
+
+    async def evaluate(self, script, *args):
+        """
+        Run a script written for WebDriver's execute_script (using arguments[] and return).
+
+        Returns:
+            The script's return value, converted to JSON types
+        """
+        expression = f"(function () {{\n{script}\n}}).apply(null, {json.dumps(list(args))})"
+        result = await self.send("Runtime.evaluate", {
+            "expression": expression,
+            "returnByValue": True,
+            "awaitPromise": True
+        })
+        if "exceptionDetails" in result:
+            details = result["exceptionDetails"]
+            description = details.get("exception", {}).get("description") or details.get("text")
+            raise CDPError(f"Script failed: {description}")
+        return result.get("result", {}).get("value")
+
+    async def insert_text(self, text):
+        """Insert text into the focused element in one step, like an IME commit."""
+        await self.send("Input.insertText", {"text": text})
+
+    async def close(self):
+        await self.connection.send("Target.closeTarget", {"targetId": self.target_id})
+
+
+class CDPBrowser:
+    """A Chrome process controlled over its DevTools websocket."""
+
+    def __init__(self, headless=True):
+        self.headless = headless
+        self.process = None
+        self.user_data_dir = None
+        self.profiles = ProfileManager(config.BROWSER_SETTINGS.get("profiles"))
+        self.connection = None
+
+    async def start(self, startup_timeout=20):
+        """Launch Chrome with remote debugging enabled and connect to it."""
+        executable = find_chrome_executable(config.BROWSER_SETTINGS.get("chrome_binary"))
+        if not executable:
+            raise RuntimeError("Could not find a Chrome executable for the CDP backend")
+
+        if self.profiles.enabled:
+            self.user_data_dir = self.profiles.acquire()
+        else:
+            self.user_data_dir = tempfile.mkdtemp(prefix="autofill-cdp-")
+        args = [
+            executable,
+            "--remote-debugging-port=0",
+            f"--user-data-dir={self.user_data_dir}",
+            "--no-first-run",
+            "--no-default-browser-check",
+            "--disable-blink-features=AutomationControlled",
+            "about:blank"
+        ]
+        if self.profiles.enabled:
+            args.insert(-1, f"--disk-cache-size={self.profiles.cache_size_bytes}")
+        if self.headless:
+            args.insert(1, "--headless=new")
+
+        # Chrome writes the chosen port and browser websocket path to this file. One
+        # left over from a previous run of this profile must go before Chrome starts,
+        # or it could delete the fresh file or connect to a stale port.
+        port_file = os.path.join(self.user_data_dir, "DevToolsActivePort")
+        if os.path.exists(port_file):
+            os.remove(port_file)
+
+        self.process = subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        deadline = time.monotonic() + startup_timeout
+        while not os.path.exists(port_file):
+            if self.process.poll() is not None or time.monotonic() > deadline:
+                await self.close()
+                raise RuntimeError("Chrome did not open a DevTools port")
+            await asyncio.sleep(0.05)
+        await asyncio.sleep(0.05)
+
+        with open(port_file, 'r') as f:
+            port, path = f.read().split()[:2]
+
+        self.connection = CDPConnection(f"ws://127.0.0.1:{port}{path}")
+        await self.connection.open()
+        logger.info(f"Chrome started for CDP backend on port {port}")
+
+    async def new_page(self):
+        """
+        Open a new tab and attach to it.
+
+        Returns:
+            CDPPage: The attached page, with the readiness tracker installed
+        """
+        target = await self.connection.send("Target.createTarget", {"url": "about:blank"})
+        attached = await self.connection.send(
+            "Target.attachToTarget", {"targetId": target["targetId"], "flatten": True}
+        )
+        page = CDPPage(self.connection, target["targetId"], attached["sessionId"])
+        await page.send("Page.enable")
+        await page.send("Page.addScriptToEvaluateOnNewDocument", {"source": TRACKER_SCRIPT})
+        return page
+
+    async def detach(self):
+        """Disconnect from Chrome but leave it running with its tabs open, e.g. for review."""
+        if self.connection is not None:
+            try:
+                await self.connection.close()
+            except Exception as e:
+                logger.debug(f"Error closing DevTools connection: {e}")
+            self.connection = None
+        logger.info("Left Chrome running with the filled pages open")
+
+    async def close(self):
+        """Disconnect, stop Chrome and release or remove its profile."""
+        if self.connection is not None:
+            try:
+                await self.connection.close()
+            except Exception as e:
+                logger.debug(f"Error closing DevTools connection: {e}")
+        if self.process is not None and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        if self.user_data_dir and self.profiles.enabled:
+            self.profiles.release(self.user_data_dir)
+        elif self.user_data_dir:
+            shutil.rmtree(self.user_data_dir, ignore_errors=True)
+
+
+class AsyncCDPFiller:
+    """Fills many application pages concurrently from a single event loop."""
+
+    def __init__(self, concurrency=4, headless=True, keep_pages_open=False):
+        """
+        Args:
+            concurrency (int): Maximum number of pages being filled at once
+            headless (bool): Run Chrome without a window
+            keep_pages_open (bool): Leave filled tabs open for review
+        """
+        self.concurrency = max(1, concurrency)
+        self.headless = headless
+        self.keep_pages_open = keep_pages_open
+        self.readiness_settings = dict(DEFAULT_READINESS_SETTINGS)
+        self.readiness_settings.update(config.BROWSER_SETTINGS.get("page_readiness") or {})
+        self.profile = resolve_profile()
+        self.verify_settings = dict(DEFAULT_VERIFY_SETTINGS)
+        self.verify_settings.update(config.BROWSER_SETTINGS.get("verify") or {})
+        cache_settings = config.BROWSER_SETTINGS.get("selector_cache") or {}
+        self.selector_cache = SelectorCache(cache_settings) if cache_settings.get("enabled", True) else None
+
+    async def wait_until_ready(self, page):
+        """
+        Poll the page until it settles or the readiness deadline passes.
+
+        Returns:
+            dict: Result with ready and waited (seconds)
+        """
+        start = time.perf_counter()
+        ready = False
+        while time.perf_counter() - start < self.readiness_settings["deadline"]:
+            try:
+                state = await page.evaluate(PROBE_SCRIPT)
+                if state["url"] != "about:blank" and is_page_ready(state, self.readiness_settings):
+                    ready = True
+                    break
+            except CDPError as e:
+                # Navigation in progress or page replaced mid-probe
+                logger.debug(f"Readiness probe failed: {e}")
+            await asyncio.sleep(self.readiness_settings["poll_interval"])
+        return {"ready": ready, "waited": time.perf_counter() - start}
+
+    async def select_option(self, page, entry):
+        """
+        Select the option of a rejected select that matches the entry's value
+        through the synonym index (e.g. "CA" selects "California").
+
+        Returns:
+            bool: True if an option was selected
+        """
+        options = await page.evaluate(ENTRY_OPTIONS_SCRIPT, entry_argument(entry))
+        option = match_option(entry["value"], options or [])
+        if option is None:
+            logger.info(f"No option of {entry['field_name']} matches {entry['value']!r}")
+            return False
+        argument = dict(entry_argument(entry), value=option["value"])
+        result = await page.evaluate(BATCH_FILL_SCRIPT, [argument]) or {}
+        return bool(result.get("applied"))
+
+    async def fill_element(self, page, entry):
+        """
+        Fill one rejected field by focusing it and inserting the text natively,
+        or by picking the closest option of a select.
+
+        Returns:
+            bool: True if the element was filled
+        """
+        if entry["kind"] == "select":
+            try:
+                return await self.select_option(page, entry)
+            except CDPError as e:
+                logger.warning(f"Failed to select {entry['field_name']}: {e}")
+                return False
+        try:
+            start = time.perf_counter()
+            if not await page.evaluate(FOCUS_SCRIPT, entry_argument(entry)):
+                return False
+            await page.insert_text(entry["value"])
+            logger.info(
+                f"Typed {entry['field_name']} ({len(entry['value'])} chars) with insertText "
+                f"in {time.perf_counter() - start:.3f}s"
+            )
+            return True
+        except CDPError as e:
+            logger.warning(f"Failed to fill {entry['field_name']}: {e}")
+            return False
+
+    async def fill_with_adapter(self, page, url, report, pacing):
+        """
+        Fill a known ATS platform's fields straight from its field map and
+        verify them like the generic plan. Fields that already hold their value
+        are left alone and reported in the delta.
+
+        Returns:
+            tuple: (names of the fields filled, names of the fields left as they
+            are, number of filled fields still holding the wrong value)
+        """
+        adapter = adapter_for_url(url)
+        if adapter is None:
+            adapter = adapter_for_markers(await page.evaluate(FINGERPRINT_SCRIPT, marker_selectors()))
+        report["platform"] = adapter.name if adapter else None
+        if adapter is None:
+            return set(), set(), 0
+
+        plan = FillPlan()
+        adapter.plan(self.profile, plan)
+        if not plan.entries:
+            return set(), set(), 0
+        settings = delta_settings()
+        current = await page.evaluate(VERIFY_SCRIPT, plan.script_arguments())
+        plan, delta = filter_delta(plan, current, settings)
+        report_delta(report, delta, settings)
+        kept = kept_fields(delta, settings)
+        if not plan.entries:
+            return set(), kept, 0
+
+        applied, _ = plan.split_result(await page.evaluate(BATCH_FILL_SCRIPT, plan.script_arguments()))
+        for entry in applied:
+            report["fields"][entry["field_name"]] = "filled"
+
+        failed = 0
+        if self.verify_settings["enabled"] and applied:
+            failed = await self.verify_fill(page, plan, applied, report, pacing)
+        return {entry["field_name"] for entry in applied}, kept, failed
+
+    async def verify_fill(self, page, plan, filled, report, pacing):
+        """
+        Read back every filled value in one call and refill only the fields
+        whose value did not stick.
+
+        Returns:
+            int: Number of fields still holding the wrong value
+        """
+        await asyncio.sleep(pacing.settle(self.verify_settings["settle_ms"] / 1000))
+        mismatches = find_mismatches(filled, await page.evaluate(VERIFY_SCRIPT, plan.script_arguments(filled)))
+        report["fields_verified"] = report.get("fields_verified", 0) + len(filled) - len(mismatches)
+
+        refilled = []
+        for entry, actual in mismatches:
+            logger.info(f"{entry['field_name']} did not keep its value ({actual}), refilling directly")
+            if await self.fill_element(page, entry):
+                refilled.append(entry)
+            else:
+                report["fields"][entry["field_name"]] = "mismatch"
+
+        still_wrong = []
+        if refilled:
+            actual = await page.evaluate(VERIFY_SCRIPT, plan.script_arguments(refilled))
+            still_wrong = [entry for entry, _ in find_mismatches(refilled, actual)]
+        for entry in refilled:
+            report["fields"][entry["field_name"]] = "mismatch" if entry in still_wrong else "refilled"
+
+        return len(mismatches) - len(refilled) + len(still_wrong)
+
+    async def fill_page(self, page, url):
+        """
+        Navigate a page to a URL and fill it.
+
+        Returns:
+            dict: Run report for the page, in the same shape as JobApplicationFiller.run_report
+        """
+        report = {"url": url}
+        pacing = PacingPolicy(config.BROWSER_SETTINGS.get("pacing"))
+        pacing.for_url(url)
+
+        await page.navigate(url)
+        readiness = await self.wait_until_ready(page)
+        report["page_wait"] = round(readiness["waited"], 3)
+        report["page_ready"] = readiness["ready"]
+        await asyncio.sleep(pacing.delay("page"))
+
+        field_status = report["fields"] = {}
+        prefilled, kept, failed = await self.fill_with_adapter(page, url, report, pacing)
+
+        result = await page.evaluate(FRAME_SNAPSHOT_SCRIPT) or {}
+        infer_labels(result.get("fields") or [], result.get("texts") or [])
+        snapshot = FieldSnapshot(result.get("fields") or [])
+        planner = FillPlanner(snapshot, self.profile, self.selector_cache, host_key(url), prefilled | kept)
+        plan, counts = planner.plan()
+        planner.report_delta(report)
+
+        applied, rejected = [], []
+        if plan.entries:
+            result = await page.evaluate(BATCH_FILL_SCRIPT, plan.script_arguments())
+            applied, rejected = plan.split_result(result)
+
+        for entry in applied:
+            field_status[entry["field_name"]] = "filled"
+
+        filled = list(applied)
+        for entry, reason in rejected:
+            logger.info(f"Batch rejected {entry['field_name']} ({reason}), retrying directly")
+            if await self.fill_element(page, entry):
+                field_status[entry["field_name"]] = "filled_fallback"
+                filled.append(entry)
+            else:
+                field_status[entry["field_name"]] = "failed"
+                failed += 1
+
+        if self.verify_settings["enabled"] and filled:
+            failed += await self.verify_fill(page, plan, filled, report, pacing)
+
+        if self.selector_cache is not None:
+            self.selector_cache.save()
+
+        report["fields_filled"] = len(prefilled) + sum(counts.values()) - failed
+        report["time_slept"] = round(pacing.total_slept, 3)
+        logger.info(f"Filled {report['fields_filled']} fields on {url}")
+        return report
+
+    async def fill_urls(self, urls, on_result=None):
+        """
+        Fill every URL, up to `concurrency` pages at a time.
+
+        Args:
+            urls (list): Application URLs
+            on_result (callable): Called with each result as soon as it is ready
+
+        Returns:
+            list: One result dict per URL, in completion order
+        """
+        browser = CDPBrowser(self.headless)
+        await browser.start()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        results = []
+
+        async def run(url):
+            async with semaphore:
+                start = time.perf_counter()
+                result = {"url": url}
+                page = None
+                try:
+                    page = await browser.new_page()
+                    result["report"] = await self.fill_page(page, url)
+                    result["fields_filled"] = result["report"]["fields_filled"]
+                    result["status"] = "ok"
+                except Exception as e:
+                    logger.error(f"Error during auto-fill of {url}: {e}")
+                    result["status"] = "error"
+                    result["error"] = str(e)
+                finally:
+                    if page is not None and not self.keep_pages_open:
+                        try:
+                            await page.close()
+                        except Exception:
+                            pass
+                result["seconds"] = round(time.perf_counter() - start, 3)
+                results.append(result)
+                if on_result:
+                    on_result(result)
+
+        try:
+            await asyncio.gather(*(run(url) for url in urls))
+        finally:
+            if self.keep_pages_open:
+                await browser.detach()
+            else:
+                await browser.close()
+        return results
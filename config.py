@@ -7,7 +7,72 @@ Contains default settings and user information.
 BROWSER_SETTINGS = {
     "headless": False,
     "implicit_wait": 10,
-    "page_load_timeout": 30
+    "page_load_timeout": 30,
+    "chrome_binary": None,  # Chrome executable, auto-detected when None
+    "chromedriver_path": None,  # Fixed chromedriver, skips version resolution when set
+    "chromedriver_index": None,  # Resolved-driver cache file, defaults to .chromedriver_index.json
+    "batch_fill": True,  # Write all matched fields in one script call
+    "long_text_min_length": 20,  # Enter texts this long in one step instead of typing them key by key
+    "backend": "selenium",  # "selenium", or "cdp" to drive Chrome directly over DevTools (batch mode)
+    "page_readiness": {
+        "deadline": 15,  # Seconds to wait at most for a page to settle
+        "dom_quiet_ms": 500,  # DOM must stop changing for this long
+        "network_idle_ms": 500,  # No network activity for this long
+        "request_idle_cap_ms": 3000,  # Stop waiting for requests open this long (long-poll, streaming)
+        "poll_interval": 0.1
+    },
+    "pacing": {
+        "profile": "fast",  # "fast" (no delays) or "human" (jittered delays)
+        "domains": {}  # Per-domain profile overrides, e.g. {"myworkdayjobs.com": "human"}
+    },
+    "driver_pool": {
+        "size": 1,  # Chrome sessions kept warm between fills
+        "clear_cookies": False,  # Clear cookies before reusing a session
+        "close_old_tabs": False  # Keep previous forms open for review
+    },
+    "batch": {
+        "workers": 4,  # Browser worker processes for --batch mode
+        "headless": True
+    },
+    "multi_tab": {
+        "max_open_tabs": 6  # Tabs loading at once in --batch --tabs mode
+    },
+    "profiles": {
+        "enabled": False,  # Persistent Chrome profiles (warm caches, saved logins), one per browser
+        "root": None,  # Profile directory, defaults to .chrome_profiles
+        "tmpfs": False,  # Keep profiles in /dev/shm instead
+        "max_size_mb": 500,  # Trim a profile's caches past this size
+        "max_age_days": 14  # Delete profiles unused for this long
+    },
+    "verify": {
+        "enabled": True,  # Read back filled values and refill any that reverted
+        "settle_ms": 200
+    },
+    "wizard": {
+        "enabled": False,  # Click "Next"/"Continue" through multi-step applications (never submits)
+        "max_steps": 10
+    },
+    "dependent_fields": {
+        "enabled": True,  # Fill fields revealed by earlier answers (e.g. state after country)
+        "deadline": 5,  # Seconds to keep watching for them at most
+        "quiet_ms": 400,  # Stop once the page has not changed for this long
+        "max_rounds": 5
+    },
+    "delta_fill": {
+        "enabled": True,  # Skip fields that already hold the right value (re-runs, pre-filled portals)
+        "overwrite_conflicts": True  # Replace pre-filled values that differ from your profile
+    },
+    "checkpoints": {
+        "enabled": True,  # Save each URL's fill plan so a crashed run resumes where it stopped
+        "directory": None,  # Checkpoint directory, defaults to .fill_checkpoints
+        "ttl_hours": 24  # Ignore checkpoints older than this
+    },
+    "selector_cache": {
+        "enabled": True,  # Remember which selector found each field, per site
+        "path": None,  # Cache file, defaults to .selector_cache.json
+        "ttl_days": 30,  # Relearn a site's selectors after this many days
+        "max_misses": 2  # Forget a learned selector after this many runs without a match
+    }
 }
 
 # Default personal information
@@ -36,9 +101,11 @@ SKILLS = []
 
 # Default common answers
 COMMON_ANSWERS = {
-    "why_join": "I am excited about the opportunity to contribute to [Company Name] and grow my career in [field/industry]. I believe my skills and experience align well with the role and I am eager to make a positive impact.",
-    "salary_expectations": "I am open to discussing a competitive salary based on the role requirements and my experience.",
+    "why_interested": "I am excited about the opportunity to contribute to [Company Name] and grow my career in [field/industry]. I believe my skills and experience align well with the role and I am eager to make a positive impact.",
+    "salary_expectation": "I am open to discussing a competitive salary based on the role requirements and my experience.",
     "availability": "I am available to start immediately and can work flexible hours as needed.",
     "relocation": "I am open to relocation for the right opportunity.",
+    "work_authorization": "I am authorized to work in this country and do not require sponsorship.",
+    "notice_period": "I can start after a two-week notice period.",
     "remote_work": "I am comfortable with both remote and in-office work arrangements."
 } 
\ No newline at end of file
@@ -0,0 +1,220 @@
+"""
+Warm WebDriver pool for the Job Application Auto-Fill Bot.
+Keeps initialized Chrome sessions alive between fills so each application
+does not pay for a cold browser start.
+"""
+
+import time
+import logging
+import threading
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SETTINGS = {
+    "size": 1,  # Number of Chrome sessions to keep alive
+    "clear_cookies": False,  # Clear cookies before handing a session out again
+    "close_old_tabs": False  # Close tabs from previous fills (keeps them open for review by default)
+}
+
+
+class DriverPool:
+    """Hands out healthy, warm Chrome sessions and takes them back after use."""
+
+    def __init__(self, driver_factory, settings=None, driver_closer=None):
+        """
+        Args:
+            driver_factory (callable): Creates a new, fully configured driver
+            settings (dict): Pool settings, see DEFAULT_POOL_SETTINGS
+            driver_closer (callable): Quits a driver made by the factory, defaults to driver.quit()
+        """
+        self.driver_factory = driver_factory
+        self.driver_closer = driver_closer
+        self.settings = dict(DEFAULT_POOL_SETTINGS)
+        self.settings.update(settings or {})
+        self.size = max(1, int(self.settings["size"]))
+
+        self.idle = []  # (driver, last host) pairs ready to be handed out
+        self.in_use = set()
+        self.fresh = set()  # Sessions that have never been handed out
+        self.starting = 0
+        self.closed = False
+        self.condition = threading.Condition()
+
+    def warm_up(self):
+        """Start sessions until the pool holds its configured size."""
+        with self.condition:
+            missing = self.size - len(self.idle) - len(self.in_use) - self.starting
+            self.starting += max(0, missing)
+
+        threads = [threading.Thread(target=self._start_session, daemon=True) for _ in range(max(0, missing))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def _start_session(self):
+        """
+        Create one session and add it to the idle list.
+
+        Returns:
+            Exception or None: The error raised by the driver factory, if any
+        """
+        error = None
+        try:
+            start = time.perf_counter()
+            driver = self.driver_factory()
+            logger.info(f"Warm Chrome session started in {time.perf_counter() - start:.2f}s")
+        except Exception as e:
+            logger.error(f"Failed to start pooled Chrome session: {e}")
+            driver = None
+            error = e
+
+        with self.condition:
+            self.starting -= 1
+            if driver is not None:
+                if self.closed:
+                    self._quit(driver)
+                else:
+                    self.idle.append((driver, None))
+                    self.fresh.add(driver)
+            self.condition.notify_all()
+        return error
+
+    def acquire(self, url=None, timeout=None):
+        """
+        Get a healthy session, preferring one that last served the same host.
+        If a new session has to be started and the driver factory fails, its
+        error is raised instead of retrying.
+
+        Args:
+            url (str): URL the session will be used for
+            timeout (float): Seconds to wait for a free session, None waits forever
+
+        Returns:
+            WebDriver: A driver with a fresh tab selected
+        """
+        host = urlparse(url).hostname if url else None
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            with self.condition:
+                if self.closed:
+                    raise RuntimeError("Driver pool is closed")
+
+                driver = self._take_idle(host)
+                if driver is None and len(self.in_use) + self.starting < self.size:
+                    self.starting += 1
+                    start_new = True
+                else:
+                    start_new = False
+                    if driver is None:
+                        remaining = None if deadline is None else deadline - time.monotonic()
+                        if remaining is not None and remaining <= 0:
+                            raise TimeoutError("No pooled Chrome session became available")
+                        self.condition.wait(remaining)
+                        continue
+
+            if start_new:
+                error = self._start_session()
+                if error is not None:
+                    raise error
+                continue
+
+            with self.condition:
+                fresh = driver in self.fresh
+                self.fresh.discard(driver)
+
+            if self.is_healthy(driver):
+                try:
+                    if not fresh:
+                        self.reset(driver)
+                except Exception as e:
+                    logger.warning(f"Failed to reset pooled session, recycling it: {e}")
+                    self._discard(driver)
+                    continue
+                with self.condition:
+                    self.in_use.add(driver)
+                return driver
+
+            logger.warning("Pooled Chrome session is unresponsive, recycling it")
+            self._discard(driver)
+
+    def _take_idle(self, host):
+        """Remove and return an idle driver, preferring host affinity."""
+        if not self.idle:
+            return None
+        for index, (driver, last_host) in enumerate(self.idle):
+            if host and last_host == host:
+                return self.idle.pop(index)[0]
+        return self.idle.pop(0)[0]
+
+    def release(self, driver, url=None):
+        """
+        Return a session to the pool after a fill.
+
+        Args:
+            driver (WebDriver): Driver obtained from acquire()
+            url (str): URL the driver was used for, kept for host affinity
+        """
+        with self.condition:
+            self.in_use.discard(driver)
+            if self.closed:
+                self._quit(driver)
+            else:
+                host = urlparse(url).hostname if url else None
+                self.idle.append((driver, host))
+            self.condition.notify_all()
+
+    def is_healthy(self, driver):
+        """Check that the browser and chromedriver still respond."""
+        try:
+            driver.execute_script("return 1")
+            return bool(driver.window_handles)
+        except Exception:
+            return False
+
+    def reset(self, driver):
+        """Give a reused session a clean tab, optionally clearing cookies and old tabs."""
+        previous_handles = list(driver.window_handles)
+        driver.switch_to.new_window("tab")
+
+        if self.settings["close_old_tabs"]:
+            current = driver.current_window_handle
+            for handle in previous_handles:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(current)
+
+        if self.settings["clear_cookies"]:
+            try:
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            except Exception:
+                driver.delete_all_cookies()
+
+    def _discard(self, driver):
+        """Quit a broken session and free its slot."""
+        self._quit(driver)
+        with self.condition:
+            self.in_use.discard(driver)
+            self.condition.notify_all()
+
+    def _quit(self, driver):
+        try:
+            if self.driver_closer:
+                self.driver_closer(driver)
+            else:
+                driver.quit()
+        except Exception as e:
+            logger.debug(f"Error quitting pooled session: {e}")
+
+    def close(self):
+        """Quit every idle session; sessions in use are quit when released."""
+        with self.condition:
+            self.closed = True
+            idle, self.idle = self.idle, []
+            self.condition.notify_all()
+
+        for driver, _ in idle:
+            self._quit(driver)
+        logger.info("Driver pool closed")
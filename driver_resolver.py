@@ -0,0 +1,190 @@
+"""
+Offline chromedriver resolution for the Job Application Auto-Fill Bot.
+Detects the installed Chrome version and reuses a previously downloaded matching
+chromedriver from a small on-disk index, only asking webdriver_manager on a miss.
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import shutil
+import logging
+import datetime
+import subprocess
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+VERSION_PATTERN = re.compile(r"(\d+)\.(\d+)\.(\d+)\.(\d+)")
+
+CHROME_COMMANDS = {
+    "linux": ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser"],
+    "darwin": [
+        "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+        "/Applications/Chromium.app/Contents/MacOS/Chromium"
+    ]
+}
+
+WINDOWS_REGISTRY_KEYS = [
+    r"Software\Google\Chrome\BLBeacon",
+    r"Software\Chromium\BLBeacon"
+]
+
+
+WINDOWS_CHROME_PATHS = [
+    ("PROGRAMFILES", r"Google\Chrome\Application\chrome.exe"),
+    ("PROGRAMFILES(X86)", r"Google\Chrome\Application\chrome.exe"),
+    ("LOCALAPPDATA", r"Google\Chrome\Application\chrome.exe")
+]
+
+
+def find_chrome_executable(chrome_binary=None):
+    """
+    Locate the Chrome executable.
+
+    Args:
+        chrome_binary (str): Explicit Chrome executable, returned if it exists
+
+    Returns:
+        str or None: Path to Chrome, or None if it cannot be found
+    """
+    if chrome_binary:
+        return chrome_binary if os.path.exists(chrome_binary) else shutil.which(chrome_binary)
+
+    if sys.platform.startswith("win"):
+        for env_var, relative_path in WINDOWS_CHROME_PATHS:
+            base = os.environ.get(env_var)
+            if base and os.path.exists(os.path.join(base, relative_path)):
+                return os.path.join(base, relative_path)
+        return None
+
+    platform = "darwin" if sys.platform == "darwin" else "linux"
+    for command in CHROME_COMMANDS[platform]:
+        executable = command if os.path.isabs(command) else shutil.which(command)
+        if executable and os.path.exists(executable):
+            return executable
+    return None
+
+
+def detect_chrome_version(chrome_binary=None):
+    """
+    Detect the installed Chrome version without any network access.
+
+    Args:
+        chrome_binary (str): Explicit Chrome executable to query
+
+    Returns:
+        str or None: Full version such as "120.0.6099.109", or None if not found
+    """
+    if sys.platform.startswith("win") and not chrome_binary:
+        try:
+            import winreg
+            for hive in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+                for key_path in WINDOWS_REGISTRY_KEYS:
+                    try:
+                        with winreg.OpenKey(hive, key_path) as key:
+                            version, _ = winreg.QueryValueEx(key, "version")
+                            return version
+                    except OSError:
+                        continue
+        except ImportError:
+            pass
+        return None
+
+    executable = find_chrome_executable(chrome_binary)
+    if not executable:
+        return None
+
+    try:
+        output = subprocess.run(
+            [executable, "--version"], capture_output=True, text=True, timeout=10
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+    match = VERSION_PATTERN.search(output)
+    return match.group(0) if match else None
+
+
+class ChromeDriverResolver:
+    """Finds a chromedriver matching the installed Chrome, caching results on disk."""
+
+    def __init__(self, index_file=None, chrome_binary=None, chromedriver_path=None):
+        """
+        Args:
+            index_file (str): JSON index of resolved drivers, keyed by Chrome major version
+            chrome_binary (str): Chrome executable used for version detection
+            chromedriver_path (str): Fixed chromedriver to use, skipping resolution entirely
+        """
+        self.index_file = Path(index_file) if index_file else Path(__file__).parent / ".chromedriver_index.json"
+        self.chrome_binary = chrome_binary
+        self.chromedriver_path = chromedriver_path
+        self.last_resolution = {}
+
+    def load_index(self):
+        """Load the driver index from disk."""
+        if self.index_file.exists():
+            try:
+                with open(self.index_file, 'r') as f:
+                    return json.load(f)
+            except (json.JSONDecodeError, OSError):
+                logger.warning("Chromedriver index is unreadable, rebuilding it")
+        return {}
+
+    def save_index(self, index):
+        """Save the driver index to disk."""
+        try:
+            with open(self.index_file, 'w') as f:
+                json.dump(index, f, indent=2)
+        except OSError as e:
+            logger.warning(f"Could not save chromedriver index: {e}")
+
+    def resolve(self):
+        """
+        Return the path of a chromedriver matching the installed Chrome.
+
+        Returns:
+            str: Path to the chromedriver executable
+        """
+        start = time.perf_counter()
+
+        if self.chromedriver_path:
+            return self._finish(start, self.chromedriver_path, "configured", None)
+
+        chrome_version = detect_chrome_version(self.chrome_binary)
+        key = chrome_version.split(".")[0] if chrome_version else "last"
+
+        index = self.load_index()
+        entry = index.get(key)
+        if entry and os.path.exists(entry["path"]):
+            return self._finish(start, entry["path"], "cache", chrome_version)
+
+        # Cache miss: let webdriver_manager find (and usually download) the driver
+        from webdriver_manager.chrome import ChromeDriverManager
+        path = ChromeDriverManager().install()
+
+        entry = {
+            "path": path,
+            "chrome_version": chrome_version,
+            "resolved_at": datetime.datetime.now().isoformat()
+        }
+        if chrome_version:
+            index[key] = entry
+        index["last"] = entry
+        self.save_index(index)
+
+        return self._finish(start, path, "webdriver_manager", chrome_version)
+
+    def _finish(self, start, path, source, chrome_version):
+        """Record and log how the driver was resolved."""
+        elapsed = time.perf_counter() - start
+        self.last_resolution = {
+            "path": path,
+            "source": source,
+            "chrome_version": chrome_version,
+            "seconds": round(elapsed, 3)
+        }
+        logger.info(f"Resolved chromedriver from {source} in {elapsed:.3f}s (Chrome {chrome_version or 'unknown'})")
+        return path
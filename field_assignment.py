@@ -0,0 +1,263 @@
+"""
+Global field assignment for the Job Application Auto-Fill Bot.
+Scores every form control against every profile field of a page at once and
+solves a one-to-one assignment (Hungarian method), so overlapping selectors
+such as input[name*='start'] can no longer give two profile fields the same
+control or give a field the first loose match instead of the best one.
+"""
+
+import logging
+
+import numpy as np
+
+from field_discovery import parse_selector, field_matches
+from question_classifier import TEXT_ATTRIBUTES, split_words
+
+logger = logging.getLogger(__name__)
+
+# Words that say nothing about which profile field a control is for. They are
+# ignored when judging a control's unrelated words and never count as conflicts.
+GENERIC_WORDS = {
+    "name", "date", "day", "month", "year", "code", "number", "of", "the", "a", "an", "and", "or",
+    "your", "please", "enter", "select", "input", "field", "value", "text", "required"
+}
+
+# Words that only qualify the word before them rather than name another profile
+# field: "Email address" is an email, while "Company address" stays an address
+QUALIFIER_WORDS = {"address": {"email", "mail"}}
+
+# Small preference for earlier (learned or more specific) selectors, only used
+# to break ties between eligible controls
+SELECTOR_WEIGHT = 0.1
+
+
+def tokenize(text):
+    """Set of lower-case words of a text, with camelCase and snake_case broken apart."""
+    return set(split_words(text))
+
+
+def record_tokens(field, compounds=None):
+    """
+    Words of a snapshot record's name, id, placeholder and labels.
+
+    Args:
+        field (dict): Snapshot record
+        compounds (dict): Run-together words such as "firstname" -> the words they stand for
+
+    Returns:
+        set: Lower-case words
+    """
+    tokens = set()
+    for attr in TEXT_ATTRIBUTES:
+        words = split_words(field.get(attr))
+        tokens.update(
+            word for index, word in enumerate(words)
+            if not (index and words[index - 1] in QUALIFIER_WORDS.get(word, ()))
+        )
+    for token in list(tokens):
+        tokens |= (compounds or {}).get(token, set())
+    return tokens
+
+
+def linear_assignment(scores):
+    """
+    Solve a maximum-score one-to-one assignment with the Hungarian method
+    (shortest augmenting paths, vectorized over columns).
+
+    Every row may also stay unassigned: the cost matrix is padded with one
+    zero-cost dummy column per row, so a weak extra pair never displaces a
+    stronger one.
+
+    Args:
+        scores (ndarray): Rows x columns score matrix; pairs scoring 0 or less are never assigned
+
+    Returns:
+        list: (row, column) pairs
+    """
+    scores = np.asarray(scores, dtype=float)
+    transposed = scores.shape[0] > scores.shape[1]
+    if transposed:
+        scores = scores.T
+    rows, real_cols = scores.shape
+    if not rows:
+        return []
+
+    # Minimize cost; ineligible pairs cost more than staying unassigned
+    cost = np.hstack([np.where(scores > 0, -scores, 1.0), np.zeros((rows, rows))])
+    cols = cost.shape[1]
+
+    # Potentials and matches are 1-based, column 0 is the virtual start column
+    u = np.zeros(rows + 1)
+    v = np.zeros(cols + 1)
+    match = np.zeros(cols + 1, dtype=int)  # row matched to each column, 0 = none
+    way = np.zeros(cols + 1, dtype=int)
+    for row in range(1, rows + 1):
+        match[0] = row
+        col = 0
+        min_cost = np.full(cols + 1, np.inf)
+        used = np.zeros(cols + 1, dtype=bool)
+        while True:
+            used[col] = True
+            current_row = match[col]
+            free = ~used[1:]
+            reduced = cost[current_row - 1] - u[current_row] - v[1:]
+            better = free & (reduced < min_cost[1:])
+            min_cost[1:][better] = reduced[better]
+            way[1:][better] = col
+            candidates = np.where(free, min_cost[1:], np.inf)
+            next_col = int(np.argmin(candidates)) + 1
+            delta = candidates[next_col - 1]
+            u[match[used]] += delta
+            v[used] -= delta
+            min_cost[1:][free] -= delta
+            col = next_col
+            if match[col] == 0:
+                break
+        while col:
+            previous = way[col]
+            match[col] = match[previous]
+            col = previous
+
+    pairs = []
+    for col in range(1, real_cols + 1):
+        row = match[col] - 1
+        if match[col] and scores[row, col - 1] > 0:
+            pairs.append((col - 1, row) if transposed else (row, col - 1))
+    return pairs
+
+
+class FieldAssigner:
+    """Assigns the controls of a page snapshot to profile fields in one solve."""
+
+    def __init__(self, records):
+        """
+        Args:
+            records (list): Usable snapshot records that may receive a profile value
+        """
+        self.records = records
+
+    def selector_hits(self, selectors):
+        """
+        Find the earliest selector that matches each record.
+
+        Returns:
+            tuple: (index of the matching selector per record or -1, whether that
+            selector is exact, e.g. input[type='email'], per record)
+        """
+        matched = np.full(len(self.records), -1)
+        exact = np.zeros(len(self.records), dtype=bool)
+        for rank, selector in enumerate(selectors):
+            parsed = parse_selector(selector)
+            if parsed is None:
+                continue
+            hits = np.array([field_matches(record, parsed) for record in self.records], dtype=bool)
+            hits &= matched < 0
+            matched[hits] = rank
+            exact[hits] = parsed[2] == "="
+        return matched, exact
+
+    def score_matrix(self, wanted):
+        """
+        Build the record x profile field score matrix.
+
+        A record is eligible for a field when one of the field's selectors matches
+        it and the record's words support it: coverage (the share of the field's
+        own words it contains, or 1 for a synonym from the selectors) must exceed
+        noise (the share of its words that are unrelated to the field), and none
+        of its words may be distinctive of another profile field that claims the
+        record too, by its selectors or by making up all of its words. "Start
+        date" is therefore no end date, while "Email address" is still an email.
+        Records matched by an exact selector are always eligible. Eligible pairs
+        score coverage - noise (1 for exact selectors), plus a small preference
+        for earlier selectors; all other pairs score 0.
+
+        Args:
+            wanted (list): (field_name, selectors) pairs
+
+        Returns:
+            tuple: (scores array, matching selector index array), both records x fields
+        """
+        own_words, known_words, compounds = [], [], {}
+        for field_name, selectors in wanted:
+            words = tokenize(field_name)
+            compounds["".join(split_words(field_name))] = words
+            known = set(words)
+            for selector in selectors:
+                parsed = parse_selector(selector)
+                if parsed and parsed[3]:
+                    needle = tokenize(parsed[3])
+                    known |= needle
+                    if len(needle) > 1:
+                        compounds["".join(split_words(parsed[3]))] = needle
+            own_words.append(words)
+            known_words.append(known)
+
+        tokens = [record_tokens(record, compounds) for record in self.records]
+        vocabulary = sorted(set().union(*tokens, *known_words))
+        position = {token: index for index, token in enumerate(vocabulary)}
+
+        def word_matrix(word_sets):
+            matrix = np.zeros((len(word_sets), len(vocabulary)))
+            for row, words in enumerate(word_sets):
+                matrix[row, [position[word] for word in words]] = 1.0
+            return matrix
+
+        record_words = word_matrix(tokens)
+        field_words = word_matrix(own_words)
+        known = word_matrix(known_words)
+        synonyms = known * (1.0 - field_words)
+        specific = 1.0 - word_matrix([GENERIC_WORDS & set(vocabulary)])[0]
+        specific_words = record_words * specific
+
+        matched = np.full((len(self.records), len(wanted)), -1)
+        exact = np.zeros((len(self.records), len(wanted)), dtype=bool)
+        for col, (_, selectors) in enumerate(wanted):
+            matched[:, col], exact[:, col] = self.selector_hits(selectors)
+
+        coverage = (record_words @ field_words.T) / np.maximum(field_words.sum(axis=1), 1.0)
+        coverage = np.maximum(coverage, (record_words @ synonyms.T) > 0)
+
+        word_counts = specific_words.sum(axis=1, keepdims=True)
+        noise = (word_counts - specific_words @ known.T) / np.maximum(word_counts, 1.0)
+
+        # A record conflicts with a field when it holds a word that is distinctive of
+        # another field which also claims it: that field's selectors match it too, or
+        # that field's words make up all of its text
+        distinctive = field_words * specific
+        claimed = (matched >= 0) | ((specific_words @ (1.0 - known).T == 0) & (word_counts > 0))
+        # [record, field, other]: the record has a word distinctive of other, unknown to field
+        clashes = np.einsum("rv,fv,gv->rfg", specific_words, 1.0 - known, distinctive) > 0
+        conflict = (clashes & claimed[:, None, :]).any(axis=2)
+
+        preference = np.zeros(matched.shape)
+        for col, (_, selectors) in enumerate(wanted):
+            preference[:, col] = 1.0 - matched[:, col] / len(selectors)
+
+        # An exact selector such as input[type='email'] is enough on its own
+        base = np.where(exact, 1.0, coverage - noise)
+        eligible = (matched >= 0) & (base > 0) & (exact | ~conflict)
+        # Earlier controls win remaining ties, e.g. "Address line 1" over "line 2"
+        order = np.arange(len(self.records))[:, None] * 1e-6
+        scores = np.where(eligible, base + SELECTOR_WEIGHT * preference - order, 0.0)
+        return scores, matched
+
+    def assign(self, wanted):
+        """
+        Pick the control for every profile field at once.
+
+        Args:
+            wanted (list): (field_name, selectors) pairs; selectors in the order to prefer them
+
+        Returns:
+            dict: field_name -> (record, matching selector) for every assigned field
+        """
+        if not self.records or not wanted:
+            return {}
+
+        scores, matched = self.score_matrix(wanted)
+        assignment = {}
+        for row, col in linear_assignment(scores):
+            field_name, selectors = wanted[col]
+            assignment[field_name] = (self.records[row], selectors[matched[row, col]])
+        logger.debug(f"Assigned {len(assignment)} of {len(wanted)} fields among {len(self.records)} controls")
+        return assignment
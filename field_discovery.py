@@ -0,0 +1,480 @@
+"""
+Field discovery for the Job Application Auto-Fill Bot.
+Collects every form control on the page in a single script call so that
+selector matching can happen in Python instead of one WebDriver lookup per selector.
+"""
+
+import re
+import time
+import logging
+
+from label_proximity import infer_labels
+
+logger = logging.getLogger(__name__)
+
+# Helpers shared by the snapshot scripts. describeControl() registers a control
+# in window.__autofill.registry, so it is addressed afterwards by its handle (index
+# into the registry) wherever it lives in the DOM, and returns its snapshot record.
+SNAPSHOT_FUNCTIONS = """
+var state = window.__autofill = window.__autofill || {registry: []};
+var registry = state.registry;
+
+function clean(text) {
+    return (text || '').replace(/\\s+/g, ' ').trim();
+}
+
+function labelText(el) {
+    if (el.labels && el.labels.length) {
+        return clean(el.labels[0].innerText || el.labels[0].textContent);
+    }
+    var labelledBy = el.getAttribute('aria-labelledby');
+    if (labelledBy) {
+        var root = el.getRootNode();
+        var scope = root.getElementById ? root : document;
+        var parts = labelledBy.split(/\\s+/).map(function (id) {
+            var node = scope.getElementById(id);
+            return node ? node.textContent : '';
+        });
+        var text = clean(parts.join(' '));
+        if (text) {
+            return text;
+        }
+    }
+    var wrapping = el.closest('label');
+    return wrapping ? clean(wrapping.innerText || wrapping.textContent) : '';
+}
+
+function isHidden(el) {
+    if (el.getAttribute('aria-hidden') === 'true') {
+        return true;
+    }
+    var style = window.getComputedStyle(el);
+    return style.display === 'none' || style.visibility === 'hidden';
+}
+
+// Text a node contributes to an accessible name: hidden content is skipped and
+// embedded controls contribute their current value instead of their markup
+function nameFromContent(node, self) {
+    if (node.nodeType === Node.TEXT_NODE) {
+        return node.textContent;
+    }
+    if (node.nodeType !== Node.ELEMENT_NODE || node === self || isHidden(node)) {
+        return '';
+    }
+    var tag = node.tagName;
+    if (tag === 'SCRIPT' || tag === 'STYLE' || tag === 'TEMPLATE') {
+        return '';
+    }
+    if (tag === 'SELECT') {
+        return node.selectedOptions.length ? node.selectedOptions[0].text : '';
+    }
+    if (tag === 'INPUT' || tag === 'TEXTAREA') {
+        return node.value || '';
+    }
+    if (tag === 'IMG') {
+        return node.getAttribute('alt') || '';
+    }
+    return clean(node.getAttribute('aria-label')) || childText(node, self);
+}
+
+function childText(node, self) {
+    var parts = [];
+    for (var c = 0; c < node.childNodes.length; c++) {
+        parts.push(nameFromContent(node.childNodes[c], self));
+    }
+    return parts.join(' ');
+}
+
+// Computed accessible name of a control, following the order of the accessible
+// name computation: aria-labelledby, aria-label, associated labels, then title
+// and placeholder
+function accessibleName(el) {
+    var labelledBy = (el.getAttribute('aria-labelledby') || '').trim();
+    if (labelledBy) {
+        var root = el.getRootNode();
+        var scope = root.getElementById ? root : document;
+        var referenced = clean(labelledBy.split(/\\s+/).map(function (id) {
+            var node = scope.getElementById(id);
+            return node ? clean(node.getAttribute('aria-label')) || childText(node, el) : '';
+        }).join(' '));
+        if (referenced) {
+            return referenced;
+        }
+    }
+    var ariaLabel = clean(el.getAttribute('aria-label'));
+    if (ariaLabel) {
+        return ariaLabel;
+    }
+    if (el.labels && el.labels.length) {
+        var labelled = clean(Array.prototype.map.call(el.labels, function (label) {
+            return childText(label, el);
+        }).join(' '));
+        if (labelled) {
+            return labelled;
+        }
+    }
+    return clean(el.getAttribute('title') || el.getAttribute('placeholder') || el.getAttribute('aria-placeholder'));
+}
+
+function isVisible(el) {
+    if (!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)) {
+        return false;
+    }
+    var style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none';
+}
+
+// Document order, with shadow root contents in place of their host
+function collectControls(root, controls) {
+    var nodes = root.querySelectorAll('*');
+    for (var i = 0; i < nodes.length; i++) {
+        var node = nodes[i];
+        var tag = node.tagName;
+        if (tag === 'INPUT' || tag === 'SELECT' || tag === 'TEXTAREA') {
+            controls.push(node);
+        }
+        if (node.shadowRoot) {
+            collectControls(node.shadowRoot, controls);
+        }
+    }
+    return controls;
+}
+
+// Position on the page as [left, top, width, height], for pairing controls with nearby text
+function pageBox(rect) {
+    return [
+        Math.round(rect.left + window.scrollX), Math.round(rect.top + window.scrollY),
+        Math.round(rect.width), Math.round(rect.height)
+    ];
+}
+
+// Option texts and values of a select, so choices can be matched in Python
+function optionList(el) {
+    var options = [];
+    for (var j = 0; j < el.options.length && j < 500; j++) {
+        options.push({text: clean(el.options[j].text), value: el.options[j].value});
+    }
+    return options;
+}
+
+function describeControl(el) {
+    if (el.__autofillHandle === undefined) {
+        el.__autofillHandle = registry.length;
+        registry.push(el);
+    }
+    var field = {
+        handle: el.__autofillHandle,
+        tag: el.tagName.toLowerCase(),
+        type: (el.getAttribute('type') || '').toLowerCase(),
+        name: el.getAttribute('name') || '',
+        id: el.id || '',
+        placeholder: el.getAttribute('placeholder') || '',
+        aria_label: el.getAttribute('aria-label') || '',
+        label: labelText(el),
+        accessible_name: accessibleName(el),
+        value: el.value || '',
+        visible: isVisible(el),
+        enabled: !el.disabled && !el.readOnly,
+        in_shadow: el.getRootNode() !== document,
+        box: pageBox(el.getBoundingClientRect())
+    };
+    if (el.tagName === 'SELECT') {
+        field.options = optionList(el);
+    }
+    return field;
+}
+"""
+
+# Collects every input/select/textarea on the page in one round trip, including
+# controls inside open shadow roots of web components.
+SNAPSHOT_SCRIPT = SNAPSHOT_FUNCTIONS + """
+return collectControls(document, []).map(describeControl);
+"""
+
+# Visible text blocks of the page with their positions, so controls without a
+# label can be paired with question text rendered in plain elements. Text inside
+# labels, buttons and controls is left out; a block containing a control only
+# contributes its own text node.
+TEXT_BLOCKS_SCRIPT = """
+var MAX_BLOCKS = 2000;
+var SKIP = 'label, option, select, textarea, button, script, style, noscript, template';
+var blocks = [];
+var seen = new Set();
+
+function box(rect) {
+    return [
+        Math.round(rect.left + window.scrollX), Math.round(rect.top + window.scrollY),
+        Math.round(rect.width), Math.round(rect.height)
+    ];
+}
+
+var walker = document.createTreeWalker(document.body || document.documentElement, NodeFilter.SHOW_TEXT);
+var range = document.createRange();
+var node;
+while ((node = walker.nextNode()) && blocks.length < MAX_BLOCKS) {
+    var own = node.textContent.replace(/\\s+/g, ' ').trim();
+    var parent = node.parentElement;
+    if (own.length < 2 || !parent || parent.closest(SKIP)) {
+        continue;
+    }
+    var block = parent;
+    while (block.parentElement && block !== document.body
+           && window.getComputedStyle(block).display.indexOf('inline') === 0) {
+        block = block.parentElement;
+    }
+    var text, rect;
+    if (block.querySelector('input, select, textarea')) {
+        range.selectNodeContents(node);
+        text = own;
+        rect = range.getBoundingClientRect();
+    } else {
+        if (seen.has(block)) {
+            continue;
+        }
+        seen.add(block);
+        text = (block.innerText || '').replace(/\\s+/g, ' ').trim();
+        rect = block.getBoundingClientRect();
+    }
+    if (text && text.length <= 300 && rect.width && rect.height) {
+        blocks.push({text: text, box: box(rect)});
+    }
+}
+return blocks;
+"""
+
+# Snapshot plus text blocks and the number of child frames, so frames are
+# enumerated while snapshotting
+FRAME_SNAPSHOT_SCRIPT = (
+    "var fields = (function () {\n" + SNAPSHOT_SCRIPT + "\n})();\n"
+    "var texts = (function () {\n" + TEXT_BLOCKS_SCRIPT + "\n})();\n"
+    "return {fields: fields, texts: texts, frames: window.frames.length};"
+)
+
+# Frames are searched breadth-first up to this depth and count
+MAX_FRAME_DEPTH = 3
+MAX_FRAMES = 20
+
+RESOLVE_SCRIPT = "return window.__autofill ? window.__autofill.registry[arguments[0]] : null;"
+
+# Options of one select element, for matching a value that is not an exact option text
+OPTIONS_SCRIPT = """
+return Array.prototype.map.call(arguments[0].options, function (option) {
+    return {text: (option.text || '').replace(/\\s+/g, ' ').trim(), value: option.value};
+});
+"""
+
+# Simple CSS selectors of the form tag[attr*='value'] used by the field mappings
+SELECTOR_PATTERN = re.compile(
+    r"^(?P<tag>[a-z]+)?(?:\[(?P<attr>[\w-]+)(?:(?P<op>[*^$]?=)'(?P<value>[^']*)')?\])?$"
+)
+
+# Attributes available on every snapshot record
+SNAPSHOT_ATTRIBUTES = {"name", "id", "placeholder", "type", "aria-label"}
+
+
+def parse_selector(selector):
+    """
+    Parse a simple CSS selector into (tag, attribute, operator, value).
+
+    Args:
+        selector (str): CSS selector such as "input[name*='first']"
+
+    Returns:
+        tuple or None: Parsed parts, or None if the selector is too complex
+    """
+    match = SELECTOR_PATTERN.match(selector.strip())
+    if not match or not (match.group("tag") or match.group("attr")):
+        return None
+
+    attr = match.group("attr")
+    if attr and attr not in SNAPSHOT_ATTRIBUTES:
+        return None
+
+    return match.group("tag"), attr, match.group("op"), match.group("value")
+
+
+def field_matches(field, parsed_selector):
+    """
+    Check whether a snapshot record matches a parsed selector.
+
+    Matching follows CSS semantics, so attribute values are case-sensitive.
+    """
+    tag, attr, op, expected = parsed_selector
+    if tag and field["tag"] != tag:
+        return False
+    if not attr:
+        return True
+
+    actual = field.get(attr.replace("-", "_"), "")
+    if op is None:
+        return bool(actual)
+    if op == "=":
+        return actual == expected
+    if op == "*=":
+        return bool(expected) and expected in actual
+    if op == "^=":
+        return bool(expected) and actual.startswith(expected)
+    if op == "$=":
+        return bool(expected) and actual.endswith(expected)
+    return False
+
+
+class FieldSnapshot:
+    """A point-in-time list of the form controls found on a page."""
+
+    def __init__(self, fields):
+        self.fields = fields
+
+    def __len__(self):
+        return len(self.fields)
+
+    def find_all(self, selector, usable_only=True):
+        """
+        Return all snapshot records matching a selector, in document order.
+
+        Args:
+            selector (str): CSS selector to match
+            usable_only (bool): Only return visible, enabled controls
+
+        Returns:
+            list or None: Matching records, or None if the selector cannot be
+            evaluated against the snapshot
+        """
+        parsed = parse_selector(selector)
+        if parsed is None:
+            return None
+
+        return [
+            field for field in self.fields
+            if field_matches(field, parsed)
+            and (not usable_only or (field["visible"] and field["enabled"]))
+        ]
+
+    def find(self, selectors):
+        """
+        Find the first usable control matching the selectors, tried in order.
+
+        Args:
+            selectors (list): List of CSS selectors to try
+
+        Returns:
+            tuple: (record or None, list of selectors that could not be evaluated)
+        """
+        field, _, unparsed = self.locate(selectors)
+        return field, unparsed
+
+    def locate(self, selectors):
+        """
+        Like find(), but also report which selector matched.
+
+        Returns:
+            tuple: (record or None, matching selector or None, list of selectors
+            that could not be evaluated)
+        """
+        unparsed = []
+        for selector in selectors:
+            matches = self.find_all(selector)
+            if matches is None:
+                unparsed.append(selector)
+            elif matches:
+                return matches[0], selector, unparsed
+
+        return None, None, unparsed
+
+
+class FrameNavigator:
+    """Switches the driver between frames, skipping switches to the frame it is already in."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.current = ()
+
+    def switch(self, frame):
+        """
+        Switch to a frame.
+
+        Args:
+            frame (tuple): Path of window.frames indexes from the top document
+        """
+        frame = tuple(frame or ())
+        if frame == self.current:
+            return
+        if frame[:len(self.current)] != self.current:
+            self.reset()
+        for index in frame[len(self.current):]:
+            self.driver.switch_to.frame(index)
+            self.current += (index,)
+
+    def reset(self):
+        """Switch back to the top document."""
+        self.driver.switch_to.default_content()
+        self.current = ()
+
+
+class FieldDiscovery:
+    """Takes field snapshots and resolves snapshot records back to elements."""
+
+    def __init__(self, driver, frames=None):
+        """
+        Args:
+            driver (WebDriver): Driver of the page to inspect
+            frames (FrameNavigator): Shared frame navigator
+        """
+        self.driver = driver
+        self.frames = frames or FrameNavigator(driver)
+
+    def snapshot(self):
+        """
+        Collect every form control on the current page, including those in
+        iframes, with one script call per frame.
+
+        Records from iframes carry the frame path they were found in.
+
+        Returns:
+            FieldSnapshot: Snapshot of the page's form controls
+        """
+        start = time.perf_counter()
+        self.frames.reset()
+        fields = []
+        pending = [()]
+        visited = 0
+        while pending and visited < MAX_FRAMES:
+            frame = pending.pop(0)
+            visited += 1
+            try:
+                self.frames.switch(frame)
+                result = self.driver.execute_script(FRAME_SNAPSHOT_SCRIPT)
+            except Exception as e:
+                if not frame:
+                    raise
+                logger.debug(f"Skipping frame {list(frame)}: {e}")
+                self.frames.reset()
+                continue
+
+            # Boxes are relative to each frame, so labels are inferred per frame
+            infer_labels(result["fields"], result.get("texts") or [])
+            for field in result["fields"]:
+                if frame:
+                    field["frame"] = list(frame)
+                fields.append(field)
+            if len(frame) < MAX_FRAME_DEPTH:
+                pending.extend(frame + (index,) for index in range(result["frames"]))
+
+        self.frames.reset()
+        elapsed = time.perf_counter() - start
+
+        logger.info(f"Discovered {len(fields)} form controls in {visited} frame(s) in {elapsed:.3f}s")
+        return FieldSnapshot(fields)
+
+    def resolve(self, field):
+        """
+        Get the WebElement for a snapshot record.
+
+        Args:
+            field (dict): Snapshot record
+
+        Returns:
+            WebElement or None: The element, or None if it is gone
+        """
+        self.frames.switch(field.get("frame"))
+        return self.driver.execute_script(RESOLVE_SCRIPT, field["handle"])
@@ -0,0 +1,188 @@
+"""
+Dependent field detection for the Job Application Auto-Fill Bot.
+Watches the page with a MutationObserver while it is being filled, so controls
+revealed by earlier answers (a state field after picking a country, follow-up
+questions after a checkbox) are handed back in batches and filled too, without
+snapshotting the whole page again.
+"""
+
+import time
+import logging
+
+from field_discovery import SNAPSHOT_FUNCTIONS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WATCH_SETTINGS = {
+    "enabled": True,  # Fill controls that appear after other fields are filled
+    "deadline": 5,  # Seconds to keep watching after the first fill at most
+    "quiet_ms": 400,  # The page counts as settled once it has not changed for this long
+    "max_rounds": 5,  # Fill rounds for newly revealed controls
+    "poll_interval": 0.1
+}
+
+# Buffers every control that is added to the document, or whose element or
+# ancestor changes an attribute that shows, hides, enables or disables it, in
+# window.__autofill.pending, and records when the page last changed. Mutations
+# of elements without controls, and class or style changes that leave display,
+# visibility and the disabled state as they were (animations, spinners), do not
+# count as changes, so they cannot keep the page from ever going quiet.
+WATCH_SCRIPT = """
+var state = window.__autofill = window.__autofill || {registry: []};
+var CONTROLS = 'input, select, textarea';
+if (state.observer) {
+    state.observer.disconnect();
+}
+state.pending = new Set();
+state.shown = new WeakMap();
+state.lastMutation = performance.now();
+
+function hasControls(node) {
+    return node.nodeType === Node.ELEMENT_NODE && (node.matches(CONTROLS) || node.querySelector(CONTROLS) !== null);
+}
+
+function queue(node) {
+    if (node.matches(CONTROLS)) {
+        state.pending.add(node);
+    }
+    var nested = node.querySelectorAll(CONTROLS);
+    for (var i = 0; i < nested.length; i++) {
+        state.pending.add(nested[i]);
+    }
+}
+
+function shownChanged(element) {
+    var style = getComputedStyle(element);
+    var shown = [style.display, style.visibility, element.hidden, element.disabled, element.getAttribute('aria-hidden')].join('|');
+    var changed = state.shown.get(element) !== shown;
+    state.shown.set(element, shown);
+    return changed;
+}
+
+state.observer = new MutationObserver(function (mutations) {
+    var changed = false;
+    for (var m = 0; m < mutations.length; m++) {
+        var mutation = mutations[m];
+        if (mutation.type === 'childList') {
+            for (var n = 0; n < mutation.addedNodes.length; n++) {
+                if (hasControls(mutation.addedNodes[n])) {
+                    queue(mutation.addedNodes[n]);
+                    changed = true;
+                }
+            }
+            for (var r = 0; r < mutation.removedNodes.length; r++) {
+                changed = changed || hasControls(mutation.removedNodes[r]);
+            }
+        } else if (hasControls(mutation.target) && shownChanged(mutation.target)) {
+            queue(mutation.target);
+            changed = true;
+        }
+    }
+    if (changed) {
+        state.lastMutation = performance.now();
+    }
+});
+state.observer.observe(document.documentElement, {
+    childList: true,
+    subtree: true,
+    attributes: true,
+    attributeFilter: ['style', 'class', 'hidden', 'disabled', 'aria-hidden']
+});
+return true;
+"""
+
+# Hands back snapshot records of the buffered controls that are attached and
+# visible, empties the buffer, and reports how long the page has been quiet.
+NEW_FIELDS_SCRIPT = SNAPSHOT_FUNCTIONS + """
+var pending = state.pending ? Array.from(state.pending) : [];
+if (state.pending) {
+    state.pending.clear();
+}
+var fields = [];
+for (var p = 0; p < pending.length; p++) {
+    if (pending[p].isConnected && isVisible(pending[p])) {
+        fields.push(describeControl(pending[p]));
+    }
+}
+return {
+    fields: fields,
+    quiet_ms: state.observer ? performance.now() - state.lastMutation : null
+};
+"""
+
+UNWATCH_SCRIPT = """
+var state = window.__autofill;
+if (state && state.observer) {
+    state.observer.disconnect();
+    state.observer = null;
+    state.pending = null;
+}
+"""
+
+
+class FieldWatcher:
+    """Collects controls that appear on the page while it is being filled."""
+
+    def __init__(self, driver, settings=None):
+        """
+        Args:
+            driver (WebDriver): Driver showing the page, switched to the top document
+            settings (dict): Overrides for DEFAULT_WATCH_SETTINGS
+        """
+        self.driver = driver
+        self.settings = dict(DEFAULT_WATCH_SETTINGS)
+        self.settings.update(settings or {})
+
+    @property
+    def enabled(self):
+        return bool(self.settings["enabled"])
+
+    def start(self):
+        """Start buffering new controls on the current page."""
+        self.driver.execute_script(WATCH_SCRIPT)
+
+    def stop(self):
+        """Stop watching the page."""
+        try:
+            self.driver.execute_script(UNWATCH_SCRIPT)
+        except Exception as e:
+            logger.debug(f"Could not stop watching the page: {e}")
+
+    def collect(self, known, deadline):
+        """
+        Wait for controls that are not known yet, until the page has been quiet
+        for quiet_ms or the deadline passes.
+
+        Args:
+            known (set): Handles of controls that were already considered
+            deadline (float): time.perf_counter() value to stop waiting at
+
+        Returns:
+            list: Snapshot records of new, visible and enabled controls, empty
+            once the page is quiet
+        """
+        while True:
+            result = self.driver.execute_script(NEW_FIELDS_SCRIPT)
+            if result["quiet_ms"] is None:
+                logger.debug("Page was replaced, no longer watching it")
+                return []
+            fresh = [field for field in result["fields"] if field["enabled"] and field["handle"] not in known]
+            if fresh:
+                return fresh
+            if result["quiet_ms"] >= self.settings["quiet_ms"] or time.perf_counter() >= deadline:
+                return []
+            time.sleep(self.settings["poll_interval"])
+
+    def wait_until_quiet(self, deadline):
+        """
+        Wait until the page has stopped changing, or the deadline passes.
+
+        Args:
+            deadline (float): time.perf_counter() value to stop waiting at
+        """
+        known = set()
+        while True:
+            fresh = self.collect(known, deadline)
+            if not fresh:
+                return
+            known.update(field["handle"] for field in fresh)
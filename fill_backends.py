@@ -0,0 +1,189 @@
+"""
+Browser automation backends for the Job Application Auto-Fill Bot.
+Every backend fills a list of URLs and reports one result dict per URL, so callers
+such as batch mode can switch between Selenium and the asyncio CDP backend.
+"""
+
+import os
+import time
+import asyncio
+import logging
+import multiprocessing
+from multiprocessing.util import Finalize
+
+import config
+
+logger = logging.getLogger(__name__)
+
+
+class FillBackend:
+    """Interface shared by all fill backends."""
+
+    name = None
+
+    def __init__(self, concurrency=1, headless=None, keep_pages_open=False):
+        """
+        Args:
+            concurrency (int): Number of URLs filled at the same time
+            headless (bool): Run Chrome without a window, defaults to BROWSER_SETTINGS["headless"]
+            keep_pages_open (bool): Leave every filled page open for review
+        """
+        self.concurrency = max(1, concurrency)
+        self.headless = config.BROWSER_SETTINGS["headless"] if headless is None else headless
+        self.keep_pages_open = keep_pages_open
+
+    def fill_urls(self, urls, on_result=None):
+        """
+        Fill every URL.
+
+        Args:
+            urls (list): Application URLs
+            on_result (callable): Called with each result as soon as it is ready
+
+        Returns:
+            list: One result dict per URL with url, status, fields_filled,
+            report and seconds (or error)
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """Release any browser the backend still holds."""
+
+
+class SeleniumBackend(FillBackend):
+    """Fills pages with a JobApplicationFiller, one browser per worker process."""
+
+    name = "selenium"
+
+    def __init__(self, concurrency=1, headless=None, keep_pages_open=False):
+        # Each worker process fills its URLs one after another, in a new tab
+        # per URL when keep_pages_open is set
+        super().__init__(concurrency, headless, keep_pages_open)
+        self.filler = None
+
+    def fill_url(self, url):
+        """
+        Fill one URL in this process, restarting the browser afterwards if the fill failed.
+
+        Returns:
+            dict: Result record for the URL
+        """
+        from form_filler import JobApplicationFiller, create_chrome_driver
+
+        start = time.perf_counter()
+        result = {"url": url, "worker": os.getpid()}
+        try:
+            if self.filler is None:
+                self.filler = JobApplicationFiller(driver=create_chrome_driver(self.headless))
+            elif self.keep_pages_open:
+                self.filler.driver.switch_to.new_window("tab")
+            result["fields_filled"] = self.filler.auto_fill_application(url, notify=False)
+            result["status"] = "ok"
+            result["report"] = self.filler.run_report
+        except Exception as e:
+            result["status"] = "error"
+            result["error"] = str(e)
+            # Start a fresh browser for the next URL in case this one died
+            self.quit_browser()
+
+        result["seconds"] = round(time.perf_counter() - start, 3)
+        return result
+
+    def fill_urls(self, urls, on_result=None):
+        results = []
+        if self.concurrency == 1 or len(urls) < 2:
+            for url in urls:
+                results.append(self.fill_url(url))
+                if on_result:
+                    on_result(results[-1])
+            return results
+
+        workers = min(self.concurrency, len(urls))
+        pool = multiprocessing.Pool(
+            workers, initializer=_init_worker, initargs=(self.headless, self.keep_pages_open)
+        )
+        try:
+            for result in pool.imap_unordered(_fill_in_worker, urls):
+                results.append(result)
+                if on_result:
+                    on_result(result)
+            pool.close()
+        except BaseException:
+            pool.terminate()
+            raise
+        finally:
+            pool.join()
+        return results
+
+    def quit_browser(self):
+        """Quit this process's browser, if one was started."""
+        if self.filler is not None:
+            from form_filler import quit_chrome_driver
+
+            try:
+                quit_chrome_driver(self.filler.driver)
+            except Exception as e:
+                logger.debug(f"Error closing browser: {e}")
+            self.filler = None
+
+    def close(self):
+        if not self.keep_pages_open:
+            self.quit_browser()
+
+
+# Per-process Selenium backend of a worker pool, created by the pool initializer
+_worker_backend = None
+
+
+def _init_worker(headless, keep_pages_open):
+    """Start the backend owned by this worker process."""
+    global _worker_backend
+    _worker_backend = SeleniumBackend(headless=headless, keep_pages_open=keep_pages_open)
+    Finalize(_worker_backend, _worker_backend.close, exitpriority=10)
+
+
+def _fill_in_worker(url):
+    """Fill one URL with this worker's browser."""
+    return _worker_backend.fill_url(url)
+
+
+class CDPBackend(FillBackend):
+    """Fills many pages concurrently over the Chrome DevTools Protocol."""
+
+    name = "cdp"
+
+    def fill_urls(self, urls, on_result=None):
+        from cdp_backend import AsyncCDPFiller
+
+        filler = AsyncCDPFiller(self.concurrency, self.headless, self.keep_pages_open)
+        return asyncio.run(filler.fill_urls(urls, on_result))
+
+
+BACKENDS = {
+    SeleniumBackend.name: SeleniumBackend,
+    CDPBackend.name: CDPBackend
+}
+
+
+def create_backend(name=None, **kwargs):
+    """
+    Create a fill backend by name.
+
+    Both backends fill the same plan for the same page, but the CDP backend only
+    covers single-page forms in the top document. It does not yet:
+      - fill controls inside iframes
+      - fill dependent fields revealed by earlier answers
+      - write or resume from checkpoints
+      - continue through multi-step (wizard) applications
+
+    Args:
+        name (str): "selenium" or "cdp", defaults to BROWSER_SETTINGS["backend"]
+        **kwargs: concurrency, headless and keep_pages_open, see FillBackend
+
+    Returns:
+        FillBackend: The backend instance
+    """
+    name = name or config.BROWSER_SETTINGS.get("backend", "selenium")
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown backend '{name}', expected one of: {', '.join(BACKENDS)}")
+    return BACKENDS[name](**kwargs)
@@ -0,0 +1,189 @@
+"""
+Crash-safe fill checkpoints for the Job Application Auto-Fill Bot.
+Stores the fill plan of each URL, with stable locators instead of page-session
+handles, so a re-run after a browser crash can skip discovery and only fill what
+is missing.
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+import tempfile
+from pathlib import Path
+
+from batch_filler import FillPlan
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT_SETTINGS = {
+    "enabled": True,
+    "directory": None,  # Defaults to .fill_checkpoints next to this module
+    "ttl_hours": 24  # Older checkpoints are ignored and overwritten
+}
+
+
+def stable_locator(field):
+    """
+    Build a CSS selector that finds a snapshot record's control again after a reload.
+
+    Args:
+        field (dict): Snapshot record
+
+    Returns:
+        str or None: Selector by id, name, aria-label or placeholder, or None if
+        the control has none of them
+    """
+    for attr, key in (("id", "id"), ("name", "name"), ("aria-label", "aria_label"), ("placeholder", "placeholder")):
+        value = field.get(key)
+        if value:
+            escaped = value.replace("\\", "\\\\").replace("'", "\\'")
+            return f"{field['tag']}[{attr}='{escaped}']"
+    return None
+
+
+class FillCheckpoint:
+    """The planned fields of one URL, by stable locator and fill round."""
+
+    def __init__(self, path, url, data=None):
+        self.path = path
+        self.url = url
+        self.data = data or {"url": url, "updated": time.time(), "entries": [], "unlocated": [], "planned": False}
+
+    @property
+    def entries(self):
+        return self.data["entries"]
+
+    @property
+    def unlocated(self):
+        """Planned fields whose control has no stable locator and must be discovered again."""
+        return self.data.get("unlocated", [])
+
+    @property
+    def planned(self):
+        """True once the whole plan of the page has been recorded."""
+        return bool(self.data.get("planned"))
+
+    def record_plan(self, entries):
+        """
+        Record the complete plan of the page in one save and mark it complete,
+        so a resume never starts from the entries of a partial plan.
+
+        Args:
+            entries (list): FillPlan entries, including any already filled from an ATS field map
+        """
+        self.add_entries(entries)
+        self.data["planned"] = True
+        self.save()
+
+    def record_entries(self, entries, fill_round):
+        """
+        Add entries of controls revealed by earlier values, and save.
+
+        Args:
+            entries (list): FillPlan entries
+            fill_round (int): Fill round that found them, 1 for the first
+                controls revealed after the page plan was written
+        """
+        self.add_entries(entries, fill_round)
+        self.save()
+
+    def add_entries(self, entries, fill_round=0):
+        """Add FillPlan entries by stable locator, skipping fields that are already known."""
+        known = {entry["field_name"] for entry in self.entries} | set(self.unlocated)
+        for entry in entries:
+            if entry["field_name"] in known:
+                continue
+            known.add(entry["field_name"])
+            selector = entry.get("selector") or stable_locator(entry["field"])
+            if selector is None:
+                self.data.setdefault("unlocated", []).append(entry["field_name"])
+                continue
+            self.entries.append({
+                "field_name": entry["field_name"],
+                "selector": selector,
+                "frame": list(entry["frame"]),
+                "value": entry["value"],
+                "kind": entry["kind"],
+                "round": fill_round
+            })
+
+    def rounds(self):
+        """Fill rounds of the checkpointed entries, in order."""
+        return sorted({entry.get("round", 0) for entry in self.entries})
+
+    def to_plan(self, fill_round=0):
+        """
+        Rebuild the checkpointed entries of one fill round as a selector-addressed FillPlan.
+
+        Returns:
+            FillPlan: The round's entries
+        """
+        plan = FillPlan()
+        for entry in self.entries:
+            if entry.get("round", 0) == fill_round:
+                plan.add_selector(entry["selector"], entry["value"], entry["field_name"], entry["kind"], entry["frame"])
+        return plan
+
+    def save(self):
+        """Write the checkpoint atomically."""
+        self.data["updated"] = time.time()
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".checkpoint.")
+            with os.fdopen(fd, 'w') as f:
+                json.dump(self.data, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not save fill checkpoint: {e}")
+
+    def clear(self):
+        """Delete the checkpoint once the URL has been filled completely."""
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.debug(f"Could not delete fill checkpoint: {e}")
+
+
+class CheckpointStore:
+    """One small JSON file per URL, so parallel workers never write the same file."""
+
+    def __init__(self, settings=None):
+        """
+        Args:
+            settings (dict): Overrides for DEFAULT_CHECKPOINT_SETTINGS
+        """
+        self.settings = dict(DEFAULT_CHECKPOINT_SETTINGS)
+        self.settings.update(settings or {})
+        directory = self.settings["directory"]
+        self.directory = Path(directory) if directory else Path(__file__).parent / ".fill_checkpoints"
+
+    def path_for(self, url):
+        return self.directory / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
+
+    def open(self, url):
+        """
+        Get the checkpoint of a URL, loading an unfinished one if it exists.
+
+        Returns:
+            FillCheckpoint: The checkpoint, empty if there was nothing to resume
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path_for(url)
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return FillCheckpoint(path, url)
+        except (json.JSONDecodeError, OSError):
+            logger.warning(f"Fill checkpoint for {url} is unreadable, starting over")
+            return FillCheckpoint(path, url)
+
+        if data.get("url") != url or time.time() - data.get("updated", 0) > self.settings["ttl_hours"] * 3600:
+            return FillCheckpoint(path, url)
+        if not data.get("planned"):
+            logger.info(f"Fill checkpoint for {url} was left before its plan was complete, starting over")
+            return FillCheckpoint(path, url)
+        return FillCheckpoint(path, url, data)
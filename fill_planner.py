@@ -0,0 +1,471 @@
+"""
+Fill planning for the Job Application Auto-Fill Bot.
+Matches the user's profile against a page snapshot and decides which value goes
+into which control. Planning is pure Python so every browser backend produces
+the same plan for the same page.
+"""
+
+import logging
+
+import config
+from batch_filler import FillPlan, value_matches
+from field_assignment import FieldAssigner
+from question_classifier import QUESTION_CLASSIFIER, lookup_answer
+from option_matcher import match_option
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DELTA_SETTINGS = {
+    "enabled": True,  # Leave fields that already hold the profile value untouched
+    "overwrite_conflicts": True  # Replace values that differ from the profile (e.g. from a portal account)
+}
+
+# Common selectors for personal info fields
+PERSONAL_INFO_FIELDS = {
+    "first_name": [
+        "input[name*='first']", "input[name*='firstName']", "input[id*='first']",
+        "input[placeholder*='First']", "input[placeholder*='first']"
+    ],
+    "last_name": [
+        "input[name*='last']", "input[name*='lastName']", "input[id*='last']",
+        "input[placeholder*='Last']", "input[placeholder*='last']"
+    ],
+    "email": [
+        "input[type='email']", "input[name*='email']", "input[id*='email']",
+        "input[placeholder*='Email']", "input[placeholder*='email']"
+    ],
+    "phone": [
+        "input[type='tel']", "input[name*='phone']", "input[id*='phone']",
+        "input[placeholder*='Phone']", "input[placeholder*='phone']"
+    ],
+    "address": [
+        "input[name*='address']", "input[id*='address']", "input[placeholder*='Address']"
+    ],
+    "city": [
+        "input[name*='city']", "input[id*='city']", "input[placeholder*='City']"
+    ],
+    "state": [
+        "input[name*='state']", "input[id*='state']", "input[placeholder*='State']",
+        "select[name*='state']", "select[id*='state']"
+    ],
+    "zip_code": [
+        "input[name*='zip']", "input[name*='postal']", "input[id*='zip']",
+        "input[placeholder*='Zip']", "input[placeholder*='Postal']"
+    ],
+    "country": [
+        "select[name*='country']", "select[id*='country']",
+        "input[name*='country']", "input[id*='country']", "input[placeholder*='Country']"
+    ]
+}
+
+# Work experience fields vary greatly between sites - these cover the common cases
+WORK_EXPERIENCE_FIELDS = {
+    "company": [
+        "input[name*='company']", "input[id*='company']", "input[placeholder*='Company']"
+    ],
+    "position": [
+        "input[name*='title']", "input[name*='position']", "input[id*='title']",
+        "input[placeholder*='Title']", "input[placeholder*='Position']"
+    ],
+    "start_date": [
+        "input[name*='start']", "input[id*='start']", "input[placeholder*='Start']"
+    ],
+    "end_date": [
+        "input[name*='end']", "input[id*='end']", "input[placeholder*='End']"
+    ],
+    "description": [
+        "textarea[name*='description']", "textarea[id*='description']",
+        "textarea[placeholder*='Description']"
+    ]
+}
+
+EDUCATION_FIELDS = {
+    "degree": [
+        "input[name*='degree']", "input[id*='degree']", "select[name*='degree']",
+        "select[id*='degree']", "input[placeholder*='Degree']"
+    ],
+    "field_of_study": [
+        "input[name*='major']", "input[name*='field']", "input[id*='major']",
+        "input[placeholder*='Major']", "input[placeholder*='Field']"
+    ],
+    "university": [
+        "input[name*='school']", "input[name*='university']", "input[id*='school']",
+        "input[placeholder*='School']", "input[placeholder*='University']"
+    ],
+    "graduation_year": [
+        "input[name*='graduation']", "input[name*='year']", "input[id*='graduation']",
+        "input[placeholder*='Graduation']", "input[placeholder*='Year']"
+    ]
+}
+
+# Common question field patterns, used when no page snapshot is available
+QUESTION_PATTERNS = [
+    "textarea[name*='why']", "textarea[name*='interest']", "textarea[name*='motivation']",
+    "textarea[name*='salary']", "textarea[name*='expectation']", "textarea[name*='availability']",
+    "textarea[name*='relocation']", "textarea[name*='authorization']", "textarea[name*='notice']"
+]
+
+SECTION_FIELDS = {
+    "personal_info": PERSONAL_INFO_FIELDS,
+    "work_experience": WORK_EXPERIENCE_FIELDS,
+    "education": EDUCATION_FIELDS
+}
+
+SELECT_FIELDS = {"state", "degree", "country"}
+TEXTAREA_FIELDS = {"description"}
+
+
+def resolve_profile():
+    """
+    Resolve the configured user information into the values used for filling.
+
+    Picks the most recent job and the highest degree (or the first one if none
+    is marked as highest).
+
+    Returns:
+        dict: Profile with personal_info, work_experience, education and common_answers
+    """
+    latest_job = config.WORK_EXPERIENCE[0] if config.WORK_EXPERIENCE else {}
+
+    education_info = None
+    for edu in config.EDUCATION:
+        if edu.get("is_highest", False):
+            education_info = edu
+            break
+    if not education_info and config.EDUCATION:
+        education_info = config.EDUCATION[0]
+
+    return {
+        "personal_info": dict(config.PERSONAL_INFO),
+        "work_experience": dict(latest_job),
+        "education": dict(education_info or {}),
+        "common_answers": dict(config.COMMON_ANSWERS)
+    }
+
+
+def field_kind(field_name):
+    """Return the kind of control (text, textarea, select) a profile field is filled into."""
+    if field_name in SELECT_FIELDS:
+        return "select"
+    if field_name in TEXTAREA_FIELDS:
+        return "textarea"
+    return "text"
+
+
+def section_fields(profile, section, skip=()):
+    """
+    List the profile values to fill for a section.
+
+    Args:
+        profile (dict): Profile from resolve_profile()
+        section (str): personal_info, work_experience or education
+        skip (set): Field names that are already filled, e.g. by an ATS adapter
+
+    Returns:
+        list: (field_name, value, selectors, kind) tuples in fill order
+    """
+    values = profile.get(section) or {}
+    return [
+        (field_name, values[field_name], selectors, field_kind(field_name))
+        for field_name, selectors in SECTION_FIELDS[section].items()
+        if field_name in values and field_name not in skip
+    ]
+
+
+def current_value(field):
+    """
+    The value a snapshot record held when the snapshot was taken, in the shape
+    VERIFY_SCRIPT reads it back (with the selected option's text for selects).
+    """
+    current = {"value": field.get("value") or ""}
+    if field["tag"] == "select":
+        current["text"] = ""
+        for option in field.get("options") or []:
+            if option["value"] == current["value"]:
+                current["text"] = option["text"]
+                break
+    return current
+
+
+def delta_settings():
+    """DEFAULT_DELTA_SETTINGS with the configured overrides applied."""
+    settings = dict(DEFAULT_DELTA_SETTINGS)
+    settings.update(config.BROWSER_SETTINGS.get("delta_fill") or {})
+    return settings
+
+
+def delta_status(current, value):
+    """
+    Compare a planned value with the value a control already holds.
+
+    Args:
+        current (dict): Current value in the shape VERIFY_SCRIPT reads it back,
+            None if the control was not found
+        value (str): Planned value
+
+    Returns:
+        str: "skipped" if it already holds the value, "conflicting" if it holds
+        a different one, "changed" if it is empty
+    """
+    if current is None:
+        return "changed"
+    if value_matches(value, current):
+        return "skipped"
+    # A select without a selected option text still shows its placeholder
+    if current["value"] and not ("text" in current and not current["text"]):
+        return "conflicting"
+    return "changed"
+
+
+def filter_delta(plan, current_values, settings=None):
+    """
+    Drop the entries of a selector-addressed plan, such as an ATS field map's,
+    whose control already holds the value or holds a conflicting one to keep.
+
+    Args:
+        plan (FillPlan): Plan to filter
+        current_values (list): VERIFY_SCRIPT result for plan.entries
+        settings (dict): Delta settings, defaults to delta_settings()
+
+    Returns:
+        tuple: (FillPlan of the entries to write, field names per delta status)
+    """
+    settings = settings or delta_settings()
+    delta = {"skipped": [], "changed": [], "conflicting": []}
+    if not settings["enabled"]:
+        return plan, delta
+
+    changed = FillPlan()
+    current_values = current_values or []
+    for index, entry in enumerate(plan.entries):
+        current = current_values[index] if index < len(current_values) else None
+        status = delta_status(current, entry["value"])
+        delta[status].append(entry["field_name"])
+        if status == "skipped" or (status == "conflicting" and not settings["overwrite_conflicts"]):
+            continue
+        changed.add_selector(entry["selector"], entry["value"], entry["field_name"], entry["kind"], entry["frame"])
+    return changed, delta
+
+
+def report_delta(report, delta, settings=None):
+    """
+    Add a delta to a run report: field names per delta status under "delta", and
+    "unchanged" or "conflict_kept" for fields that were not written.
+
+    Args:
+        report (dict): Run report
+        delta (dict): Field names per delta status
+        settings (dict): Delta settings, defaults to delta_settings()
+    """
+    settings = settings or delta_settings()
+    merged = report.setdefault("delta", {"skipped": [], "changed": [], "conflicting": []})
+    for status, field_names in delta.items():
+        merged[status].extend(field_names)
+
+    field_status = report.setdefault("fields", {})
+    for field_name in delta["skipped"]:
+        field_status[field_name] = "unchanged"
+    if not settings["overwrite_conflicts"]:
+        for field_name in delta["conflicting"]:
+            field_status[field_name] = "conflict_kept"
+
+    if delta["skipped"] or delta["conflicting"]:
+        logger.info(
+            f"Delta fill: {len(delta['skipped'])} fields already correct, "
+            f"{len(delta['changed'])} to fill, {len(delta['conflicting'])} conflicting"
+        )
+
+
+def kept_fields(delta, settings=None):
+    """Names of the fields a delta leaves as they are."""
+    settings = settings or delta_settings()
+    kept = set(delta["skipped"])
+    if not settings["overwrite_conflicts"]:
+        kept.update(delta["conflicting"])
+    return kept
+
+
+def match_question_answer(placeholder, name, answers):
+    """
+    Pick the common answer for a question field from its placeholder and name.
+
+    Args:
+        placeholder (str): Placeholder text of the field
+        name (str): Name attribute of the field
+        answers (dict): Configured common answers
+
+    Returns:
+        str: The configured answer, or an empty string if nothing matches
+    """
+    key = QUESTION_CLASSIFIER.classify_text(f"{placeholder}\n{name}")
+    return lookup_answer(answers, key) if key else ""
+
+
+def question_fields(snapshot, answers):
+    """
+    Classify every usable textarea in a snapshot as a common question.
+
+    Args:
+        snapshot (FieldSnapshot): Page snapshot
+        answers (dict): Configured common answers
+
+    Returns:
+        list: (record, answer key, answer) tuples for fields with a configured answer
+    """
+    questions = []
+    for field in snapshot.find_all("textarea"):
+        key = QUESTION_CLASSIFIER.classify_field(field)
+        answer = lookup_answer(answers, key) if key else ""
+        if answer:
+            questions.append((field, key, answer))
+    return questions
+
+
+class FillPlanner:
+    """Builds a FillPlan for a page snapshot from the user's profile."""
+
+    def __init__(self, snapshot, profile, selector_cache=None, host="", skip_fields=()):
+        """
+        Args:
+            snapshot (FieldSnapshot): Page snapshot to plan against
+            profile (dict): Profile from resolve_profile()
+            selector_cache (SelectorCache): Learned selectors to try first and update
+            host (str): Host key of the page, for the selector cache
+            skip_fields (set): Profile fields that are already filled
+        """
+        self.snapshot = snapshot
+        self.profile = profile
+        self.selector_cache = selector_cache
+        self.host = host
+        self.skip_fields = skip_fields
+        self.assignment = None
+        self.delta_settings = delta_settings()
+        self.delta = {"skipped": [], "changed": [], "conflicting": []}
+
+    def assign_fields(self):
+        """
+        Assign controls to the profile fields of every section in one solve,
+        trying learned selectors first. Controls asking a common question (such
+        as "Earliest start date") are never given a profile value.
+
+        Returns:
+            dict: field_name -> snapshot record of its control
+        """
+        if self.assignment is not None:
+            return self.assignment
+
+        wanted = []
+        for section in SECTION_FIELDS:
+            for field_name, _, selectors, _ in section_fields(self.profile, section, self.skip_fields):
+                if self.selector_cache is not None:
+                    selectors = self.selector_cache.order(self.host, field_name, selectors)
+                wanted.append((field_name, selectors))
+
+        records = [
+            field for field in self.snapshot.fields
+            if field["visible"] and field["enabled"] and QUESTION_CLASSIFIER.classify_field(field) is None
+        ]
+        assigned = FieldAssigner(records).assign(wanted)
+
+        if self.selector_cache is not None:
+            for field_name, selectors in wanted:
+                if field_name in assigned:
+                    selector = assigned[field_name][1]
+                    tried = selectors[:selectors.index(selector)]
+                    self.selector_cache.record_hit(self.host, field_name, selector, tried)
+                else:
+                    self.selector_cache.record_miss(self.host, field_name)
+
+        self.assignment = {field_name: field for field_name, (field, _) in assigned.items()}
+        return self.assignment
+
+    def plan_section(self, section, plan):
+        """
+        Plan the fields of one profile section.
+
+        Args:
+            section (str): personal_info, work_experience or education
+            plan (FillPlan): Plan to add the fields to
+
+        Returns:
+            int: Number of fields planned
+        """
+        planned = 0
+        assignment = self.assign_fields()
+        for field_name, value, _, kind in section_fields(self.profile, section, self.skip_fields):
+            field = assignment.get(field_name)
+            if not field:
+                continue
+            if field["tag"] == "select":
+                value, kind = self.select_value(field, value, field_name), "select"
+            elif kind == "select":
+                kind = "text"
+            if self.add_if_changed(plan, field, value, field_name, kind):
+                planned += 1
+        return planned
+
+    def add_if_changed(self, plan, field, value, field_name, kind):
+        """
+        Plan a value unless the control already holds it, recording the delta.
+
+        Returns:
+            bool: True if the value was planned
+        """
+        if not self.delta_settings["enabled"]:
+            return plan.add(field, value, field_name, kind)
+
+        if plan.is_planned(field):
+            return False
+        status = delta_status(current_value(field), value)
+        if status == "skipped" or (status == "conflicting" and not self.delta_settings["overwrite_conflicts"]):
+            self.delta[status].append(field_name)
+            return False
+        if not plan.add(field, value, field_name, kind):
+            return False
+        self.delta[status].append(field_name)
+        return True
+
+    def select_value(self, field, value, field_name):
+        """
+        Translate a profile value into the text of the matching option of a select.
+
+        Returns:
+            str: The option text, or the value unchanged if no option matches
+        """
+        option = match_option(value, field.get("options") or [])
+        if option is None:
+            logger.info(f"No option of {field_name} matches {value!r}")
+            return value
+        return option["text"]
+
+    def report_delta(self, report):
+        """Add the planned delta to a run report, see report_delta()."""
+        report_delta(report, self.delta, self.delta_settings)
+
+    def plan_questions(self, plan):
+        """
+        Plan answers for common application questions.
+
+        Args:
+            plan (FillPlan): Plan to add the fields to
+
+        Returns:
+            int: Number of question fields planned
+        """
+        planned = 0
+        for field, key, answer in question_fields(self.snapshot, self.profile["common_answers"]):
+            if self.add_if_changed(plan, field, answer, f"question {key}", "textarea"):
+                planned += 1
+        return planned
+
+    def plan(self):
+        """
+        Plan every section of the page.
+
+        Returns:
+            tuple: (FillPlan, dict of planned counts per section)
+        """
+        plan = FillPlan()
+        counts = {section: self.plan_section(section, plan) for section in SECTION_FIELDS}
+        counts["common_questions"] = self.plan_questions(plan)
+        return plan, counts
@@ -11,69 +11,191 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select
 from selenium.webdriver.common.keys import Keys
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, UnexpectedTagNameException
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-import config_manager as config
+import config
+from field_discovery import FieldDiscovery, FieldSnapshot, FrameNavigator, OPTIONS_SCRIPT
+from field_watcher import FieldWatcher
+from batch_filler import BatchFiller, FillPlan, DEFAULT_VERIFY_SETTINGS, ENSURE_VALUE_SCRIPT, FOCUS_SCRIPT
+from fill_planner import (
+    FillPlanner, QUESTION_PATTERNS, delta_settings, filter_delta, kept_fields, match_question_answer,
+    question_fields, report_delta, resolve_profile, section_fields
+)
+from page_readiness import PageReadinessDetector
+from pacing import PacingPolicy
+from option_matcher import match_option
+from driver_resolver import ChromeDriverResolver
+from browser_profiles import ProfileManager
+from selector_cache import SelectorCache, host_key
+from wizard import DEFAULT_WIZARD_SETTINGS, StepNavigator
+from ats_adapters import FINGERPRINT_SCRIPT, adapter_for_markers, adapter_for_url, marker_selectors
+from fill_checkpoints import CheckpointStore
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+def create_chrome_driver(headless=None):
+    """
+    Start a Chrome session with the configured options.
+    
+    Args:
+        headless (bool): Run Chrome without a window, defaults to BROWSER_SETTINGS["headless"]
+        
+    Returns:
+        WebDriver: A ready-to-use Chrome driver
+    """
+    chrome_options = Options()
+    
+    # Add options for better automation
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    
+    # Set headless mode if configured
+    if config.BROWSER_SETTINGS["headless"] if headless is None else headless:
+        chrome_options.add_argument("--headless")
+    
+    chrome_binary = config.BROWSER_SETTINGS.get("chrome_binary")
+    if chrome_binary:
+        chrome_options.binary_location = chrome_binary
+    
+    # Reuse a persistent profile so caches and logins survive between runs
+    profiles = ProfileManager(config.BROWSER_SETTINGS.get("profiles"))
+    profile_dir = profiles.acquire() if profiles.enabled else None
+    if profile_dir:
+        chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+        chrome_options.add_argument(f"--disk-cache-size={profiles.cache_size_bytes}")
+    
+    # Resolve chromedriver from the local cache, downloading only on a miss
+    resolver = ChromeDriverResolver(
+        index_file=config.BROWSER_SETTINGS.get("chromedriver_index"),
+        chrome_binary=chrome_binary,
+        chromedriver_path=config.BROWSER_SETTINGS.get("chromedriver_path")
+    )
+    
+    # Initialize driver
+    try:
+        service = Service(resolver.resolve())
+        driver = webdriver.Chrome(service=service, options=chrome_options)
+    except Exception:
+        if profile_dir:
+            profiles.release(profile_dir)
+        raise
+    driver.autofill_profile_dir = profile_dir
+    
+    # Set timeouts
+    driver.implicitly_wait(config.BROWSER_SETTINGS["implicit_wait"])
+    driver.set_page_load_timeout(config.BROWSER_SETTINGS["page_load_timeout"])
+    
+    # Remove automation indicators
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    
+    return driver
+
+def quit_chrome_driver(driver):
+    """Quit a driver from create_chrome_driver() and unlock its persistent profile."""
+    try:
+        driver.quit()
+    finally:
+        profile_dir = getattr(driver, "autofill_profile_dir", None)
+        if profile_dir:
+            ProfileManager(config.BROWSER_SETTINGS.get("profiles")).release(profile_dir)
+
 class JobApplicationFiller:
-    def __init__(self):
+    def __init__(self, driver=None):
+        """
+        Args:
+            driver (WebDriver): Existing driver to fill with, e.g. from a DriverPool.
+                A new Chrome session is started when omitted.
+        """
         self.driver = None
         self.wait = None
-        self.setup_driver()
+        self.frames = None
+        self.discovery = None
+        self.snapshot = None
+        self.batch_filler = None
+        self.fill_plan = None
+        self.planner = None
+        self.readiness = None
+        self.steps = None
+        self.watcher = None
+        self.run_report = {}
+        self.profile = None
+        self.pacing = PacingPolicy(config.BROWSER_SETTINGS.get("pacing"))
+        self.batch_fill = config.BROWSER_SETTINGS.get("batch_fill", True)
+        self.long_text_min = config.BROWSER_SETTINGS.get("long_text_min_length", 20)
+        cache_settings = config.BROWSER_SETTINGS.get("selector_cache") or {}
+        self.selector_cache = SelectorCache(cache_settings) if cache_settings.get("enabled", True) else None
+        checkpoint_settings = config.BROWSER_SETTINGS.get("checkpoints") or {}
+        self.checkpoints = CheckpointStore(checkpoint_settings) if checkpoint_settings.get("enabled", True) else None
+        self.checkpoint = None
+        self.host = ""
+        self.prefilled_fields = set()
+        self.adapter_entries = []  # Entries filled from an ATS field map on the current page
+        self.owns_driver = driver is None
+        if driver is None:
+            self.setup_driver()
+        else:
+            self.attach_driver(driver)
         
     def setup_driver(self):
         """Initialize the Chrome driver with appropriate options."""
         try:
-            chrome_options = Options()
-            
-            # Add options for better automation
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option('useAutomationExtension', False)
-            
-            # Set headless mode if configured
-            if config.BROWSER_SETTINGS["headless"]:
-                chrome_options.add_argument("--headless")
-            
-            # Initialize driver
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            
-            # Set timeouts
-            self.driver.implicitly_wait(config.BROWSER_SETTINGS["implicit_wait"])
-            self.driver.set_page_load_timeout(config.BROWSER_SETTINGS["page_load_timeout"])
-            
-            # Initialize wait object
-            self.wait = WebDriverWait(self.driver, 10)
-            
-            # Remove automation indicators
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            
+            self.attach_driver(create_chrome_driver())
             logger.info("Chrome driver initialized successfully")
             
         except Exception as e:
             logger.error(f"Failed to initialize driver: {e}")
             raise
     
-    def find_element_safe(self, selectors, element_type="input"):
+    def attach_driver(self, driver):
+        """Set up the helpers that work on top of a driver."""
+        self.driver = driver
+        
+        # Initialize wait object
+        self.wait = WebDriverWait(self.driver, 10)
+        self.frames = FrameNavigator(self.driver)
+        self.discovery = FieldDiscovery(self.driver, self.frames)
+        self.batch_filler = BatchFiller(self.driver, self.frames)
+        self.readiness = PageReadinessDetector(
+            self.driver, config.BROWSER_SETTINGS.get("page_readiness")
+        )
+        self.readiness.install()
+        self.steps = StepNavigator(self.driver, self.readiness)
+        self.watcher = FieldWatcher(self.driver, config.BROWSER_SETTINGS.get("dependent_fields"))
+    
+    def find_element_safe(self, selectors, element_type="input", field_name=None):
         """
         Try multiple selectors to find an element safely.
         
         Args:
             selectors (list): List of CSS selectors to try
             element_type (str): Type of element to look for (input, textarea, select)
+            field_name (str): Profile field being looked up; when given, learned
+                selectors for the current host are tried first and updated
             
         Returns:
             WebElement or None: Found element or None if not found
         """
+        learn = field_name is not None and self.selector_cache is not None
+        if learn:
+            selectors = self.selector_cache.order(self.host, field_name, selectors)
+        ordered = selectors
+        
+        if self.snapshot is not None:
+            field, selector, selectors = self.snapshot.locate(selectors)
+            if field:
+                if learn:
+                    tried = ordered[:ordered.index(selector)]
+                    self.selector_cache.record_hit(self.host, field_name, selector, tried)
+                return self.discovery.resolve(field)
+        
+        # Selector lookups only search the top document
+        self.frames.reset()
         for selector in selectors:
             try:
                 if element_type == "input":
@@ -86,12 +208,235 @@ class JobApplicationFiller:
                     element = self.driver.find_element(By.CSS_SELECTOR, selector)
                 
                 if element.is_displayed() and element.is_enabled():
+                    if learn:
+                        tried = ordered[:ordered.index(selector)]
+                        self.selector_cache.record_hit(self.host, field_name, selector, tried)
                     return element
             except (TimeoutException, NoSuchElementException):
                 continue
         
+        if learn:
+            self.selector_cache.record_miss(self.host, field_name)
+        return None
+    
+    def find_elements_safe(self, selector):
+        """
+        Find all elements matching a selector, using the page snapshot when available.
+        
+        Args:
+            selector (str): CSS selector to match
+            
+        Returns:
+            list: Matching WebElements
+        """
+        if self.snapshot is not None:
+            fields = self.snapshot.find_all(selector)
+            if fields is not None:
+                elements = [self.discovery.resolve(field) for field in fields]
+                return [element for element in elements if element is not None]
+        
+        self.frames.reset()
+        return self.driver.find_elements(By.CSS_SELECTOR, selector)
+    
+    def take_snapshot(self):
+        """Snapshot the page's form controls so fields can be matched in Python."""
+        try:
+            self.snapshot = self.discovery.snapshot()
+        except Exception as e:
+            logger.warning(f"Field discovery failed, falling back to selector lookups: {e}")
+            self.snapshot = None
+        return self.snapshot
+    
+    def fill_element(self, element, value, kind="text", field_name=""):
+        """
+        Fill a single element through WebDriver.
+        
+        Args:
+            element (WebElement): Element to fill
+            value (str): Value to fill
+            kind (str): Type of field (text, textarea, select)
+            field_name (str): Name of the field for logging
+            
+        Returns:
+            bool: True if the element was filled
+        """
+        try:
+            if kind == "select":
+                try:
+                    select = Select(element)
+                except UnexpectedTagNameException:
+                    # Fields such as country are plain inputs on some sites
+                    kind = "text"
+            
+            if kind == "select":
+                self.select_option(select, element, value)
+            elif (element.get_attribute("value") or "") == value:
+                logger.info(f"{field_name} already holds the value, leaving it unchanged")
+            else:
+                start = time.perf_counter()
+                method = self.insert_text(element, value) if len(value) >= self.long_text_min else None
+                if method is None:
+                    # Clear existing content
+                    element.clear()
+                    self.pacing.pause("clear")
+                    
+                    # Fill with new value
+                    element.send_keys(value)
+                    method = "send_keys"
+                elapsed = time.perf_counter() - start
+                self.run_report.setdefault("typing", {})[field_name] = round(elapsed, 3)
+                logger.info(f"Typed {field_name} ({len(value)} chars) with {method} in {elapsed:.3f}s")
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to fill {field_name}: {e}")
+            return False
+    
+    def insert_text(self, element, value):
+        """
+        Enter a long text in one step instead of one key event per character:
+        a single DevTools Input.insertText call, or the native value setter
+        plus input/change events where DevTools is unavailable or ignored.
+        
+        Args:
+            element (WebElement): Text input or textarea
+            value (str): Text to enter, replacing the current content
+            
+        Returns:
+            str or None: Method that entered the text, or None if the page
+            rejected both and send_keys should be used
+        """
+        try:
+            if hasattr(self.driver, "execute_cdp_cmd") and self.driver.execute_script(FOCUS_SCRIPT, element):
+                self.driver.execute_cdp_cmd("Input.insertText", {"text": value})
+            result = self.driver.execute_script(ENSURE_VALUE_SCRIPT, element, value)
+        except Exception as e:
+            logger.debug(f"One-step text entry failed: {e}")
+            return None
+        
+        if result == "inserted":
+            return "insertText"
+        if result == "set":
+            return "native setter"
         return None
     
+    def select_option(self, select, element, value):
+        """
+        Select the option matching a value, by visible text or else through the
+        synonym index (e.g. "CA" selects "California").
+        """
+        try:
+            select.select_by_visible_text(value)
+            return
+        except NoSuchElementException:
+            pass
+        
+        # All options in one call instead of one WebDriver call per option
+        option = match_option(value, self.driver.execute_script(OPTIONS_SCRIPT, element))
+        if option is None:
+            raise NoSuchElementException(f"No option matches {value!r}")
+        select.select_by_value(option["value"])
+    
+    def apply_fill_plan(self):
+        """
+        Write all planned values in one batch, falling back to per-element
+        filling for any field the batch rejects.
+        
+        Returns:
+            int: Number of planned fields that could not be filled
+        """
+        plan, self.fill_plan = self.fill_plan, None
+        if not plan:
+            return 0
+        
+        try:
+            applied, rejected = self.batch_filler.apply(plan)
+        except Exception as e:
+            logger.warning(f"Batch fill failed, filling fields one at a time: {e}")
+            applied, rejected = [], [(entry, str(e)) for entry in plan.entries]
+        
+        field_status = self.run_report.setdefault("fields", {})
+        for entry in applied:
+            logger.info(f"Filled {entry['field_name']}: {entry['value'][:50]}")
+            field_status[entry["field_name"]] = "filled"
+        
+        failed = 0
+        filled = list(applied)
+        for entry, reason in rejected:
+            logger.info(f"Batch rejected {entry['field_name']} ({reason}), retrying directly")
+            element = self.resolve_entry(entry)
+            if element and self.fill_element(element, entry["value"], entry["kind"], entry["field_name"]):
+                field_status[entry["field_name"]] = "filled_fallback"
+                filled.append(entry)
+            else:
+                field_status[entry["field_name"]] = "failed"
+                failed += 1
+        
+        return failed + self.verify_fill(plan, filled)
+    
+    def resolve_entry(self, entry):
+        """
+        Find the element of a plan entry, by snapshot record or by selector.
+        
+        Returns:
+            WebElement or None: The element, with the driver switched to its frame
+        """
+        if entry["field"] is not None:
+            return self.discovery.resolve(entry["field"])
+        try:
+            self.frames.switch(entry["frame"])
+            elements = self.driver.find_elements(By.CSS_SELECTOR, entry["selector"])
+        except Exception as e:
+            logger.debug(f"Could not find {entry['field_name']} by {entry['selector']}: {e}")
+            return None
+        return elements[0] if elements else None
+    
+    def verify_fill(self, plan, filled):
+        """
+        Read back every filled value in one call per frame and refill only the
+        fields whose value did not stick, one element at a time.
+        
+        Args:
+            plan (FillPlan): The applied plan
+            filled (list): Entries that were filled
+            
+        Returns:
+            int: Number of fields still holding the wrong value
+        """
+        settings = dict(DEFAULT_VERIFY_SETTINGS)
+        settings.update(config.BROWSER_SETTINGS.get("verify") or {})
+        if not settings["enabled"] or not filled:
+            return 0
+        
+        time.sleep(self.pacing.settle(settings["settle_ms"] / 1000))
+        mismatches = self.batch_filler.verify(plan, filled)
+        self.run_report["fields_verified"] = self.run_report.get("fields_verified", 0) + len(filled) - len(mismatches)
+        if not mismatches:
+            logger.info(f"Verified {len(filled)} filled fields")
+            return 0
+        
+        field_status = self.run_report["fields"]
+        refilled = []
+        for entry, actual in mismatches:
+            logger.info(f"{entry['field_name']} did not keep its value ({actual}), refilling directly")
+            element = self.resolve_entry(entry)
+            if element and self.fill_element(element, entry["value"], entry["kind"], entry["field_name"]):
+                refilled.append(entry)
+            else:
+                field_status[entry["field_name"]] = "mismatch"
+        
+        still_wrong = [entry for entry, _ in self.batch_filler.verify(plan, refilled)] if refilled else []
+        for entry in refilled:
+            field_status[entry["field_name"]] = "mismatch" if entry in still_wrong else "refilled"
+        
+        wrong = len(mismatches) - len(refilled) + len(still_wrong)
+        logger.info(f"Verified {len(filled)} filled fields: {len(mismatches)} reverted, {wrong} still wrong")
+        return wrong
+    
+    def field_delay(self):
+        """Pause between fields when filling elements one at a time."""
+        if self.fill_plan is None:
+            self.pacing.pause("field")
+    
     def fill_text_field(self, value, field_selectors, field_name=""):
         """
         Fill a text input field with the given value.
@@ -101,19 +446,11 @@ class JobApplicationFiller:
             field_selectors (list): List of CSS selectors to try
             field_name (str): Name of the field for logging
         """
-        element = self.find_element_safe(field_selectors)
+        element = self.find_element_safe(field_selectors, "input", field_name or None)
         if element:
-            try:
-                # Clear existing content
-                element.clear()
-                time.sleep(0.5)
-                
-                # Fill with new value
-                element.send_keys(value)
+            if self.fill_element(element, value, "text", field_name):
                 logger.info(f"Filled {field_name}: {value}")
                 return True
-            except Exception as e:
-                logger.warning(f"Failed to fill {field_name}: {e}")
         else:
             logger.warning(f"Could not find field for {field_name}")
         
@@ -128,15 +465,11 @@ class JobApplicationFiller:
             field_selectors (list): List of CSS selectors to try
             field_name (str): Name of the field for logging
         """
-        element = self.find_element_safe(field_selectors, "select")
+        element = self.find_element_safe(field_selectors, "select", field_name or None)
         if element:
-            try:
-                select = Select(element)
-                select.select_by_visible_text(value)
+            if self.fill_element(element, value, "select", field_name):
                 logger.info(f"Selected {field_name}: {value}")
                 return True
-            except Exception as e:
-                logger.warning(f"Failed to select {field_name}: {e}")
         else:
             logger.warning(f"Could not find select field for {field_name}")
         
@@ -151,75 +484,52 @@ class JobApplicationFiller:
             field_selectors (list): List of CSS selectors to try
             field_name (str): Name of the field for logging
         """
-        element = self.find_element_safe(field_selectors, "textarea")
+        element = self.find_element_safe(field_selectors, "textarea", field_name or None)
         if element:
-            try:
-                # Clear existing content
-                element.clear()
-                time.sleep(0.5)
-                
-                # Fill with new value
-                element.send_keys(value)
+            if self.fill_element(element, value, "textarea", field_name):
                 logger.info(f"Filled {field_name}: {value[:50]}...")
                 return True
-            except Exception as e:
-                logger.warning(f"Failed to fill {field_name}: {e}")
         else:
             logger.warning(f"Could not find textarea field for {field_name}")
         
         return False
     
+    def fill_section(self, section):
+        """
+        Fill the fields of one profile section.
+        
+        While a batch plan is open the fields are planned from the snapshot,
+        otherwise each one is located and filled directly.
+        
+        Args:
+            section (str): personal_info, work_experience or education
+            
+        Returns:
+            int: Number of fields filled or planned
+        """
+        if self.fill_plan is not None:
+            return self.planner.plan_section(section, self.fill_plan)
+        
+        filled_count = 0
+        for field, value, selectors, kind in section_fields(self.get_profile(), section, self.prefilled_fields):
+            if kind == "select":
+                success = self.fill_select_field(value, selectors, field)
+            elif kind == "textarea":
+                success = self.fill_textarea_field(value, selectors, field)
+            else:
+                success = self.fill_text_field(value, selectors, field)
+            
+            if success:
+                filled_count += 1
+            self.field_delay()  # Small delay between fields
+        
+        return filled_count
+    
     def fill_personal_info(self):
         """Fill out personal information fields."""
         logger.info("Filling personal information...")
         
-        # Common selectors for personal info fields
-        field_mappings = {
-            "first_name": [
-                "input[name*='first']", "input[name*='firstName']", "input[id*='first']",
-                "input[placeholder*='First']", "input[placeholder*='first']"
-            ],
-            "last_name": [
-                "input[name*='last']", "input[name*='lastName']", "input[id*='last']",
-                "input[placeholder*='Last']", "input[placeholder*='last']"
-            ],
-            "email": [
-                "input[type='email']", "input[name*='email']", "input[id*='email']",
-                "input[placeholder*='Email']", "input[placeholder*='email']"
-            ],
-            "phone": [
-                "input[type='tel']", "input[name*='phone']", "input[id*='phone']",
-                "input[placeholder*='Phone']", "input[placeholder*='phone']"
-            ],
-            "address": [
-                "input[name*='address']", "input[id*='address']", "input[placeholder*='Address']"
-            ],
-            "city": [
-                "input[name*='city']", "input[id*='city']", "input[placeholder*='City']"
-            ],
-            "state": [
-                "input[name*='state']", "input[id*='state']", "input[placeholder*='State']",
-                "select[name*='state']", "select[id*='state']"
-            ],
-            "zip_code": [
-                "input[name*='zip']", "input[name*='postal']", "input[id*='zip']",
-                "input[placeholder*='Zip']", "input[placeholder*='Postal']"
-            ]
-        }
-        
-        filled_count = 0
-        for field, selectors in field_mappings.items():
-            if field in config.PERSONAL_INFO:
-                value = config.PERSONAL_INFO[field]
-                
-                if field == "state":
-                    success = self.fill_select_field(value, selectors, field)
-                else:
-                    success = self.fill_text_field(value, selectors, field)
-                
-                if success:
-                    filled_count += 1
-                time.sleep(0.5)  # Small delay between fields
+        filled_count = self.fill_section("personal_info")
         
         logger.info(f"Filled {filled_count} personal information fields")
         return filled_count
@@ -228,49 +538,13 @@ class JobApplicationFiller:
         """Fill out work experience fields."""
         logger.info("Filling work experience...")
         
-        # This is a simplified version - work experience fields vary greatly
-        # You may need to customize this based on specific job sites
-        
-        if not config.WORK_EXPERIENCE:
+        # Only the most recent job is filled - work experience fields vary greatly
+        # between sites, see WORK_EXPERIENCE_FIELDS in fill_planner.py
+        if not self.get_profile()["work_experience"]:
             logger.info("No work experience configured")
             return 0
         
-        # Try to fill most recent job
-        latest_job = config.WORK_EXPERIENCE[0]
-        
-        field_mappings = {
-            "company": [
-                "input[name*='company']", "input[id*='company']", "input[placeholder*='Company']"
-            ],
-            "position": [
-                "input[name*='title']", "input[name*='position']", "input[id*='title']",
-                "input[placeholder*='Title']", "input[placeholder*='Position']"
-            ],
-            "start_date": [
-                "input[name*='start']", "input[id*='start']", "input[placeholder*='Start']"
-            ],
-            "end_date": [
-                "input[name*='end']", "input[id*='end']", "input[placeholder*='End']"
-            ],
-            "description": [
-                "textarea[name*='description']", "textarea[id*='description']",
-                "textarea[placeholder*='Description']"
-            ]
-        }
-        
-        filled_count = 0
-        for field, selectors in field_mappings.items():
-            if field in latest_job:
-                value = latest_job[field]
-                
-                if field == "description":
-                    success = self.fill_textarea_field(value, selectors, field)
-                else:
-                    success = self.fill_text_field(value, selectors, field)
-                
-                if success:
-                    filled_count += 1
-                time.sleep(0.5)
+        filled_count = self.fill_section("work_experience")
         
         logger.info(f"Filled {filled_count} work experience fields")
         return filled_count
@@ -279,56 +553,12 @@ class JobApplicationFiller:
         """Fill out education fields."""
         logger.info("Filling education information...")
         
-        if not config.EDUCATION:
+        # Uses the highest degree, or the first one if none is marked as highest
+        if not self.get_profile()["education"]:
             logger.info("No education information configured")
             return 0
         
-        # Use the highest degree by default, or the first one if none marked as highest
-        education_info = None
-        for edu in config.EDUCATION:
-            if edu.get("is_highest", False):
-                education_info = edu
-                break
-        
-        if not education_info and config.EDUCATION:
-            education_info = config.EDUCATION[0]  # Use first degree if none marked as highest
-        
-        if not education_info:
-            logger.info("No education information available")
-            return 0
-        
-        field_mappings = {
-            "degree": [
-                "input[name*='degree']", "input[id*='degree']", "select[name*='degree']",
-                "select[id*='degree']", "input[placeholder*='Degree']"
-            ],
-            "field_of_study": [
-                "input[name*='major']", "input[name*='field']", "input[id*='major']",
-                "input[placeholder*='Major']", "input[placeholder*='Field']"
-            ],
-            "university": [
-                "input[name*='school']", "input[name*='university']", "input[id*='school']",
-                "input[placeholder*='School']", "input[placeholder*='University']"
-            ],
-            "graduation_year": [
-                "input[name*='graduation']", "input[name*='year']", "input[id*='graduation']",
-                "input[placeholder*='Graduation']", "input[placeholder*='Year']"
-            ]
-        }
-        
-        filled_count = 0
-        for field, selectors in field_mappings.items():
-            if field in education_info:
-                value = education_info[field]
-                
-                if field == "degree":
-                    success = self.fill_select_field(value, selectors, field)
-                else:
-                    success = self.fill_text_field(value, selectors, field)
-                
-                if success:
-                    filled_count += 1
-                time.sleep(0.5)
+        filled_count = self.fill_section("education")
         
         logger.info(f"Filled {filled_count} education fields")
         return filled_count
@@ -337,42 +567,34 @@ class JobApplicationFiller:
         """Fill out common application questions."""
         logger.info("Filling common questions...")
         
-        # Common question field patterns
-        question_patterns = [
-            "textarea[name*='why']", "textarea[name*='interest']", "textarea[name*='motivation']",
-            "textarea[name*='salary']", "textarea[name*='expectation']", "textarea[name*='availability']",
-            "textarea[name*='relocation']", "textarea[name*='authorization']", "textarea[name*='notice']"
-        ]
+        if self.fill_plan is not None:
+            filled_count = self.planner.plan_questions(self.fill_plan)
+            logger.info(f"Filled {filled_count} common question fields")
+            return filled_count
         
+        answers = self.get_profile()["common_answers"]
         filled_count = 0
-        for pattern in question_patterns:
+        if self.snapshot is not None:
+            for field, key, answer in question_fields(self.snapshot, answers):
+                element = self.discovery.resolve(field)
+                if element is not None and self.fill_element(element, answer, "textarea", f"question {key}"):
+                    filled_count += 1
+            logger.info(f"Filled {filled_count} common question fields")
+            return filled_count
+        
+        for pattern in QUESTION_PATTERNS:
             try:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, pattern)
+                elements = self.find_elements_safe(pattern)
                 for element in elements:
                     if element.is_displayed() and element.is_enabled():
                         # Try to match question content to appropriate answer
                         placeholder = element.get_attribute("placeholder") or ""
                         name = element.get_attribute("name") or ""
-                        
-                        # Simple matching logic
-                        if any(word in (placeholder + name).lower() for word in ["why", "interest", "motivation"]):
-                            answer = config.COMMON_ANSWERS.get("why_interested", "")
-                        elif any(word in (placeholder + name).lower() for word in ["salary", "expectation"]):
-                            answer = config.COMMON_ANSWERS.get("salary_expectation", "")
-                        elif any(word in (placeholder + name).lower() for word in ["availability", "start"]):
-                            answer = config.COMMON_ANSWERS.get("availability", "")
-                        elif any(word in (placeholder + name).lower() for word in ["relocation"]):
-                            answer = config.COMMON_ANSWERS.get("relocation", "")
-                        elif any(word in (placeholder + name).lower() for word in ["authorization", "work"]):
-                            answer = config.COMMON_ANSWERS.get("work_authorization", "")
-                        elif any(word in (placeholder + name).lower() for word in ["notice"]):
-                            answer = config.COMMON_ANSWERS.get("notice_period", "")
-                        else:
-                            continue
+                        answer = match_question_answer(placeholder, name, answers)
                         
                         if answer:
                             element.clear()
-                            time.sleep(0.5)
+                            self.pacing.pause("clear")
                             element.send_keys(answer)
                             filled_count += 1
                             logger.info(f"Filled question field: {placeholder or name}")
@@ -383,36 +605,429 @@ class JobApplicationFiller:
         logger.info(f"Filled {filled_count} common question fields")
         return filled_count
     
-    def auto_fill_application(self, url):
+    def get_profile(self):
+        """Return the profile for the current run, resolving it on first use."""
+        if self.profile is None:
+            self.profile = resolve_profile()
+        return self.profile
+    
+    def start_run(self, url):
+        """Reset the per-run report, profile and pacing for a new application URL."""
+        self.run_report = {"url": url}
+        self.profile = resolve_profile()
+        self.host = host_key(url)
+        self.prefilled_fields = set()
+        self.checkpoint = self.checkpoints.open(url) if self.checkpoints is not None else None
+        self.pacing.for_url(url)
+        self.pacing.reset()
+    
+    def record_readiness(self, readiness):
+        """Store how long the page took to become ready in the run report."""
+        self.run_report["page_wait"] = round(readiness["waited"], 3)
+        self.run_report["page_ready"] = readiness["ready"]
+    
+    def detect_adapter(self):
+        """
+        Recognize a known ATS platform from the URL, or from DOM markers when
+        the form is hosted on the employer's own domain.
+        
+        Returns:
+            ATSAdapter or None: Adapter for the platform
+        """
+        adapter = adapter_for_url(self.driver.current_url)
+        if adapter is None:
+            try:
+                adapter = adapter_for_markers(self.driver.execute_script(FINGERPRINT_SCRIPT, marker_selectors()))
+            except Exception as e:
+                logger.debug(f"Platform fingerprint failed: {e}")
+        return adapter
+    
+    def fill_with_adapter(self, adapter):
+        """
+        Fill the platform's known fields straight from its field map, without
+        field discovery. Fields it cannot fill are left to the generic path.
+        Like the generic plan, fields that already hold their value (e.g. from
+        the portal account) are left alone and reported in the delta.
+        
+        Args:
+            adapter (ATSAdapter): Adapter for the current page's platform
+            
+        Returns:
+            int: Number of fields filled
+        """
+        plan = FillPlan()
+        adapter.plan(self.get_profile(), plan)
+        settings = delta_settings()
+        try:
+            plan, delta = filter_delta(plan, self.batch_filler.read_values(plan), settings)
+            applied, rejected = self.batch_filler.apply(plan)
+        except Exception as e:
+            logger.warning(f"{adapter.name} fast path failed, using generic filling: {e}")
+            return 0
+        
+        report_delta(self.run_report, delta, settings)
+        self.prefilled_fields.update(kept_fields(delta, settings))
+        field_status = self.run_report.setdefault("fields", {})
+        for entry in applied:
+            field_status[entry["field_name"]] = "filled"
+            self.prefilled_fields.add(entry["field_name"])
+        # Checkpointed together with the generic plan, see fill_current_page()
+        self.adapter_entries = applied
+        for entry, reason in rejected:
+            logger.info(f"{adapter.name} map missed {entry['field_name']} ({reason})")
+        
+        logger.info(f"Filled {len(applied)} fields from the {adapter.name} field map")
+        wrong = self.verify_fill(plan, applied)
+        self.frames.reset()
+        return len(applied) - wrong
+    
+    def fill_current_page(self):
+        """
+        Fill the application form on the current, already loaded page.
+        
+        Returns:
+            int: Number of fields filled
+        """
+        self.pacing.pause("page")
+        
+        # Known platforms fill their stable fields directly
+        adapter = self.detect_adapter()
+        self.run_report["platform"] = adapter.name if adapter else None
+        self.adapter_entries = []
+        adapter_filled = self.fill_with_adapter(adapter) if adapter else 0
+        
+        # Discover all form controls in one round trip
+        self.take_snapshot()
+        self.planner = None
+        watching = False
+        
+        # Plan every field first so they can be written in one batch, with
+        # controls assigned to profile fields for the whole page at once
+        if self.batch_fill and self.snapshot is not None:
+            self.fill_plan = FillPlan()
+            self.planner = FillPlanner(
+                self.snapshot, self.get_profile(), self.selector_cache, self.host, self.prefilled_fields
+            )
+            watching = self.start_watching()
+        
+        # Fill out different sections
+        personal_filled = self.fill_personal_info()
+        work_filled = self.fill_work_experience()
+        education_filled = self.fill_education()
+        questions_filled = self.fill_common_questions()
+        
+        total_filled = adapter_filled + personal_filled + work_filled + education_filled + questions_filled
+        if self.planner is not None:
+            # Fields that already hold their value are reported, not rewritten
+            self.planner.report_delta(self.run_report)
+        if self.checkpoint is not None and self.fill_plan is not None:
+            self.checkpoint.record_plan(self.adapter_entries + self.fill_plan.entries)
+        total_filled -= self.apply_fill_plan()
+        self.frames.reset()
+        
+        # Fill controls revealed by the values just written
+        dependent_filled = self.fill_dependent_fields() if watching else 0
+        total_filled += dependent_filled
+        
+        if self.selector_cache is not None:
+            self.selector_cache.save()
+        
+        logger.info(f"Auto-fill completed! Filled {total_filled} fields total:")
+        if adapter:
+            logger.info(f"  - {adapter.name} field map: {adapter_filled} fields")
+        logger.info(f"  - Personal info: {personal_filled} fields")
+        logger.info(f"  - Work experience: {work_filled} fields")
+        logger.info(f"  - Education: {education_filled} fields")
+        logger.info(f"  - Common questions: {questions_filled} fields")
+        if dependent_filled:
+            logger.info(f"  - Revealed while filling: {dependent_filled} fields")
+        logger.info(f"  - Page readiness wait: {self.run_report.get('page_wait', 0):.2f}s")
+        logger.info(f"  - Pacing delays: {self.pacing.total_slept:.2f}s")
+        
+        self.run_report["fields_filled"] = total_filled
+        self.run_report["time_slept"] = round(self.pacing.total_slept, 3)
+        return total_filled
+    
+    def resume_from_checkpoint(self):
+        """
+        Resume an interrupted fill of the current URL from its checkpoint,
+        without field discovery. Every checkpointed field is read back in one
+        call per frame and only the fields that are empty or wrong are filled.
+        Fields revealed by earlier values are replayed round by round, once the
+        page has settled after the previous round, and fields whose control had
+        no stable locator are discovered again.
+        
+        Returns:
+            int or None: Number of fields filled, or None if the page no longer
+            matches the checkpoint and has to be filled from scratch
+        """
+        rounds = self.checkpoint.rounds()
+        watching = len(rounds) > 1 and self.start_watching()
+        field_status = self.run_report.setdefault("fields", {})
+        kept = refilled = failed = 0
+        try:
+            for fill_round in rounds:
+                if fill_round and watching:
+                    self.frames.reset()
+                    self.watcher.wait_until_quiet(time.perf_counter() + self.watcher.settings["deadline"])
+                
+                plan = self.checkpoint.to_plan(fill_round)
+                # Fields in a frame that can no longer be read count as gone
+                mismatches = self.batch_filler.verify(plan, plan.entries, unreadable_missing=True)
+                self.frames.reset()
+                missing = sum(1 for _, actual in mismatches if actual is None)
+                if not fill_round and missing * 2 > len(plan.entries):
+                    logger.info(
+                        f"{missing} of {len(plan.entries)} checkpointed fields are gone, filling the page from scratch"
+                    )
+                    return None
+                
+                wrong = [entry for entry, _ in mismatches]
+                for entry in plan.entries:
+                    if entry not in wrong:
+                        field_status[entry["field_name"]] = "kept"
+                
+                self.fill_plan = FillPlan()
+                for entry in wrong:
+                    self.fill_plan.add_selector(
+                        entry["selector"], entry["value"], entry["field_name"], entry["kind"], entry["frame"]
+                    )
+                failed += self.apply_fill_plan()
+                self.frames.reset()
+                kept += len(plan.entries) - len(wrong)
+                refilled += len(wrong)
+        finally:
+            if watching:
+                self.watcher.stop()
+        
+        rediscovered = self.fill_unlocated_fields() if self.checkpoint.unlocated else 0
+        total_filled = kept + refilled - failed + rediscovered
+        logger.info(
+            f"Resumed from checkpoint: kept {kept} fields, refilled {refilled}, {failed} failed, "
+            f"{rediscovered} found again"
+        )
+        self.run_report["resumed"] = {"kept": kept, "refilled": refilled, "rediscovered": rediscovered}
+        self.run_report["fields_filled"] = total_filled
+        self.run_report["time_slept"] = round(self.pacing.total_slept, 3)
+        return total_filled
+    
+    def fill_unlocated_fields(self):
+        """
+        Fill the planned fields a checkpoint could not store a locator for, by
+        planning the page again for every field the checkpoint does not cover.
+        
+        Returns:
+            int: Number of fields filled
+        """
+        if self.take_snapshot() is None:
+            return 0
+        done = {entry["field_name"] for entry in self.checkpoint.entries}
+        planner = FillPlanner(self.snapshot, self.get_profile(), host=self.host, skip_fields=done)
+        self.fill_plan, _ = planner.plan()
+        planner.report_delta(self.run_report)
+        planned = len(self.fill_plan)
+        failed = self.apply_fill_plan()
+        self.frames.reset()
+        return planned - failed
+    
+    def fill_or_resume(self):
+        """
+        Fill the current page, resuming from a checkpoint left by an
+        interrupted run of the same URL when there is one.
+        
+        Returns:
+            int: Number of fields filled
+        """
+        total_filled = None
+        if self.checkpoint is not None and self.checkpoint.planned and self.checkpoint.entries:
+            total_filled = self.resume_from_checkpoint()
+        if total_filled is None:
+            total_filled = self.fill_current_page()
+        
+        # The URL is done, so a later run starts from scratch
+        if self.checkpoint is not None:
+            self.checkpoint.clear()
+        return total_filled
+    
+    def start_watching(self):
+        """
+        Start buffering controls that appear while the page is being filled.
+        
+        Returns:
+            bool: True if the page is being watched
+        """
+        if not self.watcher.enabled:
+            return False
+        try:
+            self.frames.reset()
+            self.watcher.start()
+            return True
+        except Exception as e:
+            logger.debug(f"Could not watch the page for new fields: {e}")
+            return False
+    
+    def fill_dependent_fields(self):
+        """
+        Fill controls revealed by earlier answers, such as a state field that
+        appears once a country is picked. New controls are handed back in
+        batches by the page's MutationObserver and planned on their own,
+        until the page is quiet, the deadline passes or max_rounds is reached.
+        
+        Returns:
+            int: Number of fields filled
+        """
+        settings = self.watcher.settings
+        start = time.perf_counter()
+        deadline = start + settings["deadline"]
+        known = {
+            field["handle"] for field in self.snapshot.fields
+            if not field.get("frame") and field["visible"] and field["enabled"]
+        }
+        done = {
+            field_name for field_name, status in self.run_report.get("fields", {}).items()
+            if status not in ("failed", "mismatch")
+        } | self.prefilled_fields
+        
+        filled = 0
+        rounds = 0
+        try:
+            while rounds < settings["max_rounds"]:
+                self.frames.reset()
+                fresh = self.watcher.collect(known, deadline)
+                if not fresh:
+                    break
+                rounds += 1
+                known.update(field["handle"] for field in fresh)
+                
+                planner = FillPlanner(FieldSnapshot(fresh), self.get_profile(), host=self.host, skip_fields=done)
+                plan, _ = planner.plan()
+                planner.report_delta(self.run_report)
+                logger.info(f"{len(fresh)} new controls appeared, {len(plan)} to fill")
+                if not plan.entries:
+                    continue
+                
+                if self.checkpoint is not None:
+                    self.checkpoint.record_entries(plan.entries, rounds)
+                self.fill_plan = plan
+                filled += len(plan) - self.apply_fill_plan()
+                done.update(entry["field_name"] for entry in plan.entries)
+        except Exception as e:
+            logger.warning(f"Stopped filling revealed fields: {e}")
+        finally:
+            self.fill_plan = None
+            self.frames.reset()
+            self.watcher.stop()
+        
+        self.run_report["dependent_fields"] = {
+            "rounds": rounds,
+            "filled": filled,
+            "seconds": round(time.perf_counter() - start, 3)
+        }
+        return filled
+    
+    def fill_wizard_steps(self, max_steps):
+        """
+        Fill a multi-step application step by step, clicking "Next"/"Continue"
+        between steps. Stops at the review or submit step, which is left for the
+        user; submit controls are never clicked.
+        
+        Args:
+            max_steps (int): Maximum number of steps to fill
+            
+        Returns:
+            int: Number of fields filled across all steps
+        """
+        steps = self.run_report["steps"] = []
+        total_filled = 0
+        
+        # A field missing from one step is usually on another, so cache misses
+        # are only counted once for the whole application
+        if self.selector_cache is not None:
+            self.selector_cache.defer_misses()
+        try:
+            for number in range(1, max_steps + 1):
+                start = time.perf_counter()
+                filled = self.fill_current_page()
+                total_filled += filled
+                step = {
+                    "step": number,
+                    "url": self.driver.current_url,
+                    "fields_filled": filled,
+                    "fill_seconds": round(time.perf_counter() - start, 3)
+                }
+                steps.append(step)
+                
+                try:
+                    probe = self.steps.probe()
+                except Exception as e:
+                    logger.warning(f"Could not inspect step {number}: {e}")
+                    step["stopped"] = "probe failed"
+                    break
+                
+                reason = self.steps.final_step_reason(probe)
+                if reason:
+                    step["stopped"] = reason
+                    break
+                if number == max_steps:
+                    step["stopped"] = "step limit"
+                    break
+                
+                logger.info(f"Step {number}: filled {filled} fields, continuing with '{probe['next']}'")
+                result = self.steps.advance(probe)
+                step["wait_seconds"] = round(result["waited"], 3)
+                if not result["advanced"]:
+                    # Usually a required field the profile could not fill
+                    step["stopped"] = "step did not advance"
+                    break
+        finally:
+            if self.selector_cache is not None:
+                self.selector_cache.flush_misses()
+                self.selector_cache.save()
+        
+        for step in steps:
+            logger.info(
+                f"  - Step {step['step']}: {step['fields_filled']} fields in {step['fill_seconds']:.2f}s"
+                f", next step after {step.get('wait_seconds', 0):.2f}s"
+            )
+        logger.info(f"Stopped after step {len(steps)}: {steps[-1].get('stopped')}")
+        
+        self.run_report["fields_filled"] = total_filled
+        return total_filled
+    
+    def auto_fill_application(self, url, notify=True, wizard=None):
         """
         Main method to auto-fill a job application.
         
         Args:
             url (str): URL of the job application page
+            notify (bool): Show a completion notification when done
+            wizard (bool): Continue through multi-step applications, defaults to
+                BROWSER_SETTINGS["wizard"]["enabled"]
         """
+        settings = dict(DEFAULT_WIZARD_SETTINGS)
+        settings.update(config.BROWSER_SETTINGS.get("wizard") or {})
+        if wizard is None:
+            wizard = settings["enabled"]
+        
         try:
             logger.info(f"Starting auto-fill for: {url}")
+            # The profile is resolved once here and reused by every step
+            self.start_run(url)
             
-            # Navigate to the application page
+            # Navigate to the application page and wait until it settles
             self.driver.get(url)
-            time.sleep(3)  # Wait for page to load
-            
-            # Fill out different sections
-            personal_filled = self.fill_personal_info()
-            work_filled = self.fill_work_experience()
-            education_filled = self.fill_education()
-            questions_filled = self.fill_common_questions()
-            
-            total_filled = personal_filled + work_filled + education_filled + questions_filled
+            self.record_readiness(self.readiness.wait())
             
-            logger.info(f"Auto-fill completed! Filled {total_filled} fields total:")
-            logger.info(f"  - Personal info: {personal_filled} fields")
-            logger.info(f"  - Work experience: {work_filled} fields")
-            logger.info(f"  - Education: {education_filled} fields")
-            logger.info(f"  - Common questions: {questions_filled} fields")
+            if wizard:
+                # Steps share the URL, so a checkpoint could not tell them apart
+                self.checkpoint = None
+                total_filled = self.fill_wizard_steps(settings["max_steps"])
+            else:
+                total_filled = self.fill_or_resume()
             
             # Show notification
-            self.show_completion_notification(total_filled)
+            if notify:
+                self.show_completion_notification(total_filled)
             
             return total_filled
             
@@ -420,6 +1035,78 @@ class JobApplicationFiller:
             logger.error(f"Error during auto-fill: {e}")
             raise
     
+    def auto_fill_applications_in_tabs(self, urls, max_open_tabs=None, notify=True):
+        """
+        Fill several applications in one browser, each in its own tab.
+        
+        Pages load in parallel tabs while the filler works on whichever tab is
+        ready first, so network waits overlap instead of adding up. Every tab
+        is left open for review.
+        
+        Args:
+            urls (list): URLs of the job application pages
+            max_open_tabs (int): Maximum number of tabs loading at the same time
+            notify (bool): Show a completion notification when done
+            
+        Returns:
+            list: One result dict per URL, in completion order
+        """
+        settings = config.BROWSER_SETTINGS.get("multi_tab", {})
+        max_open_tabs = max_open_tabs or settings.get("max_open_tabs", 6)
+        queue = list(urls)
+        loading = {}  # window handle -> (url, load start time)
+        results = []
+        
+        def open_next_tab():
+            url = queue.pop(0)
+            self.driver.switch_to.new_window("tab")
+            self.readiness.install()
+            # Navigate without blocking on the page load
+            self.driver.execute_script("window.location.href = arguments[0];", url)
+            loading[self.driver.current_window_handle] = (url, time.perf_counter())
+            logger.info(f"Opened tab for: {url}")
+        
+        while queue or loading:
+            while queue and len(loading) < max_open_tabs:
+                open_next_tab()
+            
+            progressed = False
+            for handle, (url, started) in list(loading.items()):
+                self.driver.switch_to.window(handle)
+                waited = time.perf_counter() - started
+                try:
+                    state = self.readiness.probe()
+                    ready = state["ready"] and state["url"] != "about:blank"
+                except Exception as e:
+                    logger.debug(f"Readiness probe failed for {url}: {e}")
+                    ready = False
+                if not ready and waited < self.readiness.settings["deadline"]:
+                    continue
+                
+                del loading[handle]
+                progressed = True
+                self.start_run(url)
+                self.record_readiness({"ready": ready, "waited": waited})
+                result = {"url": url, "window": handle}
+                try:
+                    result["fields_filled"] = self.fill_or_resume()
+                    result["status"] = "ok"
+                except Exception as e:
+                    logger.error(f"Error during auto-fill of {url}: {e}")
+                    result["status"] = "error"
+                    result["error"] = str(e)
+                result["report"] = self.run_report
+                results.append(result)
+            
+            if not progressed:
+                time.sleep(self.readiness.settings["poll_interval"])
+        
+        total_filled = sum(result.get("fields_filled", 0) for result in results)
+        logger.info(f"Filled {total_filled} fields across {len(results)} tabs")
+        if notify:
+            self.show_completion_notification(total_filled)
+        return results
+    
     def show_completion_notification(self, fields_filled):
         """Show a notification that auto-fill is complete."""
         try:
@@ -450,6 +1137,6 @@ class JobApplicationFiller:
     
     def close(self):
         """Close the browser and clean up."""
-        if self.driver:
-            self.driver.quit()
+        if self.driver and self.owns_driver:
+            quit_chrome_driver(self.driver)
             logger.info("Browser closed") 
\ No newline at end of file
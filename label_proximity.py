@@ -0,0 +1,111 @@
+"""
+Label inference for the Job Application Auto-Fill Bot.
+Pairs form controls that have no label with the question text rendered next to
+them in plain elements, using the positions collected by the snapshot and a
+uniform grid over the text blocks so each control only looks at its neighbours.
+"""
+
+import logging
+from collections import defaultdict
+
+logger = logging.getLogger(__name__)
+
+# Grid cell size and the largest gap between a control and its question text, in pixels
+GRID_CELL = 100
+MAX_DISTANCE = 200
+# A block this far below a control's top edge still counts as on the same row
+ROW_TOLERANCE = 8
+
+
+class TextGrid:
+    """Spatial index of text blocks, bucketed into a uniform grid by bounding box."""
+
+    def __init__(self, blocks, cell=GRID_CELL):
+        """
+        Args:
+            blocks (list): Text blocks with "text" and "box" [left, top, width, height]
+            cell (int): Grid cell size in pixels
+        """
+        self.cell = cell
+        self.cells = defaultdict(list)
+        for block in blocks:
+            left, top, width, height = block["box"]
+            for column in range(int(left // cell), int((left + width) // cell) + 1):
+                for row in range(int(top // cell), int((top + height) // cell) + 1):
+                    self.cells[(column, row)].append(block)
+
+    def near(self, box, radius):
+        """
+        Text blocks in the grid cells within a radius of a box.
+
+        Returns:
+            list: Candidate blocks, each listed once
+        """
+        left, top, width, height = box
+        first_column, last_column = int((left - radius) // self.cell), int((left + width) // self.cell)
+        first_row, last_row = int((top - radius) // self.cell), int((top + height) // self.cell)
+        found = {}
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                for block in self.cells.get((column, row), ()):
+                    found[id(block)] = block
+        return list(found.values())
+
+
+def preceding_gap(box, block_box):
+    """
+    Distance from a control back to a text block that precedes it in reading
+    order, i.e. ends above the control or sits to its left on the same row.
+
+    Returns:
+        float or None: Gap in pixels, or None if the block does not precede the control
+    """
+    left, top, width, height = box
+    block_left, block_top, block_width, block_height = block_box
+    block_right, block_bottom = block_left + block_width, block_top + block_height
+
+    if block_bottom <= top + ROW_TOLERANCE:
+        # Above: vertical gap, plus any horizontal offset
+        dx = max(block_left - (left + width), left - block_right, 0)
+        return ((top - block_bottom) ** 2 + dx ** 2) ** 0.5
+    if block_right <= left and block_top < top + height and block_bottom > top:
+        # Left of the control on the same row
+        return float(left - block_right)
+    return None
+
+
+def infer_labels(fields, blocks, max_distance=MAX_DISTANCE):
+    """
+    Give every control without a label the nearest text block preceding it,
+    stored as "nearby_text".
+
+    Args:
+        fields (list): Snapshot records of one document, with "box"
+        blocks (list): Text blocks of the same document
+
+    Returns:
+        int: Number of controls that were given a nearby text
+    """
+    unlabeled = [
+        field for field in fields
+        if field.get("box") and field["box"][2] and field["box"][3]
+        and not field.get("label")
+        and field.get("accessible_name", "") in ("", field.get("placeholder", ""))
+    ]
+    if not unlabeled or not blocks:
+        return 0
+
+    grid = TextGrid(blocks)
+    inferred = 0
+    for field in unlabeled:
+        best, best_gap = None, max_distance
+        for block in grid.near(field["box"], max_distance):
+            gap = preceding_gap(field["box"], block["box"])
+            if gap is not None and gap <= best_gap:
+                best, best_gap = block, gap
+        if best is not None:
+            field["nearby_text"] = best["text"]
+            inferred += 1
+
+    logger.debug(f"Inferred labels for {inferred} of {len(unlabeled)} unlabeled controls")
+    return inferred
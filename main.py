@@ -6,11 +6,25 @@ Provides a simple interface to run the auto-fill functionality.
 import sys
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
-from form_filler import JobApplicationFiller
-import config_manager as config
+from form_filler import JobApplicationFiller, create_chrome_driver, quit_chrome_driver
+from driver_pool import DriverPool
+import config
+import atexit
 import threading
 import time
 
+_driver_pool = None
+
+def get_driver_pool():
+    """Return the process-wide pool of warm Chrome sessions, creating it on first use."""
+    global _driver_pool
+    if _driver_pool is None:
+        _driver_pool = DriverPool(
+            create_chrome_driver, config.BROWSER_SETTINGS.get("driver_pool"), quit_chrome_driver
+        )
+        atexit.register(_driver_pool.close)
+    return _driver_pool
+
 class AutoFillGUI:
     def __init__(self):
         self.root = tk.Tk()
@@ -145,14 +159,19 @@ You must review and submit the form yourself.
             self.log_status(f"Starting auto-fill for: {url}")
             self.log_status("Initializing browser...")
             
-            # Create filler instance
-            filler = JobApplicationFiller()
+            # Reuse a warm browser session from the pool
+            pool = get_driver_pool()
+            driver = pool.acquire(url)
+            filler = JobApplicationFiller(driver=driver)
             
             self.log_status("Browser initialized successfully")
             self.log_status("Navigating to application page...")
             
             # Run auto-fill
-            fields_filled = filler.auto_fill_application(url)
+            try:
+                fields_filled = filler.auto_fill_application(url)
+            finally:
+                pool.release(driver, url)
             
             self.log_status(f"Auto-fill completed! Filled {fields_filled} fields.")
             self.log_status("Please review the form and submit manually.")
@@ -361,8 +380,22 @@ Troubleshooting:
         """Start the GUI application."""
         # Start auto-update check on startup
         self.start_auto_update_check()
+        self.start_driver_warm_up()
         self.root.mainloop()
     
+    def start_driver_warm_up(self):
+        """Start the pooled browser sessions in the background so the first fill starts warm."""
+        def warm_up():
+            try:
+                get_driver_pool().warm_up()
+            except Exception:
+                # The first fill will start a session itself
+                pass
+        
+        thread = threading.Thread(target=warm_up)
+        thread.daemon = True
+        thread.start()
+    
     def start_auto_update_check(self):
         """Start automatic update checking."""
         def auto_check():
@@ -521,6 +554,9 @@ def main():
     if len(sys.argv) > 1 and sys.argv[1] == "--cli":
         # Command line mode
         run_cli_mode()
+    elif len(sys.argv) > 1 and sys.argv[1] == "--batch":
+        # Batch mode
+        run_batch_mode(sys.argv[2:])
     else:
         # GUI mode
         app = AutoFillGUI()
@@ -544,8 +580,11 @@ def run_cli_mode():
     print(f"\nStarting auto-fill for: {url}")
     print("Initializing browser...")
     
+    pool = get_driver_pool()
+    driver = None
     try:
-        filler = JobApplicationFiller()
+        driver = pool.acquire(url)
+        filler = JobApplicationFiller(driver=driver)
         fields_filled = filler.auto_fill_application(url)
         
         print(f"\nAuto-fill completed! Filled {fields_filled} fields.")
@@ -553,11 +592,68 @@ def run_cli_mode():
         print("Browser will remain open for your review.")
         
         input("\nPress Enter to close the browser...")
-        filler.close()
         
     except Exception as e:
         print(f"Error: {e}")
         input("Press Enter to exit...")
+    
+    finally:
+        # The session stays warm for the next run and is closed on exit
+        if driver is not None:
+            pool.release(driver, url)
+
+def run_batch_mode(args):
+    """Fill every URL in a file across parallel headless browsers."""
+    import argparse
+    from batch_runner import load_urls, run_batch
+    
+    parser = argparse.ArgumentParser(prog="main.py --batch", description="Fill a list of job application URLs.")
+    parser.add_argument("urls_file", help="Text file with one URL per line, or a JSONL file")
+    parser.add_argument("--output", default="batch_results.jsonl", help="JSONL file for per-URL results")
+    parser.add_argument("--workers", type=int, default=None, help="Number of browser worker processes")
+    parser.add_argument("--headed", action="store_true", help="Show the worker browser windows")
+    parser.add_argument("--backend", choices=["selenium", "cdp"], default=None,
+                        help="Browser automation backend (default: BROWSER_SETTINGS['backend'])")
+    parser.add_argument("--keep-open", action="store_true",
+                        help="Leave the worker browsers open with every filled page for review (implies --headed)")
+    parser.add_argument("--tabs", action="store_true",
+                        help="Fill every URL in its own tab of one browser and leave them open for review")
+    options = parser.parse_args(args)
+    
+    urls = load_urls(options.urls_file)
+    if not urls:
+        print("No valid URLs found. Exiting.")
+        return
+    
+    if options.tabs:
+        run_tabs_mode(urls, options.output)
+        return
+    
+    print(f"\nFilling {len(urls)} applications. Results: {options.output}")
+    headed = options.headed or options.keep_open
+    summary = run_batch(urls, options.output, options.workers, False if headed else None,
+                        options.backend, options.keep_open)
+    print(f"\nBatch complete! {summary['succeeded']} of {summary['total']} succeeded "
+          f"in {summary['seconds']:.1f}s.")
+
+def run_tabs_mode(urls, output_path):
+    """Fill all URLs in tabs of a single browser, leaving them open for review."""
+    import json
+    
+    print(f"\nOpening {len(urls)} applications in tabs. Results: {output_path}")
+    filler = JobApplicationFiller()
+    try:
+        results = filler.auto_fill_applications_in_tabs(urls, notify=False)
+        with open(output_path, 'a', encoding='utf-8') as out:
+            for result in results:
+                out.write(json.dumps(result, default=str) + "\n")
+        
+        succeeded = sum(1 for result in results if result["status"] == "ok")
+        print(f"\nFilled {succeeded} of {len(urls)} applications.")
+        print("Please review each tab and submit manually.")
+        input("\nPress Enter to close the browser...")
+    finally:
+        filler.close()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
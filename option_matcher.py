@@ -0,0 +1,176 @@
+"""
+Select option matching for the Job Application Auto-Fill Bot.
+Maps a profile value such as "CA" or "BS" to the matching <option> of a select
+field ("California", "Bachelor of Science") using a normalized synonym index
+built once at import time.
+"""
+
+import re
+
+# Each group lists interchangeable ways of writing the same choice
+US_STATES = [
+    ["AL", "Alabama"], ["AK", "Alaska"], ["AZ", "Arizona"], ["AR", "Arkansas"],
+    ["CA", "California"], ["CO", "Colorado"], ["CT", "Connecticut"], ["DE", "Delaware"],
+    ["DC", "District of Columbia", "Washington DC", "Washington D.C."],
+    ["FL", "Florida"], ["GA", "Georgia"], ["HI", "Hawaii"], ["ID", "Idaho"],
+    ["IL", "Illinois"], ["IN", "Indiana"], ["IA", "Iowa"], ["KS", "Kansas"],
+    ["KY", "Kentucky"], ["LA", "Louisiana"], ["ME", "Maine"], ["MD", "Maryland"],
+    ["MA", "Massachusetts"], ["MI", "Michigan"], ["MN", "Minnesota"], ["MS", "Mississippi"],
+    ["MO", "Missouri"], ["MT", "Montana"], ["NE", "Nebraska"], ["NV", "Nevada"],
+    ["NH", "New Hampshire"], ["NJ", "New Jersey"], ["NM", "New Mexico"], ["NY", "New York"],
+    ["NC", "North Carolina"], ["ND", "North Dakota"], ["OH", "Ohio"], ["OK", "Oklahoma"],
+    ["OR", "Oregon"], ["PA", "Pennsylvania"], ["RI", "Rhode Island"], ["SC", "South Carolina"],
+    ["SD", "South Dakota"], ["TN", "Tennessee"], ["TX", "Texas"], ["UT", "Utah"],
+    ["VT", "Vermont"], ["VA", "Virginia"], ["WA", "Washington"], ["WV", "West Virginia"],
+    ["WI", "Wisconsin"], ["WY", "Wyoming"], ["PR", "Puerto Rico"]
+]
+
+# Countries whose names are commonly written in more than one way
+COUNTRIES = [
+    ["US", "USA", "United States", "United States of America", "America", "U.S.", "U.S.A."],
+    ["GB", "UK", "United Kingdom", "Great Britain", "United Kingdom of Great Britain and Northern Ireland", "U.K."],
+    ["CA", "CAN", "Canada"],
+    ["AU", "AUS", "Australia"],
+    ["NZ", "New Zealand"],
+    ["IE", "Ireland", "Republic of Ireland"],
+    ["DE", "DEU", "Germany", "Deutschland"],
+    ["FR", "FRA", "France"],
+    ["ES", "Spain", "España"],
+    ["IT", "Italy"],
+    ["NL", "Netherlands", "The Netherlands", "Holland"],
+    ["BE", "Belgium"],
+    ["CH", "Switzerland"],
+    ["AT", "Austria"],
+    ["SE", "Sweden"],
+    ["NO", "Norway"],
+    ["DK", "Denmark"],
+    ["FI", "Finland"],
+    ["PL", "Poland"],
+    ["PT", "Portugal"],
+    ["CZ", "Czech Republic", "Czechia"],
+    ["RU", "Russia", "Russian Federation"],
+    ["UA", "Ukraine"],
+    ["TR", "Turkey", "Türkiye", "Turkiye"],
+    ["IL", "Israel"],
+    ["AE", "UAE", "United Arab Emirates"],
+    ["IN", "IND", "India"],
+    ["PK", "Pakistan"],
+    ["BD", "Bangladesh"],
+    ["CN", "China", "People's Republic of China", "PRC"],
+    ["HK", "Hong Kong", "Hong Kong SAR"],
+    ["TW", "Taiwan"],
+    ["JP", "Japan"],
+    ["KR", "South Korea", "Korea", "Republic of Korea", "Korea, Republic of"],
+    ["VN", "Vietnam", "Viet Nam"],
+    ["PH", "Philippines", "The Philippines"],
+    ["SG", "Singapore"],
+    ["MY", "Malaysia"],
+    ["ID", "Indonesia"],
+    ["TH", "Thailand"],
+    ["MX", "Mexico"],
+    ["BR", "Brazil", "Brasil"],
+    ["AR", "Argentina"],
+    ["CO", "Colombia"],
+    ["CL", "Chile"],
+    ["ZA", "South Africa"],
+    ["NG", "Nigeria"],
+    ["EG", "Egypt"],
+    ["IR", "Iran", "Iran, Islamic Republic of"]
+]
+
+DEGREES = [
+    ["High School", "High School Diploma", "GED", "Secondary School", "Diploma"],
+    ["Associate", "Associate's", "Associates", "Associate Degree", "Associate's Degree",
+     "AA", "AS", "A.A.", "A.S."],
+    ["Bachelor", "Bachelor's", "Bachelors", "Bachelor Degree", "Bachelor's Degree", "Bachelors Degree",
+     "BA", "BS", "BSc", "B.A.", "B.S.", "B.Sc.", "BEng", "B.E.", "B.Tech", "BTech",
+     "Bachelor of Arts", "Bachelor of Science", "Bachelor of Engineering", "Undergraduate"],
+    ["Master", "Master's", "Masters", "Master Degree", "Master's Degree", "Masters Degree",
+     "MA", "MS", "MSc", "M.A.", "M.S.", "M.Sc.", "MEng", "M.Eng.",
+     "Master of Arts", "Master of Science", "Master of Engineering"],
+    ["MBA", "M.B.A.", "Master of Business Administration"],
+    ["PhD", "Ph.D.", "Doctorate", "Doctoral", "Doctoral Degree", "Doctor of Philosophy"],
+    ["JD", "J.D.", "Juris Doctor", "Law Degree"],
+    ["MD", "M.D.", "Doctor of Medicine"]
+]
+
+YES_NO = [
+    ["Yes", "Y", "True", "I do", "I am", "I will"],
+    ["No", "N", "False", "I do not", "I am not", "I will not"]
+]
+
+# Groups in lookup order; a value found in several (e.g. "CA") resolves to the
+# first group that has a matching option on the page
+SYNONYM_GROUPS = US_STATES + COUNTRIES + DEGREES + YES_NO
+
+
+def normalize(text):
+    """
+    Normalize option text for comparison: lower case, "&" as "and", no
+    punctuation or apostrophes, single spaces.
+    """
+    text = str(text).lower().replace("&", " and ").replace("'", "").replace("’", "")
+    text = re.sub(r"(?<=\w)\.(?=\w)", "", text)  # "B.S." -> "BS."
+    return " ".join(re.sub(r"[^\w\s]", " ", text).split())
+
+
+def build_synonym_index(groups):
+    """
+    Map every normalized synonym to the indexes of the groups it belongs to.
+
+    Returns:
+        tuple: (index dict, list of normalized synonym sets per group)
+    """
+    normalized_groups = [{normalize(synonym) for synonym in group} for group in groups]
+    index = {}
+    for group_id, synonyms in enumerate(normalized_groups):
+        for synonym in synonyms:
+            index.setdefault(synonym, []).append(group_id)
+    return index, normalized_groups
+
+
+SYNONYM_INDEX, NORMALIZED_GROUPS = build_synonym_index(SYNONYM_GROUPS)
+
+
+def match_option(value, options):
+    """
+    Pick the option of a select field that corresponds to a profile value.
+
+    Tries, in order: exact text or value, normalized text or value, synonym
+    groups, and finally a unique option containing the value as whole words.
+
+    Args:
+        value (str): Value to select
+        options (list): Option records with "text" and "value"
+
+    Returns:
+        dict or None: The matching option record
+    """
+    wanted = str(value).strip()
+    if not wanted or not options:
+        return None
+
+    for option in options:
+        if option["text"].strip() == wanted or option["value"] == wanted:
+            return option
+
+    normalized = [(normalize(option["text"]), normalize(option["value"]), option) for option in options]
+    key = normalize(wanted)
+    if not key:
+        return None
+
+    for text, option_value, option in normalized:
+        if key in (text, option_value):
+            return option
+
+    for group_id in SYNONYM_INDEX.get(key, []):
+        synonyms = NORMALIZED_GROUPS[group_id]
+        for text, option_value, option in normalized:
+            if text in synonyms or option_value in synonyms:
+                return option
+
+    pattern = re.compile(rf"\b{re.escape(key)}\b")
+    contained = [option for text, _, option in normalized if pattern.search(text)]
+    if len(contained) == 1 and len(key) >= 4:
+        return contained[0]
+    return None
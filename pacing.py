@@ -0,0 +1,132 @@
+"""
+Pacing policy for the Job Application Auto-Fill Bot.
+Centralizes every deliberate delay so batch runs can go at full speed while
+interactive runs can still behave like a person filling the form.
+"""
+
+import time
+import random
+import logging
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# Delays are in seconds. "jitter" scales each delay by a random factor in
+# [1 - jitter, 1 + jitter].
+DEFAULT_PACING_SETTINGS = {
+    "profile": "fast",
+    "profiles": {
+        "fast": {"clear": 0, "field": 0, "page": 0, "jitter": 0},
+        "human": {"clear": 0.5, "field": 0.5, "page": 1.0, "jitter": 0.4}
+    },
+    "domains": {}  # e.g. {"myworkdayjobs.com": "human"}
+}
+
+
+class PacingPolicy:
+    """Decides how long to pause between automation steps and tracks the total."""
+
+    def __init__(self, settings=None):
+        settings = settings or {}
+        self.profiles = dict(DEFAULT_PACING_SETTINGS["profiles"])
+        self.profiles.update(settings.get("profiles", {}))
+        self.default_profile = settings.get("profile", DEFAULT_PACING_SETTINGS["profile"])
+        self.domains = settings.get("domains", {})
+        self.delays = self.resolve_profile(self.default_profile)
+        self.total_slept = 0.0
+
+    def resolve_profile(self, profile):
+        """
+        Turn a profile name or a dict of overrides into a full set of delays.
+
+        Args:
+            profile (str or dict): Profile name, or delays layered over the default profile
+
+        Returns:
+            dict: Delays for each pause kind
+        """
+        if isinstance(profile, dict):
+            delays = dict(self.profiles.get(self.default_profile, self.profiles["fast"]))
+            delays.update(profile)
+            return delays
+
+        if profile not in self.profiles:
+            logger.warning(f"Unknown pacing profile '{profile}', using 'fast'")
+            profile = "fast"
+        return dict(self.profiles[profile])
+
+    def for_url(self, url):
+        """
+        Select the delays for a URL, applying any per-domain override.
+
+        Args:
+            url (str): URL about to be filled
+        """
+        host = (urlparse(url).hostname or "").lower()
+        profile = self.default_profile
+        for domain, override in self.domains.items():
+            domain = domain.lower()
+            if host == domain or host.endswith("." + domain):
+                profile = override
+                break
+
+        self.delays = self.resolve_profile(profile)
+
+    def reset(self):
+        """Reset the sleep counter at the start of a run."""
+        self.total_slept = 0.0
+
+    def delay(self, kind):
+        """
+        Work out the next delay of the given kind and count it as slept.
+
+        Used directly by callers that sleep themselves, e.g. with asyncio.sleep.
+
+        Args:
+            kind (str): Pause kind (clear, field, page)
+
+        Returns:
+            float: Seconds to sleep
+        """
+        delay = self.delays.get(kind, 0)
+        if delay <= 0:
+            return 0.0
+
+        jitter = self.delays.get("jitter", 0)
+        if jitter:
+            delay *= random.uniform(max(0.0, 1 - jitter), 1 + jitter)
+
+        self.total_slept += delay
+        return delay
+
+    def settle(self, seconds):
+        """
+        Count a fixed wait that is not part of the pacing profile, such as giving
+        the page time to re-render before reading values back.
+
+        Used directly by callers that sleep themselves, e.g. with asyncio.sleep.
+
+        Args:
+            seconds (float): Length of the wait
+
+        Returns:
+            float: Seconds to sleep
+        """
+        seconds = max(0.0, seconds)
+        self.total_slept += seconds
+        return seconds
+
+    def pause(self, kind):
+        """
+        Sleep for the configured delay of the given kind.
+
+        Args:
+            kind (str): Pause kind (clear, field, page)
+
+        Returns:
+            float: Seconds slept
+        """
+        delay = self.delay(kind)
+        if delay:
+            time.sleep(delay)
+        return delay
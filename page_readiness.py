@@ -0,0 +1,196 @@
+"""
+Page readiness detection for the Job Application Auto-Fill Bot.
+Waits until a page has loaded, gone network-idle and stopped mutating its DOM,
+instead of sleeping for a fixed amount of time after navigation.
+"""
+
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_READINESS_SETTINGS = {
+    "deadline": 15,  # Seconds to wait at most per page
+    "dom_quiet_ms": 500,  # DOM must be unchanged for this long
+    "network_idle_ms": 500,  # No request may have finished within this window
+    "request_idle_cap_ms": 3000,  # Requests open longer than this (long-poll, streaming) are not waited for
+    "poll_interval": 0.1  # Seconds between readiness probes
+}
+
+# Tracks in-flight fetch/XHR requests with their start times, and the time of
+# the last DOM mutation. Installed before page scripts run when the driver
+# supports CDP, otherwise injected by the first probe.
+TRACKER_SCRIPT = """
+(function () {
+    if (window.__autofillReadiness) {
+        return;
+    }
+    var tracker = window.__autofillReadiness = {
+        pending: {},
+        nextRequest: 0,
+        lastNetwork: performance.now(),
+        lastMutation: performance.now()
+    };
+
+    function started() {
+        var request = tracker.nextRequest++;
+        tracker.pending[request] = performance.now();
+        tracker.lastNetwork = performance.now();
+        return function finished() {
+            delete tracker.pending[request];
+            tracker.lastNetwork = performance.now();
+        };
+    }
+
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function () {
+            var finished = started();
+            return originalFetch.apply(this, arguments).then(function (response) {
+                finished();
+                return response;
+            }, function (error) {
+                finished();
+                throw error;
+            });
+        };
+    }
+
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        this.addEventListener('loadend', started());
+        return originalSend.apply(this, arguments);
+    };
+
+    new MutationObserver(function () {
+        tracker.lastMutation = performance.now();
+    }).observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+})();
+"""
+
+# Takes the request idle cap in ms as its argument; requests open longer than
+# that are reported as long_running instead of pending.
+PROBE_SCRIPT = TRACKER_SCRIPT + """
+var tracker = window.__autofillReadiness;
+var now = performance.now();
+var pending = 0;
+var longRunning = 0;
+for (var request in tracker.pending) {
+    if (now - tracker.pending[request] > arguments[0]) {
+        longRunning += 1;
+    } else {
+        pending += 1;
+    }
+}
+var lastNetwork = tracker.lastNetwork;
+var resources = performance.getEntriesByType('resource');
+for (var i = 0; i < resources.length; i++) {
+    lastNetwork = Math.max(lastNetwork, resources[i].responseEnd);
+}
+return {
+    url: location.href,
+    ready_state: document.readyState,
+    pending: pending,
+    long_running: longRunning,
+    network_quiet_ms: now - lastNetwork,
+    dom_quiet_ms: now - tracker.lastMutation
+};
+"""
+
+
+def is_page_ready(state, settings):
+    """
+    Decide from a PROBE_SCRIPT reading whether the page has settled.
+
+    Args:
+        state (dict): Reading returned by PROBE_SCRIPT
+        settings (dict): Readiness thresholds, see DEFAULT_READINESS_SETTINGS
+
+    Returns:
+        bool: True if the page is loaded, network-idle and DOM-quiet
+    """
+    return (
+        state["ready_state"] == "complete"
+        and state["pending"] == 0
+        and state["network_quiet_ms"] >= settings["network_idle_ms"]
+        and state["dom_quiet_ms"] >= settings["dom_quiet_ms"]
+    )
+
+
+class PageReadinessDetector:
+    """Decides when a freshly loaded page is ready to be filled."""
+
+    def __init__(self, driver, settings=None):
+        self.driver = driver
+        self.settings = dict(DEFAULT_READINESS_SETTINGS)
+        self.settings.update(settings or {})
+
+    def install(self):
+        """
+        Register the tracker to run before any page script on every navigation.
+
+        Returns:
+            bool: True if the tracker was registered through CDP
+        """
+        try:
+            self.driver.execute_cdp_cmd(
+                "Page.addScriptToEvaluateOnNewDocument", {"source": TRACKER_SCRIPT}
+            )
+            return True
+        except Exception as e:
+            logger.info(f"Readiness tracker will be injected after load: {e}")
+            return False
+
+    def probe(self):
+        """
+        Take a single readiness reading of the current page.
+
+        Returns:
+            dict: Reading with url, ready_state, pending, long_running,
+            network_quiet_ms, dom_quiet_ms and an overall ready flag
+        """
+        state = self.driver.execute_script(PROBE_SCRIPT, self.settings["request_idle_cap_ms"])
+        state["ready"] = is_page_ready(state, self.settings)
+        return state
+
+    def wait(self, deadline=None):
+        """
+        Block until the page is ready or the deadline passes.
+
+        Args:
+            deadline (float): Seconds to wait at most, defaults to the configured deadline
+
+        Returns:
+            dict: Result with ready, waited (seconds) and the last probe reading
+        """
+        if deadline is None:
+            deadline = self.settings["deadline"]
+
+        start = time.perf_counter()
+        state = {}
+        while True:
+            try:
+                state = self.probe()
+                if state["ready"]:
+                    break
+            except Exception as e:
+                # Navigation in progress or page replaced mid-probe
+                logger.debug(f"Readiness probe failed: {e}")
+
+            if time.perf_counter() - start >= deadline:
+                break
+            time.sleep(self.settings["poll_interval"])
+
+        waited = time.perf_counter() - start
+        ready = bool(state.get("ready"))
+        if ready:
+            logger.info(f"Page ready after {waited:.2f}s")
+            if state.get("long_running"):
+                logger.debug(f"Not waiting for {state['long_running']} long-running requests")
+        else:
+            logger.warning(
+                f"Page not settled after {waited:.2f}s deadline "
+                f"(readyState={state.get('ready_state')}, pending requests={state.get('pending')})"
+            )
+
+        return {"ready": ready, "waited": waited, "state": state}
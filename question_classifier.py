@@ -0,0 +1,153 @@
+"""
+Question classification for the Job Application Auto-Fill Bot.
+Maps free-text application questions to COMMON_ANSWERS keys with one precompiled
+multi-keyword matcher (Aho-Corasick over words), scanning each field's text in a
+single pass.
+"""
+
+import re
+from collections import deque
+
+# Answer keys with the keywords that identify them, in priority order: when a
+# field mentions keywords of several keys, the earliest key wins. Keywords are
+# whole words or phrases, so "start" in "startup" or "notice" in "should notice"
+# does not count; ambiguous words are only listed as part of a phrase.
+QUESTION_KEYWORDS = [
+    ("why_interested", ["why", "interest", "interested", "motivation", "motivates", "why join"]),
+    ("salary_expectation", ["salary", "expectation", "expectations", "compensation", "desired pay"]),
+    ("availability", ["availability", "available to start", "when can you start", "earliest start"]),
+    ("relocation", ["relocation", "relocate", "relocating"]),
+    ("work_authorization", [
+        "authorization", "authorized", "authorised", "sponsor", "sponsorship", "visa", "legally"
+    ]),
+    ("notice_period", ["notice period", "weeks notice", "months notice"]),
+    ("remote_work", ["remote", "remotely", "work from home"])
+]
+
+# Older config files use these names for the same answers
+ANSWER_KEY_ALIASES = {
+    "why_interested": ["why_join"],
+    "salary_expectation": ["salary_expectations"]
+}
+
+# Snapshot attributes that describe what a field is asking for
+TEXT_ATTRIBUTES = ["name", "id", "placeholder", "label", "aria_label", "accessible_name", "nearby_text"]
+
+WORD_PATTERN = re.compile(r"[a-z]+|\d+")
+
+
+def split_words(text):
+    """Split text into lower-case words, breaking camelCase and snake_case apart."""
+    text = re.sub(r"([a-z])([A-Z])", r"\1 \2", text or "")
+    return WORD_PATTERN.findall(text.lower())
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton over words that finds all keyword phrases in a text in one pass."""
+
+    def __init__(self, keywords):
+        """
+        Args:
+            keywords (dict): Keyword as a tuple of lower-case words -> value reported when it occurs
+        """
+        self.transitions = [{}]
+        self.fail = [0]
+        self.outputs = [set()]
+
+        for keyword, value in keywords.items():
+            state = 0
+            for word in keyword:
+                if word not in self.transitions[state]:
+                    self.transitions.append({})
+                    self.fail.append(0)
+                    self.outputs.append(set())
+                    self.transitions[state][word] = len(self.transitions) - 1
+                state = self.transitions[state][word]
+            self.outputs[state].add(value)
+
+        # Breadth-first pass to build failure links
+        queue = deque(self.transitions[0].values())
+        while queue:
+            state = queue.popleft()
+            for word, next_state in self.transitions[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and word not in self.transitions[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.transitions[fallback].get(word, 0)
+                if self.fail[next_state] == next_state:
+                    self.fail[next_state] = 0
+                self.outputs[next_state] |= self.outputs[self.fail[next_state]]
+
+    def find(self, words):
+        """
+        Return the values of every keyword occurring in a text.
+
+        Args:
+            words (list): Lower-case words of the text, from split_words()
+
+        Returns:
+            set: Values of the matched keywords
+        """
+        found = set()
+        state = 0
+        for word in words:
+            while state and word not in self.transitions[state]:
+                state = self.fail[state]
+            state = self.transitions[state].get(word, 0)
+            if self.outputs[state]:
+                found |= self.outputs[state]
+        return found
+
+
+class QuestionClassifier:
+    """Classifies question fields into COMMON_ANSWERS keys."""
+
+    def __init__(self, keyword_table=None):
+        keyword_table = keyword_table or QUESTION_KEYWORDS
+        self.answer_keys = [key for key, _ in keyword_table]
+        keywords = {}
+        for priority, (_, words) in enumerate(keyword_table):
+            for word in words:
+                keywords.setdefault(tuple(split_words(word)), priority)
+        self.matcher = KeywordMatcher(keywords)
+
+    def classify_text(self, text):
+        """
+        Classify a piece of question text.
+
+        Returns:
+            str or None: The answer key, or None if no keyword occurs
+        """
+        priorities = self.matcher.find(split_words(text))
+        return self.answer_keys[min(priorities)] if priorities else None
+
+    def classify_field(self, field):
+        """
+        Classify a snapshot record from its name, id, placeholder, labels, accessible name
+        and, for controls without a label, the text next to it.
+
+        Returns:
+            str or None: The answer key, or None if the field is not a known question
+        """
+        return self.classify_text("\n".join(field.get(attr) or "" for attr in TEXT_ATTRIBUTES))
+
+
+def lookup_answer(answers, key):
+    """
+    Get a configured answer, accepting older names for the same key.
+
+    Args:
+        answers (dict): Configured common answers
+        key (str): Answer key from the classifier
+
+    Returns:
+        str: The answer, or an empty string if none is configured
+    """
+    for candidate in [key] + ANSWER_KEY_ALIASES.get(key, []):
+        if answers.get(candidate):
+            return answers[candidate]
+    return ""
+
+
+QUESTION_CLASSIFIER = QuestionClassifier()
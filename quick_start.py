@@ -21,7 +21,7 @@ def check_conda_environment():
 
 def check_dependencies():
     """Check if required packages are installed."""
-    required_packages = ['selenium', 'webdriver-manager']
+    required_packages = ['selenium', 'webdriver-manager', 'numpy']
     missing_packages = []
     
     for package in required_packages:
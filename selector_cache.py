@@ -0,0 +1,232 @@
+"""
+Learned selector cache for the Job Application Auto-Fill Bot.
+Remembers, per host, which selector found each profile field so later runs on the
+same site try it first, and keeps a global hit-rate table that reorders the
+fallback selector lists for sites that have not been seen yet.
+"""
+
+import os
+import json
+import time
+import logging
+import tempfile
+from pathlib import Path
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SELECTOR_CACHE_SETTINGS = {
+    "enabled": True,
+    "path": None,  # Cache file, defaults to .selector_cache.json next to this module
+    "ttl_days": 30,  # Host entries older than this are ignored and relearned
+    "max_misses": 2  # Drop a host entry after this many runs in a row where it matched nothing
+}
+
+
+def host_key(url):
+    """
+    Return the cache key for a URL: its lower-case host without a leading "www.".
+
+    Args:
+        url (str): Page URL
+
+    Returns:
+        str: Host key, empty if the URL has no host
+    """
+    host = (urlparse(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+class SelectorCache:
+    """Per-host winning selectors plus global selector hit rates, persisted as JSON."""
+
+    def __init__(self, settings=None):
+        """
+        Args:
+            settings (dict): Overrides for DEFAULT_SELECTOR_CACHE_SETTINGS
+        """
+        self.settings = dict(DEFAULT_SELECTOR_CACHE_SETTINGS)
+        self.settings.update(settings or {})
+        path = self.settings["path"]
+        self.path = Path(path) if path else Path(__file__).parent / ".selector_cache.json"
+        self.ttl = self.settings["ttl_days"] * 86400
+        self.data = self.load()
+
+        # Changes since the last save, merged into the file on save()
+        self.dirty_hosts = {}  # (host, field_name) -> entry, or None when invalidated
+        self.pending_stats = {}  # field_name -> selector -> [hits, tries]
+
+        # Misses and hits of a multi-step run, between defer_misses() and flush_misses()
+        self.deferred_misses = None
+        self.run_hits = None
+
+    def load(self):
+        """Load the cache file, starting empty if it is missing or unreadable."""
+        if self.path.exists():
+            try:
+                with open(self.path, 'r') as f:
+                    data = json.load(f)
+                data.setdefault("hosts", {})
+                data.setdefault("selectors", {})
+                return data
+            except (json.JSONDecodeError, OSError):
+                logger.warning("Selector cache is unreadable, starting a new one")
+        return {"hosts": {}, "selectors": {}}
+
+    def save(self):
+        """
+        Write the cache, merging this session's changes into the current file so
+        several worker processes can share it.
+        """
+        if not self.dirty_hosts and not self.pending_stats:
+            return
+
+        data = self.load()
+        for (host, field_name), entry in self.dirty_hosts.items():
+            fields = data["hosts"].setdefault(host, {})
+            if entry is None:
+                fields.pop(field_name, None)
+            else:
+                fields[field_name] = entry
+            if not fields:
+                del data["hosts"][host]
+
+        for field_name, selectors in self.pending_stats.items():
+            stats = data["selectors"].setdefault(field_name, {})
+            for selector, (hits, tries) in selectors.items():
+                counts = stats.setdefault(selector, [0, 0])
+                counts[0] += hits
+                counts[1] += tries
+
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".selector_cache.")
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not save selector cache: {e}")
+            return
+
+        self.data = data
+        self.dirty_hosts.clear()
+        self.pending_stats.clear()
+
+    def entry(self, host, field_name):
+        """Return the fresh cached entry for a host field, or None."""
+        entry = self.data["hosts"].get(host, {}).get(field_name)
+        if entry and time.time() - entry["updated"] <= self.ttl:
+            return entry
+        return None
+
+    def hit_rate(self, field_name, selector):
+        """Smoothed share of lookups of a field that this selector resolved."""
+        hits, tries = self.data["selectors"].get(field_name, {}).get(selector, (0, 0))
+        return (hits + 1) / (tries + 2)
+
+    def order(self, host, field_name, selectors):
+        """
+        Order selectors for a lookup: the host's cached winner first, then the
+        rest by global hit rate. Ties keep their configured order.
+
+        Args:
+            host (str): Host key from host_key()
+            field_name (str): Profile field being looked up
+            selectors (list): Configured selectors for the field
+
+        Returns:
+            list: The same selectors, reordered
+        """
+        ordered = sorted(selectors, key=lambda selector: -self.hit_rate(field_name, selector))
+        entry = self.entry(host, field_name)
+        if entry and entry["selector"] in ordered:
+            ordered.remove(entry["selector"])
+            ordered.insert(0, entry["selector"])
+        return ordered
+
+    def record_hit(self, host, field_name, selector, tried):
+        """
+        Record the selector that found a field.
+
+        Args:
+            host (str): Host key from host_key()
+            field_name (str): Profile field that was found
+            selector (str): Selector that matched
+            tried (list): Selectors tried before it, in order
+        """
+        if self.run_hits is not None:
+            self.run_hits.add((host, field_name))
+        stats = self.pending_stats.setdefault(field_name, {})
+        for missed in tried:
+            stats.setdefault(missed, [0, 0])[1] += 1
+        counts = stats.setdefault(selector, [0, 0])
+        counts[0] += 1
+        counts[1] += 1
+
+        entry = self.entry(host, field_name)
+        if entry and entry["selector"] == selector and not entry.get("misses"):
+            # Only refresh the timestamp once a day to keep saves small
+            if time.time() - entry["updated"] < 86400:
+                return
+        elif entry and entry["selector"] != selector:
+            logger.info(f"Selector for {field_name} on {host} changed to {selector}")
+
+        self._set(host, field_name, {"selector": selector, "updated": time.time(), "misses": 0})
+
+    def record_miss(self, host, field_name):
+        """
+        Record that no selector found a field on this host.
+
+        The field may just be absent from this page, so the cached entry is only
+        invalidated after max_misses misses in a row.
+        """
+        if self.deferred_misses is not None:
+            self.deferred_misses.add((host, field_name))
+            return
+        entry = self.entry(host, field_name)
+        if not entry:
+            return
+        misses = entry.get("misses", 0) + 1
+        if misses >= self.settings["max_misses"]:
+            logger.info(f"Invalidating cached selector for {field_name} on {host}")
+            self._set(host, field_name, None)
+        else:
+            self._set(host, field_name, dict(entry, misses=misses))
+
+    def defer_misses(self):
+        """
+        Collect misses instead of recording them, for a run that fills several
+        pages. Each page of a multi-step application only shows some of the
+        fields, so a miss is only recorded once per run, by flush_misses(), and
+        only for fields that no page of the run found.
+        """
+        self.deferred_misses = set()
+        self.run_hits = set()
+
+    def flush_misses(self):
+        """Record the misses collected since defer_misses() and stop collecting."""
+        missed = (self.deferred_misses or set()) - (self.run_hits or set())
+        self.deferred_misses = None
+        self.run_hits = None
+        for host, field_name in sorted(missed):
+            self.record_miss(host, field_name)
+
+    def invalidate(self, host, field_name=None):
+        """
+        Forget the cached selectors of a host, e.g. after the site changed its markup.
+
+        Args:
+            host (str): Host key from host_key()
+            field_name (str): Only forget this field, defaults to every field
+        """
+        field_names = [field_name] if field_name else list(self.data["hosts"].get(host, {}))
+        for name in field_names:
+            self._set(host, name, None)
+
+    def _set(self, host, field_name, entry):
+        """Apply a host entry change in memory and mark it for saving."""
+        fields = self.data["hosts"].setdefault(host, {})
+        if entry is None:
+            fields.pop(field_name, None)
+        else:
+            fields[field_name] = entry
+        self.dirty_hosts[(host, field_name)] = entry
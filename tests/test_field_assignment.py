@@ -0,0 +1,119 @@
+"""Tests for the global field assignment."""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from field_assignment import linear_assignment
+from field_discovery import FieldSnapshot
+from fill_planner import FillPlanner
+
+PROFILE = {
+    "personal_info": {
+        "first_name": "Ada", "last_name": "Lovelace", "email": "ada@example.com", "phone": "555 0100",
+        "address": "1 Main St", "city": "London", "zip_code": "12345"
+    },
+    "work_experience": {"company": "Acme", "position": "Engineer", "start_date": "2020-01", "end_date": "2023-06"},
+    "education": {"university": "State University", "graduation_year": "2019"},
+    "common_answers": {}
+}
+
+
+def record(handle, name, label="", tag="input", field_type="text"):
+    return {
+        "handle": handle, "tag": tag, "type": field_type, "name": name, "id": name, "placeholder": "",
+        "label": label, "aria_label": "", "accessible_name": label, "value": "",
+        "visible": True, "enabled": True
+    }
+
+
+def planned(records):
+    plan, _ = FillPlanner(FieldSnapshot(records), PROFILE).plan()
+    return {entry["field_name"]: entry["field"]["name"] for entry in plan.entries}
+
+
+def best_total(scores):
+    """Maximum total score by brute force, leaving rows unassigned where that scores more."""
+    rows, cols = scores.shape
+    best = 0.0
+    for size in range(min(rows, cols) + 1):
+        for chosen_rows in itertools.combinations(range(rows), size):
+            for chosen_cols in itertools.permutations(range(cols), size):
+                pairs = list(zip(chosen_rows, chosen_cols))
+                if all(scores[pair] > 0 for pair in pairs):
+                    best = max(best, sum(scores[pair] for pair in pairs))
+    return best
+
+
+def test_assignment_maximizes_total_score():
+    pairs = linear_assignment(np.array([[3.0, 1.0], [1.0, 0.0]]))
+    assert pairs == [(0, 0)]
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_assignment_matches_brute_force(seed):
+    rng = np.random.default_rng(seed)
+    rows, cols = rng.integers(1, 5), rng.integers(1, 5)
+    scores = rng.random((rows, cols)) * (rng.random((rows, cols)) > 0.4) * 3
+    pairs = linear_assignment(scores)
+    assert len({row for row, _ in pairs}) == len({col for _, col in pairs}) == len(pairs)
+    assert sum(scores[pair] for pair in pairs) == pytest.approx(best_total(scores))
+
+
+def test_loose_selector_hits_are_not_filled():
+    assert planned([
+        record(1, "availability_start", "Earliest start date"),
+        record(2, "gender", "Gender"),
+        record(3, "year_of_birth", "Year of birth"),
+        record(4, "last_employer", "Last employer"),
+    ]) == {}
+
+
+def test_intended_controls_win_over_colliding_ones():
+    assert planned([
+        record(1, "last_employer", "Last employer"),
+        record(2, "lastname"),
+        record(3, "availability_start", "Earliest start date"),
+        record(4, "start_date", "Start date"),
+        record(5, "end_date", "End date"),
+        record(6, "year_of_birth", "Year of birth"),
+        record(7, "graduation_date", "Graduation date"),
+        record(8, "contact", "Contact", field_type="email"),
+    ]) == {
+        "last_name": "lastname",
+        "email": "contact",
+        "start_date": "start_date",
+        "end_date": "end_date",
+        "graduation_year": "graduation_date",
+    }
+
+
+def test_common_variants_are_assigned():
+    assert planned([
+        record(1, "job_application[first_name]", "First Name"),
+        record(2, "mobile_phone", "Mobile phone", field_type="tel"),
+        record(3, "address_line_1", "Address line 1"),
+        record(4, "address_line_2", "Address line 2"),
+        record(5, "zipcode"),
+        record(6, "company_name", "Company"),
+        record(7, "job_title", "Job title"),
+        record(8, "school_name", "School"),
+    ]) == {
+        "first_name": "job_application[first_name]",
+        "phone": "mobile_phone",
+        "address": "address_line_1",
+        "zip_code": "zipcode",
+        "company": "company_name",
+        "position": "job_title",
+        "university": "school_name",
+    }
+
+
+def test_email_address_labels_are_assigned_to_email():
+    assert planned([record(1, "email", "Email Address")]) == {"email": "email"}
+    assert planned([
+        record(1, "email_address", "Email address"),
+        record(2, "street_address", "Street address"),
+    ]) == {"email": "email_address", "address": "street_address"}
+    assert planned([record(1, "candidate[email]", "Email address")]) == {"email": "candidate[email]"}
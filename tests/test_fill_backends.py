@@ -0,0 +1,56 @@
+"""Tests for the interchangeable fill backends."""
+
+from pathlib import Path
+
+import pytest
+
+import config
+from driver_resolver import find_chrome_executable
+from fill_backends import BACKENDS, create_backend
+
+FIXTURE_FORM = Path(__file__).parent / "fixtures" / "application_form.html"
+
+
+@pytest.mark.parametrize("name", sorted(BACKENDS))
+def test_backends_share_constructor(name):
+    backend = create_backend(name, concurrency=3, headless=True, keep_pages_open=True)
+    assert backend.name == name
+    assert (backend.concurrency, backend.headless, backend.keep_pages_open) == (3, True, True)
+
+
+def filled_fields(result):
+    assert result["status"] == "ok", result.get("error")
+    statuses = result["report"]["fields"]
+    return {
+        field_name for field_name, status in statuses.items()
+        if status in ("filled", "filled_fallback", "refilled")
+    }
+
+
+def test_backends_fill_static_form_alike(monkeypatch):
+    pytest.importorskip("selenium")
+    pytest.importorskip("websockets")
+    if not find_chrome_executable(config.BROWSER_SETTINGS.get("chrome_binary")):
+        pytest.skip("Chrome is not installed")
+
+    monkeypatch.setattr(config, "PERSONAL_INFO", dict(
+        config.PERSONAL_INFO, first_name="Ada", last_name="Lovelace", email="ada@example.com",
+        phone="555 0100", city="London"
+    ))
+    monkeypatch.setattr(config, "WORK_EXPERIENCE", [{"company": "Acme", "position": "Engineer"}])
+    for section in ("selector_cache", "checkpoints", "wizard"):
+        monkeypatch.setitem(config.BROWSER_SETTINGS, section, {"enabled": False})
+
+    url = FIXTURE_FORM.resolve().as_uri()
+    results = {}
+    for name in BACKENDS:
+        backend = create_backend(name, concurrency=1, headless=True)
+        try:
+            results[name] = backend.fill_urls([url])[0]
+        finally:
+            backend.close()
+
+    selenium, cdp = filled_fields(results["selenium"]), filled_fields(results["cdp"])
+    assert selenium == cdp
+    assert {"first_name", "last_name", "email", "phone", "city", "company"} <= selenium
+    assert results["selenium"]["fields_filled"] == results["cdp"]["fields_filled"]
@@ -0,0 +1,40 @@
+"""Tests for delta filling of selector-addressed plans."""
+
+from batch_filler import FillPlan
+from fill_planner import filter_delta, kept_fields, report_delta
+
+SETTINGS = {"enabled": True, "overwrite_conflicts": False}
+
+
+def adapter_plan():
+    plan = FillPlan()
+    plan.add_selector("input#first_name", "Ada", "first_name", "text")
+    plan.add_selector("input#email", "ada@example.com", "email", "text")
+    plan.add_selector("input#phone", "555 0100", "phone", "text")
+    plan.add_selector("select#country", "United Kingdom", "country", "select")
+    return plan
+
+
+def test_adapter_plan_keeps_prefilled_values():
+    current = [
+        {"value": "Ada"},
+        {"value": "old@example.com"},
+        {"value": ""},
+        {"value": "", "text": "Select..."},
+    ]
+    plan, delta = filter_delta(adapter_plan(), current, SETTINGS)
+    assert [entry["field_name"] for entry in plan.entries] == ["phone", "country"]
+    assert delta == {"skipped": ["first_name"], "changed": ["phone", "country"], "conflicting": ["email"]}
+    assert kept_fields(delta, SETTINGS) == {"first_name", "email"}
+
+    report = {}
+    report_delta(report, delta, SETTINGS)
+    assert report["fields"] == {"first_name": "unchanged", "email": "conflict_kept"}
+
+
+def test_conflicts_are_overwritten_when_configured():
+    current = [{"value": "Ada"}, {"value": "old@example.com"}, None, None]
+    settings = dict(SETTINGS, overwrite_conflicts=True)
+    plan, delta = filter_delta(adapter_plan(), current, settings)
+    assert [entry["field_name"] for entry in plan.entries] == ["email", "phone", "country"]
+    assert kept_fields(delta, settings) == {"first_name"}
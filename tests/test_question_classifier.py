@@ -0,0 +1,30 @@
+"""Tests for question classification."""
+
+import pytest
+
+from question_classifier import QUESTION_CLASSIFIER
+
+
+@pytest.mark.parametrize("text, key", [
+    ("Why do you want to join?", "why_interested"),
+    ("why_join", "why_interested"),
+    ("salary_expectations", "salary_expectation"),
+    ("Earliest start date", "availability"),
+    ("What is your notice period?", "notice_period"),
+    ("noticePeriod", "notice_period"),
+    ("Will you require visa sponsorship?", "work_authorization"),
+    ("Are you willing to relocate?", "relocation"),
+])
+def test_classifies_questions(text, key):
+    assert QUESTION_CLASSIFIER.classify_text(text) == key
+
+
+@pytest.mark.parametrize("text", [
+    "Describe your role at the startup",
+    "Tell us about a project you started",
+    "Anything else we should notice?",
+    "Describe your interests outside work",
+    "Start date",
+])
+def test_ignores_keywords_inside_other_words_and_prose(text):
+    assert QUESTION_CLASSIFIER.classify_text(text) is None
@@ -0,0 +1,165 @@
+"""
+Multi-step application support for the Job Application Auto-Fill Bot.
+Finds the "Next"/"Continue" control of paginated application wizards (such as
+Workday) so the filler can move from step to step. Submit controls are never
+selected, and the wizard stops at the final review step.
+"""
+
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WIZARD_SETTINGS = {
+    "enabled": False,  # Continue through multi-step applications
+    "max_steps": 10  # Stop after this many steps
+}
+
+# Inspects the current step in one round trip: finds the control that advances
+# the wizard (registered as window.__autofill.nextControl), whether a submit
+# control is showing, whether this looks like the review step, and a signature
+# that changes when the step changes.
+STEP_PROBE_SCRIPT = """
+var state = window.__autofill = window.__autofill || {registry: []};
+// Anchored, so sign-in buttons such as "Continue with Google" are not taken for Next
+var NEXT = /^\\W*(save (and|&) )?(next|continue|proceed)\\b(?!\\s+(with|using|via|as)\\b)/;
+var SUBMIT = /\\b(submit|apply|send|finish|complete|confirm|sign)\\b/;
+
+function isVisible(el) {
+    if (!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)) {
+        return false;
+    }
+    var style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none';
+}
+
+function describe(el) {
+    return [
+        el.innerText || el.textContent || '',
+        el.value || '',
+        el.getAttribute('aria-label') || ''
+    ].join(' ').replace(/\\s+/g, ' ').trim().toLowerCase();
+}
+
+var candidates = document.querySelectorAll(
+    "button, input[type='submit'], input[type='button'], a[role='button'], [role='button']"
+);
+var next = null;
+var nextText = '';
+var submitVisible = false;
+for (var i = 0; i < candidates.length; i++) {
+    var el = candidates[i];
+    if (!isVisible(el) || el.disabled || el.getAttribute('aria-disabled') === 'true') {
+        continue;
+    }
+    var text = describe(el);
+    var automationId = (el.getAttribute('data-automation-id') || '').toLowerCase();
+    if (SUBMIT.test(text)) {
+        // Never advance through anything that could submit the application
+        submitVisible = true;
+        continue;
+    }
+    if (!next && (NEXT.test(text) || (!text && automationId.indexOf('next') >= 0))) {
+        next = el;
+        nextText = text;
+    }
+}
+state.nextControl = next;
+
+var headings = document.querySelectorAll("h1, h2, h3, [role='heading']");
+var review = false;
+for (var j = 0; j < headings.length; j++) {
+    if (isVisible(headings[j]) && /\\breview\\b/i.test(headings[j].textContent || '')) {
+        review = true;
+        break;
+    }
+}
+
+var controls = document.querySelectorAll('input, select, textarea');
+var names = [];
+for (var k = 0; k < controls.length && names.length < 20; k++) {
+    names.push(controls[k].name || controls[k].id || controls[k].tagName);
+}
+
+return {
+    next: nextText || (next ? 'next' : null),
+    submit_visible: submitVisible,
+    review: review,
+    signature: location.href + '|' + controls.length + '|' + names.join(',')
+};
+"""
+
+CLICK_NEXT_SCRIPT = """
+var el = window.__autofill ? window.__autofill.nextControl : null;
+if (!el || !el.isConnected) {
+    return false;
+}
+el.scrollIntoView({block: 'center'});
+el.click();
+return true;
+"""
+
+
+class StepNavigator:
+    """Moves a multi-step application to its next step."""
+
+    def __init__(self, driver, readiness):
+        """
+        Args:
+            driver (WebDriver): Driver showing the application
+            readiness (PageReadinessDetector): Used to wait for each step to settle
+        """
+        self.driver = driver
+        self.readiness = readiness
+
+    def probe(self):
+        """
+        Inspect the current step.
+
+        Returns:
+            dict: next (label of the advance control, or None), submit_visible,
+            review and signature
+        """
+        return self.driver.execute_script(STEP_PROBE_SCRIPT)
+
+    def final_step_reason(self, step):
+        """
+        Decide whether a probed step is the last one to fill.
+
+        Returns:
+            str or None: Why the wizard should stop here, or None to continue
+        """
+        if step["review"]:
+            return "review step"
+        if not step["next"]:
+            return "submit step" if step["submit_visible"] else "no next control"
+        return None
+
+    def advance(self, step):
+        """
+        Click the step's next control and wait until the following step has settled.
+
+        Args:
+            step (dict): Probe of the current step
+
+        Returns:
+            dict: advanced (bool) and waited (seconds)
+        """
+        start = time.perf_counter()
+        if not self.driver.execute_script(CLICK_NEXT_SCRIPT):
+            return {"advanced": False, "waited": 0.0}
+
+        deadline = self.readiness.settings["deadline"]
+        advanced = False
+        while True:
+            remaining = deadline - (time.perf_counter() - start)
+            self.readiness.wait(max(0.0, remaining))
+            try:
+                advanced = self.probe()["signature"] != step["signature"]
+            except Exception as e:
+                logger.debug(f"Step probe failed: {e}")
+            if advanced or time.perf_counter() - start >= deadline:
+                break
+            time.sleep(self.readiness.settings["poll_interval"])
+
+        return {"advanced": advanced, "waited": time.perf_counter() - start}